@@ -0,0 +1,83 @@
+from django.conf import settings
+from django.urls import reverse
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema_field
+from rest_framework import serializers
+
+from apps.applications.models import Application
+from apps.jobs.models import Job
+
+
+def resume_url(application, request=None):
+    """
+    Where the resume is downloaded from; resumes have no public URL.
+    """
+    if not application.resume:
+        return None
+    url = reverse("application-resume", args=[application.id])
+    return request.build_absolute_uri(url) if request is not None else url
+
+
+class ApplicationSerializer(serializers.ModelSerializer):
+    resume = serializers.SerializerMethodField()
+    job_title = serializers.ReadOnlyField(source="job.title")
+    company_name = serializers.ReadOnlyField(source="job.company.name")
+
+    class Meta:
+        model = Application
+        fields = [
+            "id",
+            "job",
+            "job_title",
+            "company_name",
+            "cover_letter",
+            "resume",
+            "status",
+            "created_at",
+            "updated_at",
+        ]
+
+    @extend_schema_field(OpenApiTypes.URI)
+    def get_resume(self, application):
+        return resume_url(application, self.context.get("request"))
+
+
+class ApplicantSerializer(serializers.ModelSerializer):
+    resume = serializers.SerializerMethodField()
+    candidate_email = serializers.ReadOnlyField(source="candidate.email")
+    candidate_full_name = serializers.ReadOnlyField(source="candidate.get_full_name")
+
+    class Meta:
+        model = Application
+        fields = [
+            "id",
+            "candidate_email",
+            "candidate_full_name",
+            "cover_letter",
+            "resume",
+            "status",
+            "created_at",
+        ]
+
+    @extend_schema_field(OpenApiTypes.URI)
+    def get_resume(self, application):
+        return resume_url(application, self.context.get("request"))
+
+
+class SubmitApplicationSerializer(serializers.Serializer):
+    # The company is shown in the response
+    job = serializers.PrimaryKeyRelatedField(queryset=Job.objects.select_related("company"))
+    cover_letter = serializers.CharField(required=False, allow_blank=True, default="")
+    resume = serializers.FileField(required=False, allow_null=True, default=None)
+
+    def validate(self, attrs):
+        # Set by ResumeUploadHandler when a file crossed the size limit
+        if "resume" in getattr(self.context["request"], "rejected_uploads", []):
+            limit_mb = settings.RESUME_MAX_UPLOAD_SIZE / (1024 * 1024)
+            raise serializers.ValidationError({"resume": f"Resumes are limited to {limit_mb:g} MB."})
+
+        resume = attrs.get("resume")
+        if resume is not None:
+            # Model field validators (allowed extensions) don't run on save
+            Application._meta.get_field("resume").run_validators(resume)
+        return attrs
@@ -0,0 +1,16 @@
+from django.urls import path
+from .views import (
+    JobApplicationsView,
+    MyApplicationsView,
+    ResumeDownloadView,
+    SubmitApplicationView,
+    WithdrawApplicationView,
+)
+
+urlpatterns = [
+    path("", SubmitApplicationView.as_view()),
+    path("mine/", MyApplicationsView.as_view()),
+    path("<int:application_id>/withdraw/", WithdrawApplicationView.as_view()),
+    path("<int:application_id>/resume/", ResumeDownloadView.as_view(), name="application-resume"),
+    path("jobs/<int:job_id>/", JobApplicationsView.as_view()),
+]
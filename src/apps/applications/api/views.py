@@ -0,0 +1,134 @@
+import os
+
+from django.core.exceptions import ValidationError
+from django.http import FileResponse, Http404
+from django.shortcuts import get_object_or_404
+from rest_framework import status
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.exceptions import ValidationError as DRFValidationError
+from rest_framework.generics import GenericAPIView, ListAPIView
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema, OpenApiParameter
+
+from apps.applications.models import Application
+from apps.applications.selectors.application_selector import (
+    list_candidate_applications,
+    list_job_applications,
+)
+from apps.applications.services.application_service import (
+    submit_application,
+    withdraw_application,
+)
+from apps.applications.uploads import ResumeUploadHandler
+from apps.common.pagination import KeysetPagination
+from apps.companies.selectors.roles import get_company_role
+from apps.jobs.models import Job
+
+from .serializers import ApplicantSerializer, ApplicationSerializer, SubmitApplicationSerializer
+
+
+class SubmitApplicationView(GenericAPIView):
+    """
+    Apply to a job: multipart with an optional `resume` file, or JSON.
+    """
+    serializer_class = SubmitApplicationSerializer
+
+    def post(self, request):
+        # Must be set before request.data is first read
+        request.upload_handlers = [ResumeUploadHandler(request)]
+
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            application = submit_application(
+                job=serializer.validated_data["job"],
+                candidate=request.user,
+                cover_letter=serializer.validated_data["cover_letter"],
+                resume=serializer.validated_data["resume"],
+            )
+        except ValidationError as e:
+            return Response({"detail": e.messages}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(
+            ApplicationSerializer(application, context=self.get_serializer_context()).data,
+            status=status.HTTP_201_CREATED,
+        )
+
+
+class MyApplicationsView(ListAPIView):
+    serializer_class = ApplicationSerializer
+    pagination_class = KeysetPagination
+
+    def get_queryset(self):
+        return list_candidate_applications(user=self.request.user)
+
+
+class WithdrawApplicationView(GenericAPIView):
+    serializer_class = ApplicationSerializer
+
+    def post(self, request, application_id):
+        application = get_object_or_404(
+            Application.objects.select_related("job__company"), id=application_id
+        )
+        try:
+            withdraw_application(application=application, withdrawn_by=request.user)
+        except ValidationError as e:
+            return Response({"detail": e.messages}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(self.get_serializer(application).data)
+
+
+class ResumeDownloadView(APIView):
+    """
+    An application's resume, for its candidate and members of the job's
+    company. Stored outside MEDIA_ROOT, so this is the only way to it.
+    """
+
+    @extend_schema(responses={200: OpenApiTypes.BINARY})
+    def get(self, request, application_id):
+        application = get_object_or_404(
+            Application.objects.select_related("job").only("id", "candidate_id", "resume", "job__company_id"),
+            id=application_id,
+        )
+        if (
+            application.candidate_id != request.user.pk
+            and get_company_role(user=request.user, company_id=application.job.company_id) is None
+        ):
+            raise PermissionDenied("You cannot view this resume.")
+        if not application.resume:
+            raise Http404("This application has no resume.")
+
+        extension = os.path.splitext(application.resume.name)[1]
+        return FileResponse(
+            application.resume.open("rb"), as_attachment=True, filename=f"resume-{application.id}{extension}"
+        )
+
+
+class JobApplicationsView(ListAPIView):
+    """
+    Applicants of a job, for members of the job's company.
+    Optional filter: ?status=<status>
+    """
+    serializer_class = ApplicantSerializer
+    pagination_class = KeysetPagination
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(name="status", description="Filter: Application status", type=str),
+        ]
+    )
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
+    def get_queryset(self):
+        job = get_object_or_404(Job.objects.only("id", "company_id"), id=self.kwargs["job_id"])
+        if get_company_role(user=self.request.user, company_id=job.company_id) is None:
+            raise PermissionDenied("You are not a member of this job's company.")
+
+        status_value = self.request.query_params.get("status")
+        if status_value and status_value not in Application.Status.values:
+            raise DRFValidationError({"status": f"Must be one of: {', '.join(Application.Status.values)}."})
+
+        return list_job_applications(job=job, status=status_value)
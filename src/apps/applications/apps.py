@@ -3,3 +3,6 @@ from django.apps import AppConfig
 class ApplicationsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.applications"
+
+    def ready(self):
+        from . import signals  # noqa: F401
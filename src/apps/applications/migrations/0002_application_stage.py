@@ -0,0 +1,27 @@
+# Generated by Django 6.0.1 on 2026-10-18 10:00
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0001_initial'),
+        ('jobs', '0004_job_applications_count'),
+        ('pipelines', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='application',
+            name='stage',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.RESTRICT, related_name='applications', to='pipelines.stage'),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['stage', '-created_at', '-id'], name='application_stage_created_idx'),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 6.0.1 on 2026-10-18 10:00
+
+import apps.applications.models.application
+import apps.applications.storage
+import django.core.validators
+from django.core.files.storage import default_storage
+from django.db import migrations, models
+
+from apps.applications.models.application import resume_upload_to
+from apps.applications.storage import ResumeStorage
+
+
+def move_resumes_to_private_storage(apps, schema_editor):
+    """
+    Resumes uploaded so far sit under MEDIA_ROOT with their original
+    names; move them to the private storage under random names.
+    """
+    Application = apps.get_model("applications", "Application")
+    storage = ResumeStorage()
+
+    for pk, name in Application.objects.exclude(resume="").values_list("id", "resume").iterator():
+        if not default_storage.exists(name):
+            continue
+        with default_storage.open(name, "rb") as f:
+            new_name = storage.save(resume_upload_to(None, name), f)
+        Application.objects.filter(pk=pk).update(resume=new_name)
+        default_storage.delete(name)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0002_application_stage'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='application',
+            name='resume',
+            field=models.FileField(blank=True, storage=apps.applications.storage.ResumeStorage(), upload_to=apps.applications.models.application.resume_upload_to, validators=[django.core.validators.FileExtensionValidator(['pdf', 'doc', 'docx', 'odt', 'rtf', 'txt'])]),
+        ),
+        migrations.RunPython(move_resumes_to_private_storage, migrations.RunPython.noop),
+    ]
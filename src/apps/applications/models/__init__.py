@@ -0,0 +1 @@
+from .application import Application
\ No newline at end of file
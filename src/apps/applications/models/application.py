@@ -0,0 +1,99 @@
+import os
+import uuid
+
+from django.conf import settings
+from django.core.validators import FileExtensionValidator
+from django.db import models
+from django.utils import timezone
+
+from apps.applications.storage import ResumeStorage
+from apps.jobs.models import Job
+
+RESUME_EXTENSIONS = ["pdf", "doc", "docx", "odt", "rtf", "txt"]
+
+
+def resume_upload_to(instance, filename):
+    # Original filenames often carry the candidate's name; keep only the extension
+    extension = os.path.splitext(filename)[1].lower()
+    return f"resumes/{timezone.now():%Y/%m}/{uuid.uuid4().hex}{extension}"
+
+
+class Application(models.Model):
+
+    class Status(models.TextChoices):
+        ACTIVE = "active", "Active"
+        REJECTED = "rejected", "Rejected"
+        WITHDRAWN = "withdrawn", "Withdrawn"
+        HIRED = "hired", "Hired"
+
+    job = models.ForeignKey(
+        Job,
+        on_delete=models.CASCADE,
+        related_name="applications"
+    )
+
+    candidate = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="applications"
+    )
+
+    # Null only for applications to jobs without a pipeline. Indexed by
+    # application_stage_created_idx below.
+    stage = models.ForeignKey(
+        "pipelines.Stage",
+        on_delete=models.RESTRICT,
+        null=True,
+        blank=True,
+        db_index=False,
+        related_name="applications"
+    )
+
+    cover_letter = models.TextField(blank=True)
+
+    resume = models.FileField(
+        upload_to=resume_upload_to,
+        storage=ResumeStorage(),
+        blank=True,
+        validators=[FileExtensionValidator(RESUME_EXTENSIONS)],
+    )
+
+    status = models.CharField(
+        max_length=20,
+        choices=Status.choices,
+        default=Status.ACTIVE
+    )
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+        constraints = [
+            # One application per candidate and job, enforced by the insert
+            # itself instead of a racy "already applied?" query
+            models.UniqueConstraint(
+                fields=["job", "candidate"],
+                name="application_job_candidate_uniq",
+            ),
+        ]
+        indexes = [
+            # Applicants of a job, newest first (keyset pagination order)
+            models.Index(
+                fields=["job", "-created_at", "-id"],
+                name="application_job_created_idx",
+            ),
+            # Applications in a stage, newest first (pipeline columns)
+            models.Index(
+                fields=["stage", "-created_at", "-id"],
+                name="application_stage_created_idx",
+            ),
+            # A candidate's own applications, newest first
+            models.Index(
+                fields=["candidate", "-created_at", "-id"],
+                name="application_cand_created_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.candidate_id} -> {self.job_id} ({self.status})"
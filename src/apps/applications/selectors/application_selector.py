@@ -0,0 +1,18 @@
+from apps.applications.models import Application
+
+
+def list_candidate_applications(*, user):
+    """
+    The user's own applications, with the job and company for display.
+    """
+    return Application.objects.select_related("job__company").filter(candidate=user)
+
+
+def list_job_applications(*, job, status=None):
+    """
+    Applicants of one job, optionally filtered by status.
+    """
+    queryset = Application.objects.select_related("candidate").filter(job=job)
+    if status:
+        queryset = queryset.filter(status=status)
+    return queryset
@@ -0,0 +1,80 @@
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from django.db.models import F
+
+from apps.applications.models import Application
+from apps.jobs.models import Job
+from apps.pipelines.models import Stage
+from apps.pipelines.services.board_service import push_card, refresh_board_columns
+from apps.pipelines.services.pipeline_service import get_entry_stage, lock_stages
+
+
+def submit_application(*, job, candidate, cover_letter="", resume=None):
+    """
+    Candidate applies to an OPEN job.
+
+    Duplicates are rejected by the (job, candidate) unique constraint, so
+    concurrent submits cannot both succeed and the happy path needs no
+    lookup. The job's and the entry stage's applications_count are bumped
+    in the same transaction with UPDATE ... SET count = count + 1, and the
+    new application's card is put on top of the entry stage's board column.
+    """
+    if job.status != Job.Status.OPEN:
+        raise ValidationError("This job is not accepting applications.")
+
+    application = Application(
+        job=job,
+        candidate=candidate,
+        cover_letter=cover_letter,
+    )
+    if resume is not None:
+        # Stored up front, so the transaction below holds no file I/O
+        application.resume.save(resume.name, resume, save=False)
+
+    try:
+        with transaction.atomic():
+            application.stage = stage = get_entry_stage(job=job)
+            application.save()
+            Job.objects.filter(pk=job.pk).update(applications_count=F("applications_count") + 1)
+            if stage is not None:
+                Stage.objects.filter(pk=stage.pk).update(
+                    applications_count=F("applications_count") + 1,
+                    cards=push_card(stage=stage, application=application, candidate=candidate),
+                )
+    except IntegrityError:
+        # The resume was stored before the insert failed
+        if application.resume:
+            application.resume.delete(save=False)
+        raise ValidationError("You have already applied to this job.")
+
+    return application
+
+
+def withdraw_application(*, application, withdrawn_by):
+    """
+    Only the candidate can withdraw, and only an active application.
+    The job's applications_count still counts it as received; its stage
+    no longer does.
+    """
+    if application.candidate_id != withdrawn_by.pk:
+        raise ValidationError("You cannot withdraw this application.")
+
+    if application.status != Application.Status.ACTIVE:
+        raise ValidationError("Only active applications can be withdrawn.")
+
+    with transaction.atomic():
+        # Stages first, in the same order as moves, then the row re-read
+        # under its lock: a bulk move may have just changed its stage
+        lock_stages(job_id=application.job_id)
+        application.status, application.stage_id = (
+            Application.objects.select_for_update().filter(pk=application.pk).values_list("status", "stage_id").get()
+        )
+        if application.status != Application.Status.ACTIVE:
+            raise ValidationError("Only active applications can be withdrawn.")
+
+        application.status = Application.Status.WITHDRAWN
+        application.save(update_fields=["status", "updated_at"])
+        if application.stage_id is not None:
+            Stage.objects.filter(pk=application.stage_id).update(applications_count=F("applications_count") - 1)
+            refresh_board_columns(stage_ids=[application.stage_id])
+    return application
@@ -0,0 +1,19 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from apps.applications.models import Application
+
+
+@receiver(post_delete, sender=Application)
+def delete_resume(sender, instance, **kwargs):
+    """
+    Removes the stored resume once the deletion commits, so a rolled
+    back delete keeps its file. Bulk deletes must load the resume
+    column (see delete_job); a deferred one would be fetched from a
+    row that is already gone.
+    """
+    if instance.resume:
+        transaction.on_commit(partial(instance.resume.storage.delete, instance.resume.name))
@@ -0,0 +1,26 @@
+import os
+
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage
+from django.utils.deconstruct import deconstructible
+
+
+@deconstructible
+class ResumeStorage(FileSystemStorage):
+    """
+    Resumes hold candidate PII, so they live under PRIVATE_MEDIA_ROOT,
+    which no web server serves, and are only downloaded through
+    ResumeDownloadView. Read from settings on every access, like
+    MEDIA_ROOT is for the default storage.
+    """
+
+    @property
+    def base_location(self):
+        return settings.PRIVATE_MEDIA_ROOT
+
+    @property
+    def location(self):
+        return os.path.abspath(self.base_location)
+
+    def url(self, name):
+        raise NotImplementedError("Resumes have no public URL, see ResumeDownloadView.")
@@ -1,3 +1,167 @@
-from django.test import TestCase
+import os
+import shutil
+import tempfile
 
-# Create your tests here.
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
+from rest_framework.test import APITestCase
+
+from apps.applications.models import Application
+from apps.companies.models import Company, Membership
+from apps.jobs.models import Job
+from apps.jobs.services.job_service import delete_job
+from apps.pipelines.services.pipeline_service import create_default_stages
+from apps.users.models import User
+from apps.users.tokens import UserRefreshToken
+
+
+def _user(email):
+    return User.objects.create_user(
+        email=email, password="pass", first_name="Test", last_name="User", dob="1990-01-01"
+    )
+
+
+@override_settings(JWT_TRUST_TOKEN_CLAIMS=True)
+class ApplicationTests(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.recruiter = _user("recruiter@example.com")
+        cls.candidate = _user("candidate@example.com")
+        cls.company = Company.objects.create(name="Acme", created_by=cls.recruiter)
+        Membership.objects.create(user=cls.recruiter, company=cls.company, role=Membership.Role.RECRUITER)
+        cls.job = Job.objects.create(
+            company=cls.company,
+            created_by=cls.recruiter,
+            title="Backend Engineer",
+            description="...",
+            status=Job.Status.OPEN,
+        )
+        cls.entry_stage = create_default_stages(job=cls.job)[0]
+
+    def setUp(self):
+        cache.clear()
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        self.private_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.private_root, ignore_errors=True)
+        self.enterContext(override_settings(MEDIA_ROOT=self.media_root, PRIVATE_MEDIA_ROOT=self.private_root))
+        self.login(self.candidate)
+
+    def login(self, user):
+        token = UserRefreshToken.for_user(user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def apply(self, **data):
+        data.setdefault("job", self.job.id)
+        return self.client.post("/api/applications/", data, format="multipart")
+
+    def test_apply_bumps_the_job_and_stage_counters(self):
+        # job + entry stage + insert + 2 counter updates (the stage's with
+        # the new card, which needs the candidate), inside a savepoint
+        with self.assertNumQueries(8):
+            response = self.apply(cover_letter="Hello")
+        self.assertEqual(response.status_code, 201)
+
+        self.job.refresh_from_db()
+        self.entry_stage.refresh_from_db()
+        self.assertEqual(self.job.applications_count, 1)
+        self.assertEqual(self.entry_stage.applications_count, 1)
+        self.assertEqual(Application.objects.get().stage, self.entry_stage)
+        self.assertEqual(self.entry_stage.cards[0]["candidate_email"], self.candidate.email)
+
+    def test_duplicate_is_rejected_by_the_constraint(self):
+        self.assertEqual(self.apply().status_code, 201)
+
+        # No "already applied?" lookup: the failed insert is the check
+        # (job + entry stage + insert, inside a savepoint that is rolled back)
+        with self.assertNumQueries(6):
+            response = self.apply()
+        self.assertEqual(response.status_code, 400)
+
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.applications_count, 1)
+        self.assertEqual(Application.objects.count(), 1)
+
+    def test_closed_job_does_not_accept_applications(self):
+        Job.objects.filter(pk=self.job.pk).update(status=Job.Status.CLOSED)
+        self.assertEqual(self.apply().status_code, 400)
+
+    def test_resume_is_stored(self):
+        resume = SimpleUploadedFile("cv.pdf", b"%PDF-1.4 " + b"x" * 200_000, content_type="application/pdf")
+
+        response = self.apply(resume=resume)
+
+        self.assertEqual(response.status_code, 201)
+        application = Application.objects.get()
+        # A random name, outside the public MEDIA_ROOT
+        self.assertRegex(application.resume.name, r"^resumes/\d{4}/\d{2}/[0-9a-f]{32}\.pdf$")
+        self.assertTrue(application.resume.path.startswith(self.private_root))
+        self.assertEqual(application.resume.size, 200_009)
+        self.assertEqual(response.data["resume"], f"http://testserver/api/applications/{application.id}/resume/")
+
+    def test_resume_is_downloaded_by_the_candidate_and_the_company_only(self):
+        self.apply(resume=SimpleUploadedFile("Jane Doe CV.pdf", b"%PDF-1.4 cv"))
+        url = f"/api/applications/{Application.objects.get().id}/resume/"
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b"".join(response.streaming_content), b"%PDF-1.4 cv")
+        self.assertNotIn("Jane", response["Content-Disposition"])
+        response.close()
+
+        self.login(self.recruiter)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        response.close()
+
+        self.login(_user("outsider@example.com"))
+        self.assertEqual(self.client.get(url).status_code, 403)
+
+    def test_resume_is_deleted_with_the_job(self):
+        self.apply(resume=SimpleUploadedFile("cv.pdf", b"%PDF-1.4 cv"))
+        path = Application.objects.get().resume.path
+
+        with self.captureOnCommitCallbacks(execute=True):
+            delete_job(job=self.job, deleted_by=self.recruiter)
+
+        self.assertFalse(os.path.exists(path))
+
+    @override_settings(RESUME_MAX_UPLOAD_SIZE=100_000)
+    def test_oversized_resume_is_rejected(self):
+        resume = SimpleUploadedFile("cv.pdf", b"x" * 200_000, content_type="application/pdf")
+
+        response = self.apply(resume=resume)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("resume", response.data)
+        self.assertFalse(Application.objects.exists())
+
+    def test_resume_extension_is_checked(self):
+        response = self.apply(resume=SimpleUploadedFile("cv.exe", b"MZ"))
+        self.assertEqual(response.status_code, 400)
+
+    def test_applicants_are_visible_to_company_members_only(self):
+        self.apply()
+
+        response = self.client.get(f"/api/applications/jobs/{self.job.id}/")
+        self.assertEqual(response.status_code, 403)
+
+        self.login(self.recruiter)
+        response = self.client.get(f"/api/applications/jobs/{self.job.id}/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([a["candidate_email"] for a in response.data["results"]], [self.candidate.email])
+
+    def test_withdraw(self):
+        self.apply()
+        application = Application.objects.get()
+
+        response = self.client.post(f"/api/applications/{application.id}/withdraw/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["status"], Application.Status.WITHDRAWN)
+        self.entry_stage.refresh_from_db()
+        self.assertEqual(self.entry_stage.applications_count, 0)
+
+        response = self.client.post(f"/api/applications/{application.id}/withdraw/")
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,27 @@
+from django.conf import settings
+from django.core.files.uploadhandler import SkipFile, TemporaryFileUploadHandler
+
+
+class ResumeUploadHandler(TemporaryFileUploadHandler):
+    """
+    Streams uploaded files to a temporary file on disk chunk by chunk
+    (64 KiB), whatever their size; Django's default handlers keep uploads
+    under 2.5 MB in memory. Saving the model then moves the file into
+    storage (a rename on local disk, a chunked upload on object storage),
+    so a resume is never held in memory as a whole.
+
+    Files larger than RESUME_MAX_UPLOAD_SIZE are dropped as soon as they
+    cross the limit and flagged on the request as `rejected_uploads`.
+    """
+
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        self.received = 0
+
+    def receive_data_chunk(self, raw_data, start):
+        self.received += len(raw_data)
+        if self.received > settings.RESUME_MAX_UPLOAD_SIZE:
+            rejected = getattr(self.request, "rejected_uploads", [])
+            self.request.rejected_uploads = rejected + [self.field_name]
+            raise SkipFile
+        return super().receive_data_chunk(raw_data, start)
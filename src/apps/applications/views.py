@@ -1,3 +0,0 @@
-from django.shortcuts import render
-
-# Create your views here.
@@ -0,0 +1,592 @@
+"""
+Query-count and latency harness for every API route.
+
+`seed()` builds a realistic tenant, `run()` replays each scenario through
+the test client and records queries + p50/p95 latency, and
+`find_violations()` compares the numbers with the checked-in budget file.
+Used by the `bench_api` command and by the query budget test.
+"""
+import itertools
+import json
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.applications.models import Application
+from apps.common.benchmarks import percentile
+from apps.companies.cache import get_membership_version
+from apps.companies.models import Company, Invite, Membership
+from apps.companies.selectors.roles import invalidate_user_roles
+from apps.companies.services.company_service import create_company
+from apps.interviews.models import BusyBlock, Interview
+from apps.jobs.models import Job
+from apps.offers.models import Offer, OfferBatch
+from apps.otp.services import release_otp_delivery
+from apps.pipelines.models import Stage
+from apps.pipelines.services.board_service import refresh_board_columns
+from apps.pipelines.services.pipeline_service import create_default_stages
+from apps.otp.utils import generate_otp, generate_secret
+from apps.users.tokens import UserRefreshToken
+
+User = get_user_model()
+
+BUDGET_FILE = Path(__file__).resolve().parent / "api_budgets.json"
+
+PASSWORD = "Bench-Passw0rd!"
+
+
+class Context:
+    """
+    Seeded objects shared by the scenarios.
+    """
+
+    def __init__(self):
+        self._counter = itertools.count()
+        self._tokens = {}
+
+    def token(self, name):
+        """
+        Access token for a seeded user, re-issued (as a client would
+        refresh it) once a membership change has revoked the old one.
+        """
+        user = getattr(self, name)
+        version = get_membership_version(user_id=user.pk)
+        issued = self._tokens.get(name)
+        if issued is None or issued[0] != version:
+            invalidate_user_roles(user=user)
+            issued = (version, str(UserRefreshToken.for_user(user).access_token))
+            self._tokens[name] = issued
+        return issued[1]
+
+    def unique(self, prefix):
+        return f"{prefix}-{next(self._counter)}"
+
+    def new_company(self):
+        return create_company(name=self.unique("Bench Co"), description="", created_by=self.admin)
+
+    def new_job(self, **fields):
+        fields.setdefault("status", Job.Status.OPEN)
+        job = Job.objects.create(
+            company=self.company,
+            created_by=self.recruiter,
+            title=self.unique("Job"),
+            description="Lorem ipsum dolor sit amet. " * 20,
+            **fields,
+        )
+        create_default_stages(job=job)
+        return job
+
+    def new_stage(self):
+        """
+        An empty stage appended to a fresh job's pipeline.
+        """
+        job = self.new_job()
+        return Stage.objects.create(job=job, name="Extra", rank=job.stages.order_by("-rank").first().rank + 1024)
+
+    def fill_pipeline(self, job, candidates):
+        """
+        Applications from `candidates`, spread over the job's open stages,
+        with the job and stage counters set as the services would.
+        """
+        stages = [stage for stage in job.stages.order_by("rank") if not stage.outcome]
+        applications = Application.objects.bulk_create([
+            Application(job=job, candidate=candidate, stage=stages[i % len(stages)], cover_letter="Hello. " * 50)
+            for i, candidate in enumerate(candidates)
+        ])
+        for i, stage in enumerate(stages):
+            stage.applications_count = len(applications[i::len(stages)])
+        Stage.objects.bulk_update(stages, ["applications_count"])
+        Job.objects.filter(pk=job.pk).update(applications_count=len(applications))
+        refresh_board_columns(stage_ids=[stage.id for stage in stages])
+        return job
+
+    def new_application(self, *, resume=False):
+        application = Application(job=self.new_job(), candidate=self.candidate)
+        if resume:
+            application.resume.save("cv.pdf", ContentFile(b"%PDF-1.4 " + b"x" * 100_000), save=False)
+        application.save()
+        return application
+
+    def new_slot(self):
+        """
+        An hour nobody is busy in: a year ahead, one hour further each call.
+        """
+        starts_at = self.calendar_start + timedelta(days=365, hours=next(self._counter))
+        return starts_at, starts_at + timedelta(hours=1)
+
+    def new_interview(self):
+        starts_at, ends_at = self.new_slot()
+        interview = Interview.objects.create(
+            application=self.new_application(), scheduled_by=self.recruiter, starts_at=starts_at, ends_at=ends_at
+        )
+        BusyBlock.objects.bulk_create([
+            BusyBlock(user=user, interview=interview, starts_at=starts_at, ends_at=ends_at)
+            for user in [self.recruiter, *self.panel[:2]]
+        ])
+        return interview
+
+    def new_offer(self, status=Offer.Status.PENDING_APPROVAL):
+        """
+        A rendered offer by the recruiter on a new application of the candidate.
+        """
+        return Offer.objects.create(
+            application=self.new_application(),
+            created_by=self.recruiter,
+            salary=85000,
+            start_date=date(2030, 1, 1),
+            status=status,
+            letter="<p>Offer</p>" * 200,
+            letter_rendered_at=timezone.now(),
+        )
+
+    def new_offer_batch(self, status=OfferBatch.Status.DONE):
+        """
+        A batch of offers to a cohort of the seeded applicants, finished
+        unless told otherwise.
+        """
+        job = self.fill_pipeline(self.new_job(), self.applicants)
+        batch = OfferBatch.objects.create(
+            job=job, created_by=self.recruiter, total=len(self.applicants), rendered=len(self.applicants),
+            status=status,
+        )
+        Offer.objects.bulk_create([
+            Offer(
+                application=application, batch=batch, created_by=self.recruiter, salary=85000,
+                start_date=date(2030, 1, 1), letter="<p>Offer</p>", letter_rendered_at=timezone.now(),
+            )
+            for application in job.applications.all()
+        ])
+        return batch
+
+    def new_busy_block(self):
+        starts_at, ends_at = self.new_slot()
+        return BusyBlock.objects.create(user=self.recruiter, starts_at=starts_at, ends_at=ends_at)
+
+    def new_member(self):
+        user = User.objects.create(
+            email=f"{self.unique('member')}@bench.example.com",
+            first_name="Bench",
+            last_name="Member",
+        )
+        return Membership.objects.create(user=user, company=self.company, role=Membership.Role.RECRUITER)
+
+    def invite_for_candidate(self):
+        """
+        A pending invite the candidate can accept or reject.
+        """
+        return Invite.objects.create(
+            email=self.candidate.email,
+            company=self.new_company(),
+            role=Membership.Role.RECRUITER,
+            invited_by=self.admin,
+        )
+
+    def reset_otp_state(self, user, *, verified):
+        """
+        OTP flows clear the secret / flip is_verified and coalesce sends;
+        restore all three so the scenario can run again.
+        """
+        user.otp_secret = generate_secret()
+        user.is_verified = verified
+        user.save(update_fields=["otp_secret", "is_verified"])
+        release_otp_delivery(user_id=user.pk)
+        return user
+
+    def otp_for(self, user, *, verified):
+        return generate_otp(self.reset_otp_state(user, verified=verified).otp_secret)
+
+
+def _create_user(email, **extra):
+    return User.objects.create_user(
+        email=email,
+        password=PASSWORD,
+        first_name="Bench",
+        last_name="User",
+        dob="1990-01-01",
+        **extra,
+    )
+
+
+def seed(*, companies=5, members_per_company=20, jobs_per_company=2000, invites_per_company=500, applicants=500):
+    """
+    Creates a tenant with several companies, their members, thousands of
+    jobs and invites, one popular job with many applicants, and an
+    interview panel with a busy month ahead. Returns the Context handed
+    to the scenarios.
+    """
+    ctx = Context()
+    ctx.admin = _create_user("admin@bench.example.com", is_verified=True)
+    ctx.recruiter = _create_user("recruiter@bench.example.com", is_verified=True)
+    ctx.candidate = _create_user("candidate@bench.example.com", is_verified=True)
+    ctx.unverified = _create_user("unverified@bench.example.com")
+
+    members = User.objects.bulk_create([
+        User(email=f"seed-{i}@bench.example.com", first_name="Seed", last_name=str(i))
+        for i in range(members_per_company)
+    ])
+
+    statuses = itertools.cycle([Job.Status.OPEN, Job.Status.OPEN, Job.Status.CLOSED, Job.Status.DRAFT])
+    for c in range(companies):
+        company = Company.objects.create(name=f"Bench Seed Co {c}", created_by=ctx.admin)
+        Membership.objects.bulk_create(
+            [
+                Membership(user=ctx.admin, company=company, role=Membership.Role.ADMIN),
+                Membership(user=ctx.recruiter, company=company, role=Membership.Role.RECRUITER),
+            ]
+            + [
+                Membership(user=member, company=company, role=Membership.Role.HIRING_MANAGER)
+                for member in members
+            ]
+        )
+        Job.objects.bulk_create([
+            Job(
+                company=company,
+                created_by=ctx.recruiter,
+                title=f"Seed Job {j}",
+                description="Lorem ipsum dolor sit amet. " * 20,
+                status=next(statuses),
+            )
+            for j in range(jobs_per_company)
+        ])
+        Invite.objects.bulk_create([
+            Invite(
+                email=f"invitee-{i}@bench.example.com",
+                company=company,
+                role=Membership.Role.RECRUITER,
+                invited_by=ctx.admin,
+            )
+            for i in range(invites_per_company)
+        ])
+        if c == 0:
+            ctx.company = company
+
+    ctx.applicants = User.objects.bulk_create([
+        User(email=f"applicant-{i}@bench.example.com", first_name="Appli", last_name=str(i))
+        for i in range(applicants)
+    ])
+    ctx.job = ctx.fill_pipeline(ctx.new_job(), ctx.applicants)
+    Application.objects.bulk_create([
+        Application(job=job, candidate=ctx.candidate) for job in Job.objects.filter(status=Job.Status.OPEN)[:50]
+    ])
+
+    # A 10-person panel (the seeded hiring managers) with three meetings
+    # a day over the next four weeks
+    ctx.panel = members[:10]
+    today = timezone.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    ctx.calendar_start = today + timedelta(days=7 - today.weekday())
+    BusyBlock.objects.bulk_create([
+        BusyBlock(
+            user=user,
+            starts_at=ctx.calendar_start + timedelta(days=day, hours=9 + (i * 3 + meeting * 2) % 8),
+            ends_at=ctx.calendar_start + timedelta(days=day, hours=10 + (i * 3 + meeting * 2) % 8),
+        )
+        for i, user in enumerate(ctx.panel)
+        for day in range(28)
+        if day % 7 < 5
+        for meeting in range(3)
+    ])
+
+    # Offers awaiting approval on the popular job
+    Offer.objects.bulk_create([
+        Offer(
+            application=application, created_by=ctx.recruiter, salary=85000, start_date=date(2030, 1, 1),
+            letter="<p>Offer</p>", letter_rendered_at=timezone.now(),
+        )
+        for application in ctx.job.applications.all()[:10]
+    ])
+    return ctx
+
+
+def _offer_cohort(ctx):
+    # Offers to every applicant of a job with a full pipeline
+    job = ctx.fill_pipeline(ctx.new_job(), ctx.applicants)
+    return "post", f"/api/offers/jobs/{job.id}/batches/", {
+        "application_ids": list(job.applications.values_list("id", flat=True)),
+        "salary": "85000.00",
+        "start_date": "2030-01-01",
+    }
+
+
+def _availability(ctx):
+    # Common free hours of the 10-person panel over four weeks
+    return "get", "/api/interviews/availability/", {
+        "company": ctx.company.id,
+        "interviewers": [user.id for user in ctx.panel],
+        "start": ctx.calendar_start.isoformat(),
+        "end": (ctx.calendar_start + timedelta(weeks=4)).isoformat(),
+        "duration": 60,
+    }
+
+
+def _schedule_interview(ctx):
+    starts_at, ends_at = ctx.new_slot()
+    return "post", "/api/interviews/", {
+        "application": ctx.new_application().id,
+        "interviewers": [ctx.recruiter.id] + [user.id for user in ctx.panel[:2]],
+        "starts_at": starts_at.isoformat(),
+        "ends_at": ends_at.isoformat(),
+    }
+
+
+def _add_busy_block(ctx):
+    starts_at, ends_at = ctx.new_slot()
+    return "post", "/api/interviews/busy/", {"starts_at": starts_at.isoformat(), "ends_at": ends_at.isoformat()}
+
+
+def _reorder_stage(ctx):
+    # Last stage moved right after the first: between two neighbours
+    stage = ctx.new_stage()
+    first = stage.job.stages.order_by("rank").first()
+    return "post", f"/api/pipelines/stages/{stage.id}/reorder/", {"after": first.id}
+
+
+def _reject_all(ctx):
+    # "Reject all remaining" on a job with a full pipeline
+    job = ctx.fill_pipeline(ctx.new_job(), ctx.applicants)
+    rejected = job.stages.get(outcome=Stage.Outcome.REJECTED)
+    return "post", f"/api/pipelines/jobs/{job.id}/move/", {"to_stage": rejected.id, "all": True}
+
+
+# Each scenario: (name, actor, build) where build(ctx) runs before the
+# timed request (its queries are not counted) and returns
+# (method, path, data).
+SCENARIOS = [
+    # ---------------- users ----------------
+    ("users:register", None, lambda ctx: ("post", "/api/users/register/", {
+        "email": f"{ctx.unique('new')}@bench.example.com",
+        "password": PASSWORD,
+        "first_name": "New",
+        "last_name": "User",
+        "dob": "1995-05-05",
+    })),
+    ("users:verify-email", None, lambda ctx: ("post", "/api/users/verify-email/", {
+        "email": ctx.unverified.email,
+        "otp": ctx.otp_for(ctx.unverified, verified=False),
+    })),
+    ("users:login", None, lambda ctx: ("post", "/api/users/login/", {
+        "email": ctx.recruiter.email,
+        "password": PASSWORD,
+    })),
+    ("users:forgot-password", None, lambda ctx: ("post", "/api/users/forgot-password/", {
+        "email": ctx.reset_otp_state(ctx.recruiter, verified=True).email,
+    })),
+    ("users:reset-password", None, lambda ctx: ("post", "/api/users/reset-password/", {
+        "email": ctx.candidate.email,
+        "otp": ctx.otp_for(ctx.candidate, verified=True),
+        "password": PASSWORD,
+    })),
+    ("users:resend-otp", None, lambda ctx: ("post", "/api/users/resend-otp/", {
+        "email": ctx.reset_otp_state(ctx.unverified, verified=False).email,
+    })),
+    ("users:list", "admin", lambda ctx: ("get", "/api/users/?is_verified=true&email=re", None)),
+    ("users:profile", "admin", lambda ctx: ("get", "/api/users/profile/", None)),
+    ("users:profile-update", "admin", lambda ctx: ("patch", "/api/users/profile/", {"first_name": "Admin"})),
+
+    # ---------------- companies ----------------
+    ("companies:create", "admin", lambda ctx: ("post", "/api/companies/create/", {
+        "name": ctx.unique("Created Co"),
+        "description": "",
+    })),
+    ("companies:mine", "admin", lambda ctx: ("get", "/api/companies/mine/", None)),
+    ("companies:members", "admin", lambda ctx: ("get", f"/api/companies/{ctx.company.id}/members/", None)),
+    ("companies:invite", "admin", lambda ctx: ("post", f"/api/companies/{ctx.company.id}/invite/", {
+        "email": f"{ctx.unique('invited')}@bench.example.com",
+        "role": Membership.Role.RECRUITER,
+    })),
+    ("companies:invite-bulk", "admin", lambda ctx: ("post", f"/api/companies/{ctx.company.id}/invite/bulk/", {
+        # 50 new addresses plus an existing member that must be skipped
+        "emails": [f"{ctx.unique('bulk')}@bench.example.com" for _ in range(50)] + [ctx.recruiter.email],
+        "role": Membership.Role.RECRUITER,
+    })),
+    ("companies:invite-accept", "candidate", lambda ctx: (
+        "post", f"/api/companies/invite/{ctx.invite_for_candidate().id}/accept/", None
+    )),
+    ("companies:invite-reject", "candidate", lambda ctx: (
+        "post", f"/api/companies/invite/{ctx.invite_for_candidate().id}/reject/", None
+    )),
+    ("companies:change-role", "admin", lambda ctx: (
+        "post", f"/api/companies/membership/{ctx.new_member().id}/role/", {"role": Membership.Role.HIRING_MANAGER}
+    )),
+    ("companies:remove-member", "admin", lambda ctx: (
+        "delete", f"/api/companies/membership/{ctx.new_member().id}/remove/", None
+    )),
+    ("companies:my-invites", "admin", lambda ctx: ("get", "/api/companies/my-invites/", None)),
+    ("companies:invite-cancel", "admin", lambda ctx: (
+        "post", f"/api/companies/invite/{ctx.invite_for_candidate().id}/cancel/", None
+    )),
+
+    # ---------------- jobs ----------------
+    ("jobs:public-list", None, lambda ctx: ("get", "/api/jobs/", None)),
+    ("jobs:public-detail", None, lambda ctx: ("get", f"/api/jobs/{ctx.new_job().id}/", None)),
+    ("jobs:manage-list", "recruiter", lambda ctx: ("get", "/api/manage/jobs/", None)),
+    ("jobs:manage-create", "recruiter", lambda ctx: ("post", "/api/manage/jobs/", {
+        "company": ctx.company.id,
+        "title": "Backend Engineer",
+        "description": "...",
+    })),
+    ("jobs:manage-detail", "recruiter", lambda ctx: ("get", f"/api/manage/jobs/{ctx.new_job().id}/", None)),
+    ("jobs:manage-update", "recruiter", lambda ctx: (
+        "patch", f"/api/manage/jobs/{ctx.new_job().id}/", {"title": "Renamed"}
+    )),
+    ("jobs:manage-change-status", "recruiter", lambda ctx: (
+        "post", f"/api/manage/jobs/{ctx.new_job().id}/change_status/", {"status": Job.Status.CLOSED}
+    )),
+    ("jobs:manage-delete", "recruiter", lambda ctx: ("delete", f"/api/manage/jobs/{ctx.new_job().id}/", None)),
+
+    # ---------------- applications ----------------
+    ("applications:submit", "candidate", lambda ctx: ("post", "/api/applications/", {
+        "job": ctx.new_job().id,
+        "cover_letter": "Hello.",
+    })),
+    ("applications:mine", "candidate", lambda ctx: ("get", "/api/applications/mine/", None)),
+    ("applications:withdraw", "candidate", lambda ctx: (
+        "post", f"/api/applications/{ctx.new_application().id}/withdraw/", None
+    )),
+    ("applications:resume", "recruiter", lambda ctx: (
+        "get", f"/api/applications/{ctx.new_application(resume=True).id}/resume/", None
+    )),
+    ("applications:job-list", "recruiter", lambda ctx: ("get", f"/api/applications/jobs/{ctx.job.id}/", None)),
+
+    # ---------------- pipelines ----------------
+    ("pipelines:stages", "recruiter", lambda ctx: ("get", f"/api/pipelines/jobs/{ctx.job.id}/stages/", None)),
+    ("pipelines:stage-create", "recruiter", lambda ctx: (
+        "post", f"/api/pipelines/jobs/{ctx.new_job().id}/stages/", {"name": "Take-home"}
+    )),
+    ("pipelines:stage-delete", "recruiter", lambda ctx: ("delete", f"/api/pipelines/stages/{ctx.new_stage().id}/", None)),
+    ("pipelines:stage-reorder", "recruiter", lambda ctx: _reorder_stage(ctx)),
+    ("pipelines:move-all", "recruiter", lambda ctx: _reject_all(ctx)),
+    ("pipelines:board", "recruiter", lambda ctx: ("get", f"/api/pipelines/jobs/{ctx.job.id}/board/", None)),
+
+    # ---------------- interviews ----------------
+    ("interviews:availability", "recruiter", lambda ctx: _availability(ctx)),
+    ("interviews:schedule", "recruiter", lambda ctx: _schedule_interview(ctx)),
+    ("interviews:cancel", "recruiter", lambda ctx: (
+        "post", f"/api/interviews/{ctx.new_interview().id}/cancel/", None
+    )),
+    ("interviews:mine", "recruiter", lambda ctx: ("get", "/api/interviews/mine/", None)),
+    ("interviews:busy-list", "recruiter", lambda ctx: ("get", "/api/interviews/busy/", None)),
+    ("interviews:busy-create", "recruiter", lambda ctx: _add_busy_block(ctx)),
+    ("interviews:busy-delete", "recruiter", lambda ctx: (
+        "delete", f"/api/interviews/busy/{ctx.new_busy_block().id}/", None
+    )),
+
+    # ---------------- offers ----------------
+    ("offers:create", "recruiter", lambda ctx: ("post", "/api/offers/", {
+        "application": ctx.new_application().id,
+        "salary": "85000.00",
+        "start_date": "2030-01-01",
+        "terms": "Hybrid.",
+    })),
+    ("offers:mine", "candidate", lambda ctx: ("get", "/api/offers/mine/", None)),
+    ("offers:approve", "admin", lambda ctx: ("post", f"/api/offers/{ctx.new_offer().id}/approve/", None)),
+    ("offers:reject", "admin", lambda ctx: ("post", f"/api/offers/{ctx.new_offer().id}/reject/", None)),
+    ("offers:respond", "candidate", lambda ctx: (
+        "post", f"/api/offers/{ctx.new_offer(status=Offer.Status.APPROVED).id}/respond/", {"accept": True}
+    )),
+    ("offers:job-list", "recruiter", lambda ctx: ("get", f"/api/offers/jobs/{ctx.job.id}/", None)),
+    ("offers:batch-create", "recruiter", lambda ctx: _offer_cohort(ctx)),
+    ("offers:batch-detail", "recruiter", lambda ctx: ("get", f"/api/offers/batches/{ctx.new_offer_batch().id}/", None)),
+    ("offers:batch-retry", "recruiter", lambda ctx: (
+        "post", f"/api/offers/batches/{ctx.new_offer_batch(status=OfferBatch.Status.FAILED).id}/retry/", None
+    )),
+    ("offers:batch-approve", "admin", lambda ctx: (
+        "post", f"/api/offers/batches/{ctx.new_offer_batch().id}/approve/", None
+    )),
+
+    # ---------------- docs & admin ----------------
+    ("docs:schema", None, lambda ctx: ("get", "/api/schema/", None)),
+    ("docs:swagger", None, lambda ctx: ("get", "/api/docs/", None)),
+    ("docs:redoc", None, lambda ctx: ("get", "/api/redoc/", None)),
+    ("admin:login", None, lambda ctx: ("get", "/admin/login/", None)),
+]
+
+
+def run(ctx, *, repeat=10, warmup=1, only=None):
+    """
+    Replays every scenario and returns
+    {name: {"queries": int, "p50_ms": float, "p95_ms": float, "status": int}}.
+    Queries are taken from the last run, after caches are warm.
+
+    Celery dispatch is stubbed out: the harness measures the web tier,
+    not broker round-trips. Throttling is off, since every scenario
+    replays the same request from the same client. On-commit hooks
+    (cache generations, membership versions) run after each step as
+    they would after a real commit. Token claims are trusted as with a
+    shared cache in production; the harness is a single process.
+    Uploaded resumes go to a temporary directory.
+    """
+    results = {}
+
+    with mock.patch("celery.app.task.Task.apply_async"), mock.patch(
+        "apps.common.throttling.SlidingWindowRateThrottle.allow_request", return_value=True
+    ), tempfile.TemporaryDirectory() as private_root, override_settings(
+        JWT_TRUST_TOKEN_CLAIMS=True, PRIVATE_MEDIA_ROOT=private_root
+    ):
+        for name, actor, build in SCENARIOS:
+            if only and name not in only:
+                continue
+
+            client = APIClient()
+
+            samples = []
+            for iteration in range(warmup + repeat):
+                with TestCase.captureOnCommitCallbacks(execute=True):
+                    method, path, data = build(ctx)
+                if actor:
+                    client.credentials(HTTP_AUTHORIZATION=f"Bearer {ctx.token(actor)}")
+
+                with TestCase.captureOnCommitCallbacks(execute=True):
+                    with CaptureQueriesContext(connection) as queries:
+                        start = time.perf_counter()
+                        response = getattr(client, method)(path, data, format="json")
+                        elapsed = (time.perf_counter() - start) * 1000
+                if iteration >= warmup:
+                    samples.append(elapsed)
+
+            results[name] = {
+                "queries": len(queries),
+                "p50_ms": round(percentile(samples, 50), 2),
+                "p95_ms": round(percentile(samples, 95), 2),
+                "status": response.status_code,
+            }
+
+    cache.clear()
+    return results
+
+
+def load_budgets(path=BUDGET_FILE):
+    with open(path) as f:
+        return json.load(f)
+
+
+def find_violations(results, budgets, *, check_latency=True):
+    """
+    Returns human readable budget violations; empty when within budget.
+    """
+    violations = []
+    for name, result in results.items():
+        budget = budgets.get(name)
+        if budget is None:
+            violations.append(f"{name}: no budget recorded")
+            continue
+
+        if result["status"] >= 400:
+            violations.append(f"{name}: responded {result['status']}")
+        if result["queries"] > budget["queries"]:
+            violations.append(f"{name}: {result['queries']} queries > budget {budget['queries']}")
+        if check_latency:
+            for metric in ("p50_ms", "p95_ms"):
+                if result[metric] > budget[metric]:
+                    violations.append(f"{name}: {metric} {result[metric]} > budget {budget[metric]}")
+    return violations
@@ -0,0 +1,54 @@
+import time
+from contextlib import contextmanager
+
+from django.db import transaction
+
+
+class _Rollback(Exception):
+    pass
+
+
+@contextmanager
+def rolled_back():
+    """
+    Runs a block inside a transaction that is always rolled back,
+    so benchmark fixtures never leak into the database.
+    """
+    try:
+        with transaction.atomic():
+            yield
+            raise _Rollback
+    except _Rollback:
+        pass
+
+
+def percentile(samples, pct):
+    """
+    Nearest-rank percentile of a list of numbers.
+    """
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def measure(fn, *, repeat=20, warmup=1):
+    """
+    Calls fn() repeatedly and returns latency stats in milliseconds.
+    """
+    for _ in range(warmup):
+        fn()
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+
+    return {
+        "p50": percentile(samples, 50),
+        "p95": percentile(samples, 95),
+        "mean": sum(samples) / len(samples),
+        "min": min(samples),
+    }
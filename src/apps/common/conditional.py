@@ -0,0 +1,47 @@
+import hashlib
+from functools import wraps
+
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+
+def conditional_get(state_func):
+    """
+    Adds ETag / Last-Modified handling to a GET handler of an APIView.
+
+    `state_func(view, request, *args, **kwargs)` returns a tuple
+    `(fingerprint, last_modified)` describing the resource cheaply, e.g.
+    from a count + max(updated_at) aggregate. When the client's
+    If-None-Match matches, a 304 is returned without calling the handler,
+    so nothing is serialized.
+
+    Validation is ETag based: deleting a row changes the count but not
+    max(updated_at), so If-Modified-Since alone could miss it. The ETag
+    covers last_modified too, so an edit that leaves the fingerprint as
+    it was still changes it. Last-Modified is also sent for caches and
+    clients that display it.
+    """
+
+    def decorator(handler):
+
+        @wraps(handler)
+        def inner(self, request, *args, **kwargs):
+            fingerprint, last_modified = state_func(self, request, *args, **kwargs)
+
+            modified = last_modified.isoformat() if last_modified is not None else ""
+            source = f"{request.get_full_path()}|{request.user.pk}|{fingerprint}|{modified}"
+            etag = quote_etag(hashlib.sha256(source.encode()).hexdigest())
+
+            response = get_conditional_response(request, etag=etag)
+            if response is None:
+                response = handler(self, request, *args, **kwargs)
+
+            if response.status_code in (200, 304):
+                response["ETag"] = etag
+                if last_modified is not None:
+                    response["Last-Modified"] = http_date(last_modified.timestamp())
+            return response
+
+        return inner
+
+    return decorator
@@ -0,0 +1,75 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.common import api_benchmark
+from apps.common.benchmarks import rolled_back
+
+
+class Command(BaseCommand):
+    help = (
+        "Seeds a realistic tenant (rolled back afterwards), replays every API "
+        "route and fails when query counts or p50/p95 latency exceed the "
+        "budgets in apps/common/api_budgets.json."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--companies", type=int, default=5)
+        parser.add_argument("--jobs", type=int, default=2000, help="Jobs per company")
+        parser.add_argument("--invites", type=int, default=500, help="Invites per company")
+        parser.add_argument("--repeat", type=int, default=10)
+        parser.add_argument("--only", nargs="*", help="Scenario names to run")
+        parser.add_argument("--no-latency", action="store_true", help="Check query counts only")
+        parser.add_argument(
+            "--update-budgets",
+            action="store_true",
+            help="Rewrite the budget file from this run (latency with 3x headroom)",
+        )
+
+    def handle(self, *args, **options):
+        with rolled_back():
+            ctx = api_benchmark.seed(
+                companies=options["companies"],
+                jobs_per_company=options["jobs"],
+                invites_per_company=options["invites"],
+            )
+            results = api_benchmark.run(ctx, repeat=options["repeat"], only=options["only"])
+
+        self._report(results)
+
+        if options["update_budgets"]:
+            self._write_budgets(results)
+            return
+
+        violations = api_benchmark.find_violations(
+            results,
+            api_benchmark.load_budgets(),
+            check_latency=not options["no_latency"],
+        )
+        if violations:
+            raise CommandError("Budget exceeded:\n  " + "\n  ".join(violations))
+
+        self.stdout.write(self.style.SUCCESS("All endpoints within budget."))
+
+    def _report(self, results):
+        self.stdout.write(f"{'endpoint':32} {'status':>6} {'queries':>8} {'p50 ms':>9} {'p95 ms':>9}")
+        for name, result in results.items():
+            self.stdout.write(
+                f"{name:32} {result['status']:>6} {result['queries']:>8} "
+                f"{result['p50_ms']:>9.2f} {result['p95_ms']:>9.2f}"
+            )
+
+    def _write_budgets(self, results):
+        budgets = api_benchmark.load_budgets() if api_benchmark.BUDGET_FILE.exists() else {}
+        for name, result in results.items():
+            budgets[name] = {
+                "queries": result["queries"],
+                "p50_ms": round(max(result["p50_ms"] * 3, 25), 1),
+                "p95_ms": round(max(result["p95_ms"] * 3, 50), 1),
+            }
+
+        with open(api_benchmark.BUDGET_FILE, "w") as f:
+            json.dump(dict(sorted(budgets.items())), f, indent=2)
+            f.write("\n")
+
+        self.stdout.write(self.style.SUCCESS(f"Budgets written to {api_benchmark.BUDGET_FILE}"))
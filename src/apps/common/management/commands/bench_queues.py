@@ -0,0 +1,92 @@
+import time
+
+from celery import current_app
+from celery.exceptions import TimeoutError
+from celery.result import AsyncResult
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.common.benchmarks import percentile
+from apps.common.models import OutboxMessage
+from apps.common.outbox import enqueue_task_to
+from apps.common.tasks import queue_probe_task
+
+OTP_TASK = "apps.otp.tasks.send_otp_email_task"
+FLOOD_TASK = "apps.companies.tasks.send_bulk_invite_email_task"
+
+
+class Command(BaseCommand):
+    help = (
+        "Load test against a running broker, workers and beat: floods the "
+        "invite email route while sending OTP probes, both through the "
+        "outbox like real tasks, and reports how long OTP messages take "
+        "from the outbox row to a worker (p50/p95/max). The probe rows "
+        "stay in the outbox until prune_outbox removes them."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--flood", type=int, default=2000, help="Invite email probes to enqueue")
+        parser.add_argument("--flood-work", type=float, default=0.05, help="Seconds of work per invite probe")
+        parser.add_argument("--otp", type=int, default=50, help="OTP probes, sent while the flood drains")
+        parser.add_argument("--otp-interval", type=float, default=0.2, help="Seconds between OTP probes")
+        parser.add_argument("--max-otp-p95", type=float, default=5.0, help="Fail above this p95 wait (seconds)")
+        parser.add_argument("--timeout", type=float, default=600)
+        parser.add_argument(
+            "--single-queue",
+            action="store_true",
+            help="Send everything to the default queue (baseline without routing)",
+        )
+
+    def handle(self, *args, **options):
+        otp_queue = self._queue_for(OTP_TASK, options)
+        flood_queue = self._queue_for(FLOOD_TASK, options)
+        self.stdout.write(f"OTP probes -> outbox -> {otp_queue}, invite flood -> outbox -> {flood_queue}")
+
+        # One insert for the flood, as a bulk invite is one transaction
+        enqueued_at = time.time()
+        flood = OutboxMessage.objects.bulk_create([
+            OutboxMessage(
+                task_name=queue_probe_task.name, args=[enqueued_at, options["flood_work"]], queue=flood_queue
+            )
+            for _ in range(options["flood"])
+        ])
+
+        otp = []
+        for _ in range(options["otp"]):
+            otp.append(enqueue_task_to(otp_queue, queue_probe_task, time.time(), 0.0))
+            time.sleep(options["otp_interval"])
+
+        otp_waits = self._collect(otp, options["timeout"])
+        flood_waits = self._collect(flood, options["timeout"])
+
+        self._report("otp", otp_waits)
+        self._report("invite flood", flood_waits)
+
+        p95 = percentile(otp_waits, 95)
+        if p95 > options["max_otp_p95"]:
+            raise CommandError(f"OTP p95 outbox-to-worker wait {p95:.2f}s > {options['max_otp_p95']}s")
+        self.stdout.write(self.style.SUCCESS("OTP latency held during the invite flood."))
+
+    def _queue_for(self, task_name, options):
+        if options["single_queue"]:
+            return current_app.conf.task_default_queue
+        route = current_app.amqp.router.route({}, task_name)
+        return route["queue"].name
+
+    def _collect(self, messages, timeout):
+        deadline = time.monotonic() + timeout
+        waits = []
+        for message in messages:
+            try:
+                result = AsyncResult(message.task_id, app=current_app)
+                waits.append(result.get(timeout=max(deadline - time.monotonic(), 0.1)))
+            except TimeoutError:
+                raise CommandError(
+                    "Timed out waiting for probes; are beat and workers for every queue, outbox included, running?"
+                )
+        return waits
+
+    def _report(self, label, waits):
+        self.stdout.write(
+            f"{label:14} n={len(waits):<6} "
+            f"p50={percentile(waits, 50):.3f}s p95={percentile(waits, 95):.3f}s max={max(waits):.3f}s"
+        )
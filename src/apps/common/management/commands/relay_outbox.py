@@ -0,0 +1,29 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.common.outbox import prune_outbox, relay_outbox
+
+
+class Command(BaseCommand):
+    help = "Dispatch committed outbox messages to Celery in batches"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=None)
+        parser.add_argument("--interval", type=float, default=0.5, help="Seconds to sleep when the outbox is empty")
+        parser.add_argument("--once", action="store_true", help="Drain the outbox once and exit")
+        parser.add_argument("--prune", action="store_true", help="Delete old dispatched messages and exit")
+
+    def handle(self, *args, **options):
+        if options["prune"]:
+            self.stdout.write(f"Pruned {prune_outbox()} dispatched messages")
+            return
+
+        while True:
+            sent = relay_outbox(batch_size=options["batch_size"])
+            if sent:
+                self.stdout.write(f"Dispatched {sent} messages")
+                continue
+            if options["once"]:
+                return
+            time.sleep(options["interval"])
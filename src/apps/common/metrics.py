@@ -0,0 +1,87 @@
+import json
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+
+from django.conf import settings
+
+from apps.common.benchmarks import percentile
+
+logger = logging.getLogger(__name__)
+
+# Samples kept per timing; enough for stable p95 without unbounded memory
+_WINDOW = 1000
+
+_lock = threading.Lock()
+_counters = defaultdict(int)
+_timings = defaultdict(lambda: {"count": 0, "total": 0.0, "samples": deque(maxlen=_WINDOW)})
+_next_log_at = None
+
+
+def increment(name, value=1):
+    """
+    Adds to a per-process counter.
+    """
+    with _lock:
+        _counters[name] += value
+    _maybe_log()
+
+
+def observe(name, value):
+    """
+    Records one sample (e.g. a latency in ms) of a per-process timing.
+    """
+    with _lock:
+        timing = _timings[name]
+        timing["count"] += 1
+        timing["total"] += value
+        timing["samples"].append(value)
+    _maybe_log()
+
+
+def snapshot():
+    """
+    Returns counters and timing summaries (count, mean, p50, p95, max over
+    the last samples) for the current process.
+    """
+    with _lock:
+        timings = {}
+        for name, timing in _timings.items():
+            samples = list(timing["samples"])
+            timings[name] = {
+                "count": timing["count"],
+                "mean": timing["total"] / timing["count"],
+                "p50": percentile(samples, 50),
+                "p95": percentile(samples, 95),
+                "max": max(samples),
+            }
+        return {"counters": dict(_counters), "timings": timings}
+
+
+def _maybe_log():
+    """
+    Logs the snapshot as one JSON line at most every METRICS_LOG_INTERVAL
+    seconds, from whichever process records metrics (web or worker).
+    """
+    global _next_log_at
+    interval = settings.METRICS_LOG_INTERVAL
+    if not interval:
+        return
+
+    now = time.monotonic()
+    with _lock:
+        if _next_log_at is None:
+            _next_log_at = now + interval
+        if now < _next_log_at:
+            return
+        _next_log_at = now + interval
+    logger.info("metrics %s", json.dumps(snapshot(), sort_keys=True))
+
+
+def reset():
+    global _next_log_at
+    with _lock:
+        _counters.clear()
+        _timings.clear()
+        _next_log_at = None
@@ -1,3 +1,41 @@
 from django.db import models
 
-# Create your models here.
+
+class OutboxMessage(models.Model):
+    """
+    A Celery task recorded in the same transaction as the change that
+    caused it. The relay (apps.common.outbox) sends it to the broker
+    once committed, so requests never wait on the broker and a rolled
+    back request never fires a task.
+    """
+
+    task_name = models.CharField(max_length=255)
+    args = models.JSONField(default=list)
+    kwargs = models.JSONField(default=dict)
+    # Overrides CELERY_TASK_ROUTES when set
+    queue = models.CharField(max_length=50, blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    dispatched_at = models.DateTimeField(null=True, blank=True)
+
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+
+    class Meta:
+        ordering = ["id"]
+        indexes = [
+            # The relay only ever scans undispatched rows, oldest first
+            models.Index(
+                fields=["id"],
+                name="outbox_pending_idx",
+                condition=models.Q(dispatched_at__isnull=True),
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.task_name} #{self.pk}"
+
+    @property
+    def task_id(self):
+        # Stable across relay retries, and lets callers find the result
+        return f"outbox-{self.pk}"
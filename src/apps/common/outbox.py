@@ -0,0 +1,85 @@
+import logging
+from datetime import timedelta
+
+from celery import current_app
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from apps.common import metrics
+from apps.common.models import OutboxMessage
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue_task(task, *args, **kwargs):
+    """
+    Records `task(*args, **kwargs)` in the outbox instead of calling
+    `.delay()`. The row commits (or rolls back) with the caller's
+    transaction; the relay dispatches it afterwards.
+    Arguments must be JSON serializable.
+    """
+    return OutboxMessage.objects.create(task_name=task.name, args=list(args), kwargs=kwargs)
+
+
+def enqueue_task_to(queue, task, *args, **kwargs):
+    """
+    enqueue_task, sent to `queue` instead of the task's route.
+    """
+    return OutboxMessage.objects.create(task_name=task.name, args=list(args), kwargs=kwargs, queue=queue)
+
+
+def relay_outbox(*, batch_size=None):
+    """
+    Sends one batch of pending messages to the broker.
+    Rows are locked with SKIP LOCKED so several relays can run side by
+    side. Stops at the first broker error; the rest of the batch is
+    picked up on the next run. Returns the number of messages sent.
+    """
+    batch_size = batch_size or settings.OUTBOX_BATCH_SIZE
+    sent, failed = [], None
+
+    with transaction.atomic():
+        messages = list(
+            OutboxMessage.objects.select_for_update(skip_locked=True).filter(
+                dispatched_at__isnull=True,
+                attempts__lt=settings.OUTBOX_MAX_ATTEMPTS,
+            )[:batch_size]
+        )
+
+        for message in messages:
+            try:
+                options = {"queue": message.queue} if message.queue else {}
+                current_app.send_task(
+                    message.task_name, args=message.args, kwargs=message.kwargs, task_id=message.task_id, **options
+                )
+            except Exception as exc:
+                logger.warning("Outbox dispatch of %s failed", message, exc_info=True)
+                message.attempts += 1
+                message.last_error = str(exc)
+                failed = message
+                break
+            sent.append(message.pk)
+
+        if sent:
+            OutboxMessage.objects.filter(pk__in=sent).update(
+                dispatched_at=timezone.now(), attempts=F("attempts") + 1
+            )
+        if failed:
+            failed.save(update_fields=["attempts", "last_error"])
+
+    metrics.increment("outbox.dispatched", len(sent))
+    return len(sent)
+
+
+def prune_outbox(*, older_than=None):
+    """
+    Deletes dispatched messages older than OUTBOX_RETENTION_HOURS.
+    Returns the number of rows deleted.
+    """
+    older_than = older_than or timedelta(hours=settings.OUTBOX_RETENTION_HOURS)
+    deleted, _ = OutboxMessage.objects.filter(
+        dispatched_at__lt=timezone.now() - older_than
+    ).delete()
+    return deleted
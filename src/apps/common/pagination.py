@@ -0,0 +1,195 @@
+import base64
+import binascii
+import json
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import ValidationError as DRFValidationError
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Cursor pagination keyed on a unique ordering, e.g. (created_at, id).
+
+    Each page is fetched with a range predicate on the last row seen instead
+    of an OFFSET, so page 500 costs the same as page 1. Cursors are opaque
+    base64 tokens; clients only follow the `next` / `previous` links.
+    """
+
+    # Must end with a unique column so the position of every row is exact.
+    ordering = ("-created_at", "-id")
+    page_size = 20
+    max_page_size = 100
+    page_size_query_param = "page_size"
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor."
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.base_url = request.build_absolute_uri()
+
+        position, reverse = self.decode_cursor(request, queryset.model)
+
+        ordering = self.ordering
+        if reverse:
+            ordering = tuple(self._invert(field) for field in ordering)
+
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            queryset = queryset.filter(self._seek(ordering, position))
+
+        # Fetch one extra row to know whether another page exists.
+        results = list(queryset[: self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[: self.page_size]
+
+        if reverse:
+            results.reverse()
+            has_next, has_previous = position is not None, has_more
+        else:
+            has_next, has_previous = has_more, position is not None
+
+        self.next_position = self._position(results[-1]) if has_next and results else None
+        self.previous_position = self._position(results[0]) if has_previous and results else None
+        return results
+
+    def get_page_size(self, request):
+        value = request.query_params.get(self.page_size_query_param)
+        try:
+            size = int(value)
+        except (TypeError, ValueError):
+            return self.page_size
+        if size <= 0:
+            return self.page_size
+        return min(size, self.max_page_size)
+
+    def get_paginated_response(self, data):
+        return Response({
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Opaque pagination cursor.",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.page_size_query_param,
+                "required": False,
+                "in": "query",
+                "description": f"Number of results per page (max {self.max_page_size}).",
+                "schema": {"type": "integer"},
+            },
+        ]
+
+    def get_next_link(self):
+        if self.next_position is None:
+            return None
+        return self._link(self.next_position, reverse=False)
+
+    def get_previous_link(self):
+        if self.previous_position is None:
+            return None
+        return self._link(self.previous_position, reverse=True)
+
+    # ---------------------------------------------
+    # Cursor encoding
+    # ---------------------------------------------
+
+    def encode_cursor(self, position, reverse):
+        payload = {"p": position}
+        if reverse:
+            payload["r"] = 1
+        raw = json.dumps(payload, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    def decode_cursor(self, request, model):
+        """
+        Returns (position, reverse). Position values are converted back to
+        python with the model fields so they compare correctly in SQL, and
+        checked against the fields' validators (e.g. integer range), so a
+        tampered cursor is a 400 rather than a database error.
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+
+        try:
+            padded = encoded + "=" * (-len(encoded) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            raw_position = payload["p"]
+            if not isinstance(raw_position, list) or len(raw_position) != len(self.ordering):
+                raise ValueError
+            position = []
+            for field, value in zip(self.ordering, raw_position):
+                model_field = model._meta.get_field(self._field_name(field))
+                value = model_field.to_python(value)
+                if value is None:
+                    raise ValueError
+                model_field.run_validators(value)
+                position.append(value)
+        except (TypeError, ValueError, KeyError, binascii.Error, ValidationError):
+            raise DRFValidationError({self.cursor_query_param: self.invalid_cursor_message})
+
+        return position, bool(payload.get("r"))
+
+    # ---------------------------------------------
+    # Helpers
+    # ---------------------------------------------
+
+    def _link(self, position, reverse):
+        return replace_query_param(
+            self.base_url, self.cursor_query_param, self.encode_cursor(position, reverse)
+        )
+
+    def _position(self, obj):
+        position = []
+        for field in self.ordering:
+            value = getattr(obj, obj._meta.get_field(self._field_name(field)).attname)
+            position.append(value.isoformat() if hasattr(value, "isoformat") else value)
+        return position
+
+    def _seek(self, ordering, position):
+        """
+        Row-value comparison expanded for portability:
+        (a, b) < (x, y)  ==  a < x OR (a = x AND b < y)
+        """
+        condition = Q()
+        for index, field in enumerate(ordering):
+            name = self._field_name(field)
+            lookup = "lt" if field.startswith("-") else "gt"
+            equal = {
+                self._field_name(prev): position[i]
+                for i, prev in enumerate(ordering[:index])
+            }
+            condition |= Q(**equal, **{f"{name}__{lookup}": position[index]})
+        return condition
+
+    @staticmethod
+    def _field_name(field):
+        return field.lstrip("-")
+
+    @staticmethod
+    def _invert(field):
+        return field[1:] if field.startswith("-") else f"-{field}"
@@ -0,0 +1,62 @@
+import time
+
+from celery import shared_task
+from django.conf import settings
+from django.utils import timezone
+from django_celery_results.models import TaskResult
+
+from apps.common.outbox import prune_outbox, relay_outbox
+
+
+@shared_task(ignore_result=True)
+def relay_outbox_task():
+    """
+    Drains the outbox until it is empty (or the broker fails).
+    Scheduled by celery beat, see CELERY_BEAT_SCHEDULE.
+    """
+    total = 0
+    while True:
+        sent = relay_outbox()
+        total += sent
+        if not sent:
+            return total
+
+
+@shared_task(ignore_result=True)
+def prune_outbox_task():
+    return prune_outbox()
+
+
+@shared_task(ignore_result=True)
+def prune_task_results_task():
+    """
+    Deletes django_celery_results rows older than CELERY_RESULT_EXPIRES,
+    in small batches so the table is never locked for long.
+    celery.backend_cleanup only cleans the active backend, so rows left
+    from when django-db was the backend would otherwise never go.
+    Returns the number of rows deleted.
+    """
+    cutoff = timezone.now() - settings.CELERY_RESULT_EXPIRES
+    batch_size = settings.TASK_RESULT_PRUNE_BATCH_SIZE
+    total = 0
+
+    while True:
+        ids = list(
+            TaskResult.objects.filter(date_done__lt=cutoff)
+            .order_by()
+            .values_list("id", flat=True)[:batch_size]
+        )
+        if not ids:
+            return total
+        total += TaskResult.objects.filter(id__in=ids).delete()[0]
+
+
+@shared_task(ignore_result=False)
+def queue_probe_task(enqueued_at, work_seconds=0.0):
+    """
+    Load-test probe used by `bench_queues`: returns the seconds the
+    message waited in its queue, then simulates `work_seconds` of work.
+    """
+    waited = time.time() - enqueued_at
+    time.sleep(work_seconds)
+    return waited
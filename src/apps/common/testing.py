@@ -0,0 +1,16 @@
+from django.db import connection
+
+
+class QueryPlanMixin:
+    """
+    Asserts the planner picks a given index.
+    On Postgres sequential scans are disabled for the test transaction,
+    otherwise the planner prefers them on tiny test tables.
+    """
+
+    def assertUsesIndex(self, queryset, index_name):
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL enable_seqscan = off")
+        plan = queryset.explain()
+        self.assertIn(index_name, plan, msg=f"Index not used:\n{plan}")
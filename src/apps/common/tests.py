@@ -1,3 +1,224 @@
-from django.test import TestCase
+import base64
+import json
+import shutil
+import tempfile
+from datetime import datetime, timedelta, timezone as dt_timezone
+from unittest import mock
+from urllib.parse import parse_qs, urlsplit
 
-# Create your tests here.
+from celery import current_app
+from django.conf import settings
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import URLPattern, URLResolver, get_resolver, resolve
+from django.utils import timezone
+from django_celery_results.models import TaskResult
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from apps.common import api_benchmark, metrics
+from apps.common.models import OutboxMessage
+from apps.common.outbox import enqueue_task, enqueue_task_to, relay_outbox
+from apps.common.pagination import KeysetPagination
+from apps.common.tasks import prune_task_results_task, relay_outbox_task
+from apps.companies.models import Company
+from apps.jobs.models import Job
+from apps.otp.tasks import send_otp_email_task
+from apps.users.models import User
+
+
+def _routes(patterns, prefix=""):
+    """
+    Full routes of every URL pattern, joined the way ResolverMatch.route is.
+    """
+    for pattern in patterns:
+        route = prefix + str(pattern.pattern).removeprefix("^")
+        if isinstance(pattern, URLResolver):
+            yield from _routes(pattern.url_patterns, route)
+        elif isinstance(pattern, URLPattern):
+            yield route
+
+
+class ApiQueryBudgetTests(TestCase):
+    """
+    Replays every API route against a small seed and fails when a route
+    runs more queries than apps/common/api_budgets.json allows.
+    Latency is only checked by `manage.py bench_api`.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.ctx = api_benchmark.seed(
+            companies=2,
+            members_per_company=3,
+            jobs_per_company=30,
+            invites_per_company=10,
+            applicants=20,
+        )
+
+    def setUp(self):
+        # Scenarios upload resumes
+        private_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, private_root, ignore_errors=True)
+        self.enterContext(override_settings(PRIVATE_MEDIA_ROOT=private_root))
+
+    def test_every_api_route_has_a_scenario(self):
+        covered = {
+            resolve(build(self.ctx)[1].split("?")[0]).route
+            for _, _, build in api_benchmark.SCENARIOS
+        }
+        # Format-suffix variants and the router's browsable API root are
+        # aliases of the routes below.
+        routes = {
+            route for route in _routes(get_resolver().url_patterns)
+            if route.startswith("api/") and route != "api/" and "format>" not in route
+        }
+
+        self.assertEqual(routes - covered, set())
+
+    def test_endpoints_stay_within_query_budget(self):
+        results = api_benchmark.run(self.ctx, repeat=1)
+        violations = api_benchmark.find_violations(
+            results, api_benchmark.load_budgets(), check_latency=False
+        )
+
+        self.assertEqual(violations, [])
+
+
+@mock.patch("apps.common.outbox.current_app.send_task")
+class OutboxRelayTests(TestCase):
+
+    def test_relay_dispatches_pending_messages_once(self, send_task):
+        first = enqueue_task(send_otp_email_task, 1, purpose="reset")
+        enqueue_task(send_otp_email_task, 2, purpose="verify")
+
+        self.assertEqual(relay_outbox(), 2)
+        send_task.assert_any_call(
+            "apps.otp.tasks.send_otp_email_task", args=[1], kwargs={"purpose": "reset"}, task_id=first.task_id
+        )
+        self.assertFalse(OutboxMessage.objects.filter(dispatched_at__isnull=True).exists())
+
+        self.assertEqual(relay_outbox(), 0)
+        self.assertEqual(send_task.call_count, 2)
+
+    def test_broker_error_stops_the_batch_and_keeps_messages_pending(self, send_task):
+        first = enqueue_task(send_otp_email_task, 1)
+        enqueue_task(send_otp_email_task, 2)
+        send_task.side_effect = ConnectionError("broker down")
+
+        self.assertEqual(relay_outbox(), 0)
+        self.assertEqual(send_task.call_count, 1)
+
+        first.refresh_from_db()
+        self.assertEqual(first.attempts, 1)
+        self.assertEqual(first.last_error, "broker down")
+        self.assertEqual(OutboxMessage.objects.filter(dispatched_at__isnull=True).count(), 2)
+
+    def test_relay_has_its_own_queue_and_messages_can_pick_one(self, send_task):
+        # OTP mail goes through the relay, which must not wait behind `email`
+        route = current_app.amqp.router.route({}, relay_outbox_task.name)
+        self.assertEqual(route["queue"].name, "outbox")
+
+        message = enqueue_task_to("default", send_otp_email_task, 1)
+        relay_outbox()
+        send_task.assert_called_once_with(
+            "apps.otp.tasks.send_otp_email_task", args=[1], kwargs={}, task_id=message.task_id, queue="default"
+        )
+
+
+@override_settings(CELERY_RESULT_BACKEND="redis://localhost:6379/0", TASK_RESULT_PRUNE_BATCH_SIZE=2)
+class TaskResultPruneTests(TestCase):
+
+    def test_expired_rows_are_pruned_whatever_the_backend(self):
+        TaskResult.objects.bulk_create([TaskResult(task_id=f"task-{i}") for i in range(5)])
+        expired = timezone.now() - settings.CELERY_RESULT_EXPIRES - timedelta(minutes=1)
+        TaskResult.objects.filter(task_id__in=["task-0", "task-1", "task-2"]).update(date_done=expired)
+
+        self.assertEqual(prune_task_results_task(), 3)
+        self.assertEqual(sorted(TaskResult.objects.values_list("task_id", flat=True)), ["task-3", "task-4"])
+
+
+class MetricsLogTests(SimpleTestCase):
+
+    def setUp(self):
+        metrics.reset()
+
+    @override_settings(METRICS_LOG_INTERVAL=60)
+    def test_snapshot_is_logged_once_per_interval(self):
+        with mock.patch("apps.common.metrics.time.monotonic", side_effect=[0, 30, 61, 62]):
+            with self.assertLogs("apps.common.metrics", level="INFO") as logs:
+                metrics.increment("otp.deduplicated")
+                metrics.observe("emails.send_latency_ms", 12.0)
+                metrics.increment("otp.deduplicated")
+                metrics.increment("otp.deduplicated")
+
+        [line] = logs.output
+        self.assertIn('"otp.deduplicated": 2', line)
+        self.assertIn('"emails.send_latency_ms"', line)
+
+
+class KeysetPaginationTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        owner = User.objects.create(email="owner@example.com", first_name="Owner", last_name="User")
+        company = Company.objects.create(name="Acme", created_by=owner)
+        Job.objects.bulk_create([
+            Job(company=company, created_by=owner, title=f"Job {i}", description="...") for i in range(7)
+        ])
+        # Every row ties on created_at; the id breaks the ties
+        Job.objects.update(created_at=timezone.now())
+        cls.ids = list(Job.objects.order_by("-id").values_list("id", flat=True))
+
+    def page(self, cursor=None):
+        params = {"page_size": 3}
+        if cursor:
+            params["cursor"] = cursor
+        paginator = KeysetPagination()
+        results = paginator.paginate_queryset(Job.objects.all(), Request(APIRequestFactory().get("/jobs/", params)))
+        links = (paginator.get_next_link(), paginator.get_previous_link())
+        cursors = [parse_qs(urlsplit(link).query)["cursor"][0] if link else None for link in links]
+        return [job.id for job in results], *cursors
+
+    def test_cursor_round_trip(self):
+        paginator = KeysetPagination()
+        cursor = paginator.encode_cursor(["2030-01-01T12:00:00+00:00", 5], reverse=True)
+        request = Request(APIRequestFactory().get("/jobs/", {"cursor": cursor}))
+
+        position, reverse = paginator.decode_cursor(request, Job)
+
+        self.assertEqual(position, [datetime(2030, 1, 1, 12, tzinfo=dt_timezone.utc), 5])
+        self.assertTrue(reverse)
+
+    def test_next_and_previous_walk_every_row_once(self):
+        pages, cursor = [], None
+        while True:
+            ids, cursor, _ = self.page(cursor)
+            pages.append(ids)
+            if cursor is None:
+                break
+        self.assertEqual(pages, [self.ids[:3], self.ids[3:6], self.ids[6:]])
+
+        # Back from the last page
+        _, _, previous = self.page(self.page(self.page()[1])[1])
+        ids, _, previous = self.page(previous)
+        self.assertEqual(ids, self.ids[3:6])
+        ids, _, previous = self.page(previous)
+        self.assertEqual((ids, previous), (self.ids[:3], None))
+
+    def test_tampered_cursors_are_bad_requests(self):
+        def encode(payload):
+            return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+        for cursor in [
+            "not base64!",
+            encode([1, 2]),
+            encode({"p": [1]}),
+            encode({"p": "ab"}),
+            encode({"p": ["yesterday", 1]}),
+            encode({"p": [None, 1]}),
+            encode({"p": ["2030-01-01T12:00:00+00:00", 10 ** 30]}),
+        ]:
+            with self.subTest(cursor=cursor):
+                response = self.client.get("/api/jobs/", {"cursor": cursor})
+                self.assertEqual(response.status_code, 400)
+                self.assertIn("cursor", response.data)
@@ -1,5 +1,6 @@
 from rest_framework.permissions import BasePermission
 from apps.companies.models import Membership
+from apps.companies.selectors.roles import is_company_admin
 
 
 class IsCompanyAdmin(BasePermission):
@@ -9,20 +10,14 @@ class IsCompanyAdmin(BasePermission):
         membership_id = view.kwargs.get("membership_id")
 
         if company_id:
-            return Membership.objects.filter(
-                company_id=company_id,
-                user=request.user,
-                role=Membership.Role.ADMIN
-            ).exists()
+            return is_company_admin(user=request.user, company_id=company_id)
 
         if membership_id:
-            membership = Membership.objects.filter(id=membership_id).first()
-            if not membership:
+            company_id = Membership.objects.filter(
+                id=membership_id
+            ).values_list("company_id", flat=True).first()
+            if not company_id:
                 return False
-            return Membership.objects.filter(
-                company=membership.company,
-                user=request.user,
-                role=Membership.Role.ADMIN
-            ).exists()
+            return is_company_admin(user=request.user, company_id=company_id)
 
         return False
@@ -32,6 +32,15 @@ class SendInviteSerializer(serializers.Serializer):
     role = serializers.ChoiceField(choices=Membership.Role.choices)
 
 
+class BulkInviteSerializer(serializers.Serializer):
+    emails = serializers.ListField(
+        child=serializers.EmailField(),
+        allow_empty=False,
+        max_length=1000,
+    )
+    role = serializers.ChoiceField(choices=Membership.Role.choices)
+
+
 class ChangeRoleSerializer(serializers.Serializer):
     role = serializers.ChoiceField(choices=Membership.Role.choices)
 
@@ -5,11 +5,15 @@ from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from django.shortcuts import get_object_or_404
 from django.core.exceptions import ValidationError
+from django.db.models import Count, Max, Q
+from django.db.models.functions import Lower
 
+from apps.common.conditional import conditional_get
 from apps.companies.models import Company, Membership, Invite
+from apps.companies.selectors.roles import get_user_company_ids
 from apps.companies.services.company_service import create_company
 from apps.companies.services.invite_service import (
-    send_invite, accept_invite, reject_invite, cancel_invite, list_user_invites, list_sent_invites
+    send_invite, send_bulk_invites, accept_invite, reject_invite, cancel_invite, list_user_invites, list_sent_invites
 )
 from apps.companies.services.membership_service import (
     change_member_role, remove_member
@@ -35,15 +39,24 @@ class CompanyCreateView(GenericAPIView):
         return Response(CompanySerializer(company).data, status=201)
 
 
+def my_companies_state(view, request):
+    company_ids = sorted(get_user_company_ids(user=request.user))
+    last_modified = Company.objects.filter(id__in=company_ids).aggregate(
+        last_modified=Max("updated_at")
+    )["last_modified"]
+    return company_ids, last_modified
+
+
 class MyCompaniesView(APIView):
+    @conditional_get(my_companies_state)
     def get(self, request):
-        companies = Company.objects.filter(memberships__user=request.user)
+        companies = Company.objects.filter(id__in=get_user_company_ids(user=request.user))
         return Response(CompanySerializer(companies, many=True).data)
 
 
 class CompanyMembersView(APIView):
     def get(self, request, company_id):
-        members = Membership.objects.filter(company_id=company_id)
+        members = Membership.objects.filter(company_id=company_id).select_related("user")
         return Response(MembershipSerializer(members, many=True).data)
 
 
@@ -67,6 +80,32 @@ class SendInviteView(GenericAPIView):
         return Response(InviteSerializer(invite).data, status=201)
 
 
+class BulkInviteView(GenericAPIView):
+    serializer_class = BulkInviteSerializer
+    permission_classes = [IsCompanyAdmin]
+
+    def post(self, request, company_id):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        company = get_object_or_404(Company, id=company_id)
+
+        try:
+            invites, skipped = send_bulk_invites(
+                emails=serializer.validated_data["emails"],
+                company=company,
+                role=serializer.validated_data["role"],
+                invited_by=request.user
+            )
+        except ValidationError as e:
+            return Response({"detail": e.messages}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response({
+            "invites": InviteSerializer(invites, many=True).data,
+            "skipped": skipped,
+        }, status=201)
+
+
 class AcceptInviteView(APIView):
     def post(self, request, invite_id):
         invite = get_object_or_404(Invite, id=invite_id)
@@ -145,17 +184,39 @@ class RemoveMemberView(APIView):
 
 
 
+def my_invites_state(view, request):
+    """
+    Invites have no updated_at, but their status only moves forward from
+    PENDING, so per-status counts plus the newest id change on every
+    create, accept, reject or cancel. One conditional aggregate query.
+    """
+    user = request.user
+    received = Q(email_lower=user.email.lower(), status=Invite.Status.PENDING)
+    sent = Q(invited_by=user)
+
+    aggregates = {
+        "received_count": Count("id", filter=received),
+        "received_last": Max("id", filter=received),
+        "sent_last": Max("id", filter=sent),
+        "last_modified": Max("created_at"),
+    }
+    for value in Invite.Status.values:
+        aggregates[f"sent_{value}"] = Count("id", filter=sent & Q(status=value))
+
+    state = Invite.objects.annotate(email_lower=Lower("email")).filter(received | sent).aggregate(**aggregates)
+    last_modified = state.pop("last_modified")
+    return sorted(state.items()), last_modified
+
+
 class MyInvitesView(APIView):
     permission_classes = [IsAuthenticated]
 
+    @conditional_get(my_invites_state)
     def get(self, request):
         user = request.user
 
         # Invites received (pending)
-        received_invites = Invite.objects.filter(
-            email__iexact=user.email,
-            status=Invite.Status.PENDING
-        ).select_related("company", "invited_by")
+        received_invites = list_user_invites(user=user).select_related("invited_by")
 
         # Invites sent by this user
         sent_invites = Invite.objects.filter(
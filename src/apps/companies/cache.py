@@ -0,0 +1,47 @@
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+
+# Per-user membership version. Access tokens carry the version (and the
+# roles) they were issued with; bumping it sends every older token back
+# to the database.
+MEMBERSHIP_VERSION_KEY = "companies:mv:{user_id}"
+
+
+def get_membership_version(*, user_id):
+    key = MEMBERSHIP_VERSION_KEY.format(user_id=user_id)
+    version = cache.get(key)
+    if version is None:
+        # A fresh timestamp can't match a version that was evicted, so
+        # older tokens are never trusted again.
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def bump_membership_version(*, user_id):
+    """
+    Runs after commit: a rolled back change never revokes anything, and
+    a token issued mid-transaction still carries the old version.
+    """
+    bump_membership_versions(user_ids=[user_id])
+
+
+def bump_membership_versions(*, user_ids):
+    """
+    bump_membership_version for many users, e.g. after a queryset
+    .update() that sent no post_save.
+    """
+    keys = [MEMBERSHIP_VERSION_KEY.format(user_id=user_id) for user_id in user_ids]
+    if not keys:
+        return
+
+    def bump():
+        for key in keys:
+            try:
+                cache.incr(key)
+            except ValueError:
+                cache.set(key, time.time_ns(), timeout=None)
+
+    transaction.on_commit(bump)
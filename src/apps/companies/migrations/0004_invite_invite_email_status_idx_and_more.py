@@ -0,0 +1,27 @@
+# Generated by Django 6.0.1 on 2026-10-18 10:00
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('companies', '0003_alter_invite_unique_together'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='invite',
+            index=models.Index(fields=['email', 'status'], name='invite_email_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='invite',
+            index=models.Index(fields=['invited_by', 'status'], name='invite_invited_by_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='membership',
+            index=models.Index(fields=['company', 'role'], name='member_company_role_idx'),
+        ),
+    ]
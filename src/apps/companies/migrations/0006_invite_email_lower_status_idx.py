@@ -0,0 +1,24 @@
+# Generated by Django 6.0.1 on 2026-10-18 10:00
+
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('companies', '0005_membership_member_company_user_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='invite',
+            name='invite_email_status_idx',
+        ),
+        migrations.AddIndex(
+            model_name='invite',
+            index=models.Index(django.db.models.functions.text.Lower('email'), models.F('status'), name='invite_email_lower_status_idx'),
+        ),
+    ]
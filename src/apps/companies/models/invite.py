@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models.functions import Lower
 from django.conf import settings
 from .company import Company
 from .membership import Membership
@@ -42,6 +43,12 @@ class Invite(models.Model):
     class Meta:
         ordering = ["-created_at"]
         unique_together = ("email", "company")
+        indexes = [
+            # Invites received by an email, matched case-insensitively
+            models.Index(Lower("email"), "status", name="invite_email_lower_status_idx"),
+            # Invites sent by a user
+            models.Index(fields=["invited_by", "status"], name="invite_invited_by_status_idx"),
+        ]
 
     def __str__(self):
         return f"{self.email} invited to {self.company.name} as {self.role}"
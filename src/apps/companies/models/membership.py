@@ -1,8 +1,23 @@
 from django.db import models
 from django.conf import settings
+
+from apps.companies.cache import bump_membership_versions
 from .company import Company
 
 
+class MembershipQuerySet(models.QuerySet):
+
+    def update(self, **kwargs):
+        """
+        Bulk updates send no post_save, so the membership versions the
+        signal would bump are bumped here (one extra query for the users).
+        """
+        user_ids = list(self.order_by().values_list("user_id", flat=True).distinct())
+        rows = super().update(**kwargs)
+        bump_membership_versions(user_ids=user_ids)
+        return rows
+
+
 class Membership(models.Model):
 
     class Role(models.TextChoices):
@@ -29,9 +44,25 @@ class Membership(models.Model):
 
     joined_at = models.DateTimeField(auto_now_add=True)
 
+    objects = MembershipQuerySet.as_manager()
+
     class Meta:
         unique_together = ("user", "company")
         ordering = ["-joined_at"]
+        # Role checks filter on (user, company), already served by the
+        # unique_together index; only the per-company role lookups need one.
+        indexes = [
+            # Members of a company (user listing scoped to shared companies)
+            models.Index(
+                fields=["company", "user"],
+                name="member_company_user_idx",
+            ),
+            # Last-admin checks: admins of a company
+            models.Index(
+                fields=["company", "role"],
+                name="member_company_role_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.user.email} - {self.company.name} ({self.role})"
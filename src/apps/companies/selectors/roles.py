@@ -0,0 +1,59 @@
+from apps.companies.models import Membership
+
+# Attribute used to memoize roles on the user instance. request.user lives
+# for exactly one request, so the memo is naturally request-scoped.
+_ROLES_ATTR = "_company_roles"
+
+
+def get_user_roles(*, user):
+    """
+    Returns {company_id: role} for every company the user belongs to.
+    All memberships are loaded with a single query and reused by
+    permissions, selectors and services for the rest of the request.
+    """
+    if not user.is_authenticated:
+        return {}
+
+    roles = user.__dict__.get(_ROLES_ATTR)
+    if roles is None:
+        roles = dict(
+            Membership.objects.filter(user=user).values_list("company_id", "role")
+        )
+        user.__dict__[_ROLES_ATTR] = roles
+    return roles
+
+
+def prime_user_roles(*, user, roles):
+    """
+    Seeds the memo with roles known from elsewhere (e.g. token claims).
+    """
+    user.__dict__[_ROLES_ATTR] = roles
+
+
+def invalidate_user_roles(*, user):
+    """
+    Drops the memoized roles so the next lookup hits the database.
+    """
+    user.__dict__.pop(_ROLES_ATTR, None)
+
+
+def get_user_company_ids(*, user):
+    """
+    Returns the IDs of every company the user is a member of.
+    """
+    return list(get_user_roles(user=user))
+
+
+def get_company_role(*, user, company_id):
+    """
+    Returns the user's role in the company, or None if not a member.
+    """
+    return get_user_roles(user=user).get(company_id)
+
+
+def has_company_role(*, user, company_id, roles):
+    return get_company_role(user=user, company_id=company_id) in roles
+
+
+def is_company_admin(*, user, company_id):
+    return get_company_role(user=user, company_id=company_id) == Membership.Role.ADMIN
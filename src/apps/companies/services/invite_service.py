@@ -1,7 +1,12 @@
 from django.core.exceptions import ValidationError
 from django.contrib.auth import get_user_model
+from django.db import IntegrityError, transaction
+from django.db.models.functions import Lower
 
+from apps.common.outbox import enqueue_task
 from apps.companies.models import Invite, Membership
+from apps.companies.selectors.roles import get_company_role, is_company_admin
+from apps.companies.tasks import send_bulk_invite_email_task
 
 User = get_user_model()
 
@@ -31,6 +36,57 @@ def send_invite(*, email, company, role, invited_by):
     return invite
 
 
+def send_bulk_invites(*, emails, company, role, invited_by):
+    """
+    Invite many emails at once.
+    Emails that already belong to a member or already have an invite for
+    this company are skipped, found with a single query. The rest are
+    inserted with one bulk_create and emailed by one background task,
+    queued through the outbox in the same transaction.
+    Only admins should be allowed (checked in view layer).
+
+    Returns (invites, skipped_emails).
+    """
+    # Preserve request order, drop duplicates within the request. Emails
+    # are compared case-insensitively, as accepting an invite does.
+    emails = list(dict.fromkeys(email.strip().lower() for email in emails))
+
+    # (email, company) is unique for every status, so any existing
+    # invite blocks a new one, not only pending ones.
+    # order_by() drops the default ordering, not allowed inside a UNION.
+    taken = set(
+        Membership.objects.filter(company=company)
+        .annotate(email_lower=Lower("user__email"))
+        .filter(email_lower__in=emails)
+        .order_by()
+        .values_list("email_lower", flat=True)
+        .union(
+            Invite.objects.filter(company=company)
+            .annotate(email_lower=Lower("email"))
+            .filter(email_lower__in=emails)
+            .order_by()
+            .values_list("email_lower", flat=True)
+        )
+    )
+
+    skipped = [email for email in emails if email in taken]
+    invites = [
+        Invite(email=email, company=company, role=role, invited_by=invited_by)
+        for email in emails
+        if email not in taken
+    ]
+
+    try:
+        with transaction.atomic():
+            invites = Invite.objects.bulk_create(invites)
+            if invites:
+                enqueue_task(send_bulk_invite_email_task, [invite.id for invite in invites])
+    except IntegrityError:
+        raise ValidationError("Some of these emails were invited concurrently. Please retry.")
+
+    return invites, skipped
+
+
 def accept_invite(*, invite, user):
 
     if invite.status != Invite.Status.PENDING:
@@ -39,7 +95,7 @@ def accept_invite(*, invite, user):
     if invite.email.lower() != user.email.lower():
         raise ValidationError("This invite is not for your account.")
 
-    if Membership.objects.filter(user=user, company=invite.company).exists():
+    if get_company_role(user=user, company_id=invite.company_id) is not None:
         raise ValidationError("Already a member of this company.")
 
     membership = Membership.objects.create(
@@ -78,13 +134,7 @@ def cancel_invite(*, invite, cancelled_by):
     if invite.status != Invite.Status.PENDING:
         raise ValidationError("Only pending invites can be cancelled.")
 
-    is_admin = Membership.objects.filter(
-        company=invite.company,
-        user=cancelled_by,
-        role=Membership.Role.ADMIN
-    ).exists()
-
-    if not is_admin:
+    if not is_company_admin(user=cancelled_by, company_id=invite.company_id):
         raise ValidationError("Only company admins can cancel invites.")
 
     invite.status = Invite.Status.CANCELLED
@@ -94,11 +144,13 @@ def cancel_invite(*, invite, cancelled_by):
 def list_user_invites(*, user):
     """
     Returns all pending invites for the logged-in user.
+    Emails are matched on LOWER(email), which invite_email_lower_status_idx
+    covers; email__iexact would compile to a scan.
     """
-    return Invite.objects.filter(
-        email__iexact=user.email,
+    return Invite.objects.annotate(email_lower=Lower("email")).filter(
+        email_lower=user.email.lower(),
         status=Invite.Status.PENDING
-    ).select_related("company")    
+    ).select_related("company")
 
 
 def list_sent_invites(*, user):
@@ -1,5 +1,6 @@
 from django.core.exceptions import ValidationError
 from apps.companies.models import Membership
+from apps.companies.selectors.roles import is_company_admin
 from django.db import transaction
 
 
@@ -9,6 +10,9 @@ def change_member_role(*, membership, new_role, changed_by):
     Only admins can change roles.
     Cannot remove last admin.
     """
+    if not is_company_admin(user=changed_by, company_id=membership.company_id):
+        raise ValidationError("Only company admins can change roles.")
+
     with transaction.atomic():
         membership = Membership.objects.select_for_update().get(id=membership.id)
 
@@ -31,6 +35,9 @@ def remove_member(*, membership, removed_by):
     Remove a member from company.
     Prevent removing last admin.
     """
+    if not is_company_admin(user=removed_by, company_id=membership.company_id):
+        raise ValidationError("Only company admins can remove members.")
+
     with transaction.atomic():
         membership = Membership.objects.select_for_update().get(id=membership.id)
 
@@ -0,0 +1,23 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.companies.cache import bump_membership_version
+from apps.companies.models import Membership
+from apps.companies.selectors.roles import invalidate_user_roles
+
+
+@receiver(post_save, sender=Membership)
+@receiver(post_delete, sender=Membership)
+def membership_changed(sender, instance, **kwargs):
+    """
+    Keep memoized roles in sync when a membership is created, changed
+    or deleted. Only a user instance already attached to the membership
+    can hold a memo, so an unloaded user is left alone (no extra query).
+    Bumping the membership version sends tokens issued before the
+    change (and the roles they carry) back to the database.
+    """
+    bump_membership_version(user_id=instance.user_id)
+
+    user_field = Membership._meta.get_field("user")
+    if user_field.is_cached(instance):
+        invalidate_user_roles(user=instance.user)
@@ -1,29 +1,58 @@
 from celery import shared_task
-from apps.emails.services import send_email
+from django.conf import settings
+from apps.emails.services import DeliveryError, send_bulk_email
+from apps.emails.templating import render_bulk, render_email
 from .models import Invite
 
-@shared_task(bind=True, autoretry_for=(Exception,), retry_kwargs={"max_retries": 3, "countdown": 10})
+
+def _invite_context(invite):
+    return {"company_name": invite.company.name, "role": invite.role}
+
+
+@shared_task(bind=True, ignore_result=True, autoretry_for=(Exception,), retry_kwargs={"max_retries": 3, "countdown": 10})
 def send_invite_email_task(self, invite_id: int):
     try:
         # select_related avoids extra DB queries for company details
         invite = Invite.objects.select_related('company').get(id=invite_id)
-        
+
         # invite = CompanyInvite.objects.get(id=invite_id)
 
     except Invite.DoesNotExist:
         return f"Invite {invite_id} not found."
 
-    subject = f"You are invited to join {invite.company.name}"
-    body = (
-        f"Hi,\n\n"
-        f"You have been invited to join {invite.company.name} as a {invite.role}.\n"
-        f"Please log in to your account to accept or reject the invitation.\n\n"
-        f"Thanks,\nATS Team"
-    )
-
     # Uses centralized service
-    send_email(
-        to_email=invite.email,
-        subject=subject,
-        body=body,
-    )
\ No newline at end of file
+    send_bulk_email([
+        render_email("invite", _invite_context(invite), to_email=invite.email)
+    ])
+
+
+@shared_task(bind=True, ignore_result=True, max_retries=3)
+def send_bulk_invite_email_task(self, invite_ids: list):
+    """
+    Emails a batch of invites in chunks over the pooled SMTP connection.
+    On failure only the invites not yet sent are retried; addresses the
+    server rejects are skipped, not retried.
+    """
+    chunk_size = settings.EMAIL_BATCH_SIZE
+
+    for start in range(0, len(invite_ids), chunk_size):
+        chunk = invite_ids[start:start + chunk_size]
+
+        # Invites cancelled since they were created are not emailed
+        invites = list(Invite.objects.select_related("company").filter(
+            id__in=chunk, status=Invite.Status.PENDING
+        ))
+
+        messages = render_bulk("invite", [
+            (invite.email, _invite_context(invite)) for invite in invites
+        ])
+
+        try:
+            send_bulk_email(messages)
+        except DeliveryError as exc:
+            unsent = [invite.id for invite in invites[exc.handled:]]
+            raise self.retry(exc=exc, args=[unsent + invite_ids[start + chunk_size:]], countdown=10)
+        except Exception as exc:
+            raise self.retry(exc=exc, args=[invite_ids[start:]], countdown=10)
+
+    return len(invite_ids)
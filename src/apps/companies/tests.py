@@ -1,3 +1,251 @@
-from django.test import TestCase
+from unittest import mock
 
-# Create your tests here.
+from celery.exceptions import Retry
+from django.contrib.auth import get_user_model
+from django.db import IntegrityError
+from django.test import TestCase, override_settings
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.common.models import OutboxMessage
+from apps.common.testing import QueryPlanMixin
+from apps.companies.models import Company, Invite, Membership
+from apps.companies.services.company_service import create_company
+from apps.companies.services.invite_service import cancel_invite, list_user_invites, send_invite
+from apps.companies.tasks import send_bulk_invite_email_task
+from apps.emails.services import delivery
+from apps.emails.testing import FakeConnection
+
+User = get_user_model()
+
+
+class CompanyIndexTests(QueryPlanMixin, TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(
+            email="admin@example.com",
+            password="pass",
+            first_name="Admin",
+            last_name="User",
+            dob="1990-01-01",
+        )
+        cls.company = Company.objects.create(name="Acme", created_by=cls.admin)
+        Membership.objects.create(user=cls.admin, company=cls.company, role=Membership.Role.ADMIN)
+        Invite.objects.bulk_create([
+            Invite(
+                email=f"candidate{i}@example.com",
+                company=cls.company,
+                role=Membership.Role.RECRUITER,
+                invited_by=cls.admin,
+            )
+            for i in range(30)
+        ])
+
+    def test_role_check_uses_user_company_unique_index(self):
+        queryset = Membership.objects.filter(
+            company=self.company,
+            user=self.admin,
+            role__in=[Membership.Role.ADMIN, Membership.Role.RECRUITER],
+        )
+        self.assertUsesIndex(queryset, "membership_user_id_company_id")
+
+    def test_admin_count_uses_membership_role_index(self):
+        queryset = Membership.objects.filter(company=self.company, role=Membership.Role.ADMIN)
+        self.assertUsesIndex(queryset, "member_company_role_idx")
+
+    def test_received_invites_use_email_status_index(self):
+        queryset = list_user_invites(user=User(email="Candidate1@Example.com"))
+        self.assertUsesIndex(queryset, "invite_email_lower_status_idx")
+        self.assertEqual(queryset.count(), 1)
+
+    def test_sent_invites_use_invited_by_status_index(self):
+        queryset = Invite.objects.filter(invited_by=self.admin, status=Invite.Status.PENDING)
+        self.assertUsesIndex(queryset, "invite_invited_by_status_idx")
+
+
+class ConditionalGetTests(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(
+            email="admin@example.com",
+            password="pass",
+            first_name="Admin",
+            last_name="User",
+            dob="1990-01-01",
+        )
+        cls.company = create_company(name="Acme", description="", created_by=cls.admin)
+
+    def setUp(self):
+        # Real JWT auth, so each request loads its own user (and role memo)
+        token = RefreshToken.for_user(self.admin).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def test_my_companies_returns_304_without_serializing(self):
+        etag = self.client.get("/api/companies/mine/")["ETag"]
+
+        # user + memberships + company aggregate
+        with self.assertNumQueries(3):
+            response = self.client.get("/api/companies/mine/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_my_companies_etag_changes_when_joining_a_company(self):
+        etag = self.client.get("/api/companies/mine/")["ETag"]
+
+        other = Company.objects.create(name="Globex", created_by=self.admin)
+        Membership.objects.create(user=self.admin, company=other, role=Membership.Role.RECRUITER)
+
+        response = self.client.get("/api/companies/mine/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data), 2)
+
+    def test_my_companies_etag_changes_when_a_company_is_edited(self):
+        etag = self.client.get("/api/companies/mine/")["ETag"]
+
+        self.company.name = "Acme Corp"
+        self.company.save()
+
+        response = self.client.get("/api/companies/mine/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data[0]["name"], "Acme Corp")
+
+    def test_my_invites_returns_304_without_serializing(self):
+        send_invite(
+            email="recruiter@example.com",
+            company=self.company,
+            role=Membership.Role.RECRUITER,
+            invited_by=self.admin,
+        )
+        etag = self.client.get("/api/companies/my-invites/")["ETag"]
+
+        # user + invite aggregate
+        with self.assertNumQueries(2):
+            response = self.client.get("/api/companies/my-invites/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_my_invites_etag_changes_when_invite_is_cancelled(self):
+        invite = send_invite(
+            email="recruiter@example.com",
+            company=self.company,
+            role=Membership.Role.RECRUITER,
+            invited_by=self.admin,
+        )
+        etag = self.client.get("/api/companies/my-invites/")["ETag"]
+
+        cancel_invite(invite=invite, cancelled_by=self.admin)
+
+        response = self.client.get("/api/companies/my-invites/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["sent"][0]["status"], Invite.Status.CANCELLED)
+
+
+class BulkInviteTests(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(
+            email="admin@example.com",
+            password="pass",
+            first_name="Admin",
+            last_name="User",
+            dob="1990-01-01",
+        )
+        cls.company = create_company(name="Acme", description="", created_by=cls.admin)
+        cls.url = f"/api/companies/{cls.company.id}/invite/bulk/"
+
+    def setUp(self):
+        token = RefreshToken.for_user(self.admin).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def post(self, emails):
+        return self.client.post(self.url, {"emails": emails, "role": Membership.Role.RECRUITER}, format="json")
+
+    def test_skips_members_and_existing_invites(self):
+        send_invite(
+            email="invited@example.com",
+            company=self.company,
+            role=Membership.Role.RECRUITER,
+            invited_by=self.admin,
+        )
+
+        # Emails differing only in case are the same address
+        response = self.post(
+            ["new@example.com", "Admin@Example.com", "INVITED@example.com", "New@example.com "]
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual([invite["email"] for invite in response.data["invites"]], ["new@example.com"])
+        self.assertEqual(response.data["skipped"], ["admin@example.com", "invited@example.com"])
+        message = OutboxMessage.objects.get()
+        self.assertEqual(message.task_name, "apps.companies.tasks.send_bulk_invite_email_task")
+        self.assertEqual(message.args, [[response.data["invites"][0]["id"]]])
+
+    def test_query_count_does_not_grow_with_batch_size(self):
+        emails = [f"candidate{i}@example.com" for i in range(100)]
+
+        # user + role check + company + dedupe + savepoint/insert/outbox/release
+        with self.assertNumQueries(8):
+            self.post(emails)
+
+        self.assertEqual(Invite.objects.filter(company=self.company).count(), 100)
+        self.assertEqual(len(OutboxMessage.objects.get().args[0]), 100)
+
+    def test_concurrent_invite_is_a_bad_request(self):
+        with mock.patch.object(Invite.objects, "bulk_create", side_effect=IntegrityError):
+            response = self.post(["new@example.com"])
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(OutboxMessage.objects.exists())
+
+
+@override_settings(EMAIL_BATCH_SIZE=3)
+class BulkInviteEmailTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(
+            email="admin@example.com",
+            password="pass",
+            first_name="Admin",
+            last_name="User",
+            dob="1990-01-01",
+        )
+        cls.company = create_company(name="Acme", description="", created_by=cls.admin)
+        cls.invites = Invite.objects.bulk_create([
+            Invite(email=f"candidate{i}@example.com", company=cls.company, role=Membership.Role.RECRUITER, invited_by=cls.admin)
+            for i in range(5)
+        ])
+        cls.ids = [invite.id for invite in cls.invites]
+
+    def setUp(self):
+        # The pooled connection outlives a single test
+        delivery.close()
+        self.addCleanup(delivery.close)
+        self.outbox = []
+
+    def send(self, *connections):
+        with mock.patch("apps.emails.services.get_connection", side_effect=connections), \
+                mock.patch.object(send_bulk_invite_email_task, "retry", side_effect=Retry) as retry:
+            try:
+                send_bulk_invite_email_task(self.ids)
+            except Retry:
+                pass
+        return retry
+
+    def test_refused_recipient_mid_chunk_is_skipped(self):
+        retry = self.send(FakeConnection(self.outbox, refuse={"candidate1@example.com"}))
+
+        retry.assert_not_called()
+        self.assertEqual(sorted(self.outbox), [f"candidate{i}@example.com" for i in (0, 2, 3, 4)])
+
+    def test_retry_resumes_after_the_last_sent_invite(self):
+        # Drops after the 4th message, and again after reconnecting
+        retry = self.send(FakeConnection(self.outbox, fail_after=4), FakeConnection(self.outbox, fail_after=4))
+
+        self.assertEqual(len(self.outbox), 4)
+        [unsent] = retry.call_args.kwargs["args"]
+        self.assertEqual(
+            sorted(Invite.objects.filter(id__in=unsent).values_list("email", flat=True)),
+            sorted(invite.email for invite in self.invites if invite.email not in self.outbox),
+        )
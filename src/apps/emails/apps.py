@@ -3,3 +3,10 @@ from django.apps import AppConfig
 class EmailsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.emails"   # must match folder path
+
+    def ready(self):
+        from celery.signals import worker_process_shutdown
+        from .services import delivery
+
+        # Close the pooled SMTP connection when a worker process exits
+        worker_process_shutdown.connect(lambda **kwargs: delivery.close(), weak=False)
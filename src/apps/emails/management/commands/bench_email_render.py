@@ -0,0 +1,49 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.companies.models import Company, Membership
+from apps.emails.templating import render_bulk, render_email
+
+
+class Command(BaseCommand):
+    help = (
+        "Renders invite emails (subject, text and HTML) for a batch of "
+        "in-memory invites and reports throughput of one bulk render versus "
+        "rendering message by message, each looking its templates up with "
+        "get_template (through Django's cached loader)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--count", type=int, default=10000)
+
+    def handle(self, *args, **options):
+        count = options["count"]
+        company = Company(name="Acme & Sons")
+        recipients = [
+            (f"invitee-{i}@example.com", {"company_name": company.name, "role": Membership.Role.RECRUITER})
+            for i in range(count)
+        ]
+
+        # Warm the template loader cache, as a running worker would be
+        render_bulk("invite", recipients[:1])
+
+        start = time.perf_counter()
+        messages = render_bulk("invite", recipients)
+        bulk = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for to_email, context in recipients:
+            render_email("invite", context, to_email=to_email)
+        single = time.perf_counter() - start
+
+        assert len(messages) == count
+        self._report("bulk render", count, bulk)
+        self._report("one by one", count, single)
+        self.stdout.write(f"Bulk throughput: {single / bulk:.2f}x one by one")
+
+    def _report(self, label, count, seconds):
+        self.stdout.write(
+            f"{label:20} {count} emails in {seconds:.2f}s "
+            f"({count / seconds:,.0f}/s, {seconds / count * 1e6:.0f} µs each)"
+        )
@@ -1,22 +1,136 @@
-from django.core.mail import send_mail
+import logging
+import smtplib
+import threading
+import time
+
+from django.core.mail import get_connection
 from django.conf import settings
 
-def send_email(to_email: str, subject: str, body: str, from_email: str = None):
+from apps.common import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class DeliveryError(Exception):
+    """
+    Sending stopped part way. The first `handled` messages were sent (or
+    rejected and skipped) and must not be sent again; the cause is
+    chained as __cause__.
+    """
+
+    def __init__(self, handled):
+        super().__init__(f"Delivery stopped after {handled} messages")
+        self.handled = handled
+
+
+def _is_rejected(exc):
+    # The server refused this message for good (unknown mailbox, content
+    # rejected); retrying would fail again, and the connection stays usable
+    if isinstance(exc, smtplib.SMTPRecipientsRefused):
+        return True
+    return isinstance(exc, smtplib.SMTPDataError) and exc.smtp_code >= 500
+
+
+class MailDelivery:
+    """
+    Keeps one long-lived SMTP connection per worker process and sends
+    messages over it in bursts with `send_messages`, instead of a new
+    connection + TLS handshake per email.
+    """
+
+    def __init__(self):
+        self._connection = None
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def _get_connection(self):
+        max_age = getattr(settings, "EMAIL_CONNECTION_MAX_AGE", 300)
+        if self._connection is not None and time.monotonic() - self._opened_at > max_age:
+            # Servers drop idle sessions; recycle before that happens
+            self._close()
+
+        if self._connection is None:
+            self._connection = get_connection(fail_silently=False)
+            self._connection.open()
+            self._opened_at = time.monotonic()
+        return self._connection
+
+    def _close(self):
+        if self._connection is not None:
+            try:
+                self._connection.close()
+            except Exception:
+                logger.warning("Failed to close SMTP connection cleanly", exc_info=True)
+            self._connection = None
+
+    def close(self):
+        with self._lock:
+            self._close()
+
+    def send(self, messages):
+        """
+        Sends messages in bursts of EMAIL_BATCH_SIZE.
+        Returns the number of messages sent; messages the server rejects
+        are logged and skipped. Raises DeliveryError if sending stops.
+        """
+        batch_size = getattr(settings, "EMAIL_BATCH_SIZE", 50)
+        sent = 0
+
+        with self._lock:
+            for start in range(0, len(messages), batch_size):
+                try:
+                    sent += self._send_burst(messages[start:start + batch_size])
+                except DeliveryError as exc:
+                    raise DeliveryError(start + exc.handled) from exc.__cause__
+        return sent
+
+    def _send_burst(self, burst):
+        """
+        Sends the burst over the pooled connection one message at a time,
+        so a dropped connection is resumed from the message it failed on
+        instead of resending what already went out. Reconnects once per
+        burst; any other failure raises DeliveryError with the position
+        reached.
+        """
+        sent = position = 0
+        reconnected = False
+
+        try:
+            while position < len(burst):
+                started = time.perf_counter()
+                try:
+                    sent += self._get_connection().send_messages(burst[position:position + 1]) or 0
+                except (smtplib.SMTPServerDisconnected, ConnectionError):
+                    if reconnected:
+                        raise
+                    # The pooled connection went stale: reconnect and resume
+                    logger.info("SMTP connection lost after %d of %d messages, reconnecting", position, len(burst))
+                    self._close()
+                    reconnected = True
+                    continue
+                except smtplib.SMTPException as exc:
+                    if not _is_rejected(exc):
+                        raise
+                    logger.warning("SMTP server rejected mail to %s: %s", ", ".join(burst[position].to), exc)
+                    metrics.increment("emails.rejected")
+                else:
+                    metrics.observe("emails.send_latency_ms", (time.perf_counter() - started) * 1000)
+                position += 1
+        except Exception as exc:
+            raise DeliveryError(position) from exc
+        finally:
+            metrics.increment("emails.sent", sent)
+            metrics.increment("emails.bursts")
+        return sent
+
+
+# One delivery (and so one SMTP connection) per worker process
+delivery = MailDelivery()
+
+
+def send_bulk_email(messages):
     """
-    Sends an email using Django's email backend.
-    
-    Parameters:
-        to_email (str): recipient email
-        subject (str): email subject
-        body (str): email body text
-        from_email (str, optional): sender email. Defaults to settings.DEFAULT_FROM_EMAIL
+    Sends many prepared messages over the pooled connection.
+    Returns the number of messages sent; see MailDelivery.send.
     """
-    from_email = from_email or getattr(settings, "DEFAULT_FROM_EMAIL", "no-reply@example.com")
-
-    send_mail(
-        subject=subject,
-        message=body,
-        from_email=from_email,
-        recipient_list=[to_email],
-        fail_silently=False,  # Raise errors in development; can set True in prod if needed
-    )
+    return delivery.send(list(messages))
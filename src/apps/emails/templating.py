@@ -0,0 +1,47 @@
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives
+from django.template.loader import get_template
+
+# Every email is a directory under templates/emails/ holding these parts
+SUBJECT = "subject.txt"
+TEXT_BODY = "body.txt"
+HTML_BODY = "body.html"
+
+
+def get_email_templates(email: str):
+    """
+    Returns the (subject, text, html) templates of emails/<email>/.
+    Django's cached template loader (on whenever TEMPLATES sets no
+    explicit loaders) compiles each one once per worker process.
+    """
+    return tuple(get_template(f"emails/{email}/{part}") for part in (SUBJECT, TEXT_BODY, HTML_BODY))
+
+
+def render_email(email: str, context: dict, *, to_email: str, from_email: str = None) -> EmailMultiAlternatives:
+    """
+    Renders emails/<email>/ into a multipart (text + HTML) message.
+    """
+    return render_bulk(email, [(to_email, context)], from_email=from_email)[0]
+
+
+def render_bulk(email: str, recipients, *, from_email: str = None) -> list:
+    """
+    Renders one message per (to_email, context) pair, looking the
+    templates up once for the whole batch.
+    """
+    subject_template, text_template, html_template = get_email_templates(email)
+    from_email = from_email or getattr(settings, "DEFAULT_FROM_EMAIL", "no-reply@example.com")
+
+    messages = []
+    for to_email, context in recipients:
+        # Subjects must be a single line
+        subject = " ".join(subject_template.render(context).split())
+        message = EmailMultiAlternatives(
+            subject=subject,
+            body=text_template.render(context),
+            from_email=from_email,
+            to=[to_email],
+        )
+        message.attach_alternative(html_template.render(context), "text/html")
+        messages.append(message)
+    return messages
@@ -0,0 +1,28 @@
+import smtplib
+
+
+class FakeConnection:
+    """
+    An SMTP connection that drops after `fail_after` messages and
+    refuses the addresses in `refuse`.
+    """
+
+    def __init__(self, outbox, fail_after=None, refuse=()):
+        self.outbox = outbox
+        self.fail_after = fail_after
+        self.refuse = set(refuse)
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def send_messages(self, messages):
+        for message in messages:
+            if self.fail_after is not None and len(self.outbox) >= self.fail_after:
+                raise smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+            if message.to[0] in self.refuse:
+                raise smtplib.SMTPRecipientsRefused({message.to[0]: (550, b"No such user")})
+            self.outbox.append(message.to[0])
+        return len(messages)
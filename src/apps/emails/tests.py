@@ -0,0 +1,52 @@
+import smtplib
+from unittest import mock
+
+from django.core.mail import EmailMessage
+from django.test import SimpleTestCase, override_settings
+
+from apps.common import metrics
+from apps.emails.services import DeliveryError, MailDelivery
+from apps.emails.testing import FakeConnection
+
+
+@override_settings(EMAIL_BATCH_SIZE=10, METRICS_LOG_INTERVAL=0)
+class MailDeliveryTests(SimpleTestCase):
+
+    def setUp(self):
+        metrics.reset()
+        self.outbox = []
+        self.messages = [EmailMessage(subject="Hi", body="...", to=[f"user{i}@example.com"]) for i in range(5)]
+
+    def test_one_connection_for_every_burst(self):
+        with mock.patch("apps.emails.services.get_connection", return_value=FakeConnection(self.outbox)) as connect:
+            self.assertEqual(MailDelivery().send(self.messages * 3), 15)
+
+        self.assertEqual(connect.call_count, 1)
+        snapshot = metrics.snapshot()
+        self.assertEqual(snapshot["counters"]["emails.bursts"], 2)
+        self.assertEqual(snapshot["timings"]["emails.send_latency_ms"]["count"], 15)
+
+    def test_dropped_connection_resumes_without_resending(self):
+        connections = [FakeConnection(self.outbox, fail_after=2), FakeConnection(self.outbox)]
+        with mock.patch("apps.emails.services.get_connection", side_effect=connections):
+            self.assertEqual(MailDelivery().send(self.messages), 5)
+
+        self.assertEqual(self.outbox, [message.to[0] for message in self.messages])
+
+    def test_second_drop_in_a_burst_propagates(self):
+        connections = [FakeConnection(self.outbox, fail_after=1), FakeConnection(self.outbox, fail_after=2)]
+        with mock.patch("apps.emails.services.get_connection", side_effect=connections):
+            with self.assertRaises(DeliveryError) as raised:
+                MailDelivery().send(self.messages)
+
+        self.assertEqual(len(self.outbox), 2)
+        self.assertEqual(raised.exception.handled, 2)
+        self.assertIsInstance(raised.exception.__cause__, smtplib.SMTPServerDisconnected)
+
+    def test_rejected_recipient_is_skipped(self):
+        connection = FakeConnection(self.outbox, refuse={"user2@example.com"})
+        with mock.patch("apps.emails.services.get_connection", return_value=connection):
+            self.assertEqual(MailDelivery().send(self.messages), 4)
+
+        self.assertEqual(self.outbox, ["user0@example.com", "user1@example.com", "user3@example.com", "user4@example.com"])
+        self.assertEqual(metrics.snapshot()["counters"]["emails.rejected"], 1)
@@ -0,0 +1,61 @@
+from rest_framework import serializers
+
+from apps.applications.models import Application
+from apps.interviews.models import BusyBlock, Interview
+
+
+class InterviewSerializer(serializers.ModelSerializer):
+    job_title = serializers.ReadOnlyField(source="application.job.title")
+    candidate_email = serializers.ReadOnlyField(source="application.candidate.email")
+    interviewers = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Interview
+        fields = [
+            "id",
+            "application",
+            "job_title",
+            "candidate_email",
+            "interviewers",
+            "starts_at",
+            "ends_at",
+            "location",
+            "status",
+            "created_at",
+        ]
+
+    def get_interviewers(self, interview) -> list[int]:
+        return [block.user_id for block in interview.busy_blocks.all()]
+
+
+class ScheduleInterviewSerializer(serializers.Serializer):
+    # The job's company is checked, the candidate is shown in the response
+    application = serializers.PrimaryKeyRelatedField(
+        queryset=Application.objects.select_related("job", "candidate")
+    )
+    interviewers = serializers.ListField(child=serializers.IntegerField(), allow_empty=False)
+    starts_at = serializers.DateTimeField()
+    ends_at = serializers.DateTimeField()
+    location = serializers.CharField(max_length=255, required=False, allow_blank=True, default="")
+
+
+class AvailabilityQuerySerializer(serializers.Serializer):
+    company = serializers.IntegerField()
+    # Repeat the parameter: ?interviewers=1&interviewers=2
+    interviewers = serializers.ListField(child=serializers.IntegerField(), allow_empty=False)
+    start = serializers.DateTimeField()
+    end = serializers.DateTimeField()
+    # Minutes
+    duration = serializers.IntegerField(min_value=5, max_value=8 * 60, default=60)
+
+
+class SlotSerializer(serializers.Serializer):
+    starts_at = serializers.DateTimeField()
+    ends_at = serializers.DateTimeField()
+
+
+class BusyBlockSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = BusyBlock
+        fields = ["id", "interview", "starts_at", "ends_at", "note"]
+        read_only_fields = ["interview"]
@@ -0,0 +1,18 @@
+from django.urls import path
+from .views import (
+    AvailabilityView,
+    BusyBlockDetailView,
+    BusyBlocksView,
+    CancelInterviewView,
+    MyInterviewsView,
+    ScheduleInterviewView,
+)
+
+urlpatterns = [
+    path("", ScheduleInterviewView.as_view()),
+    path("mine/", MyInterviewsView.as_view()),
+    path("availability/", AvailabilityView.as_view()),
+    path("<int:interview_id>/cancel/", CancelInterviewView.as_view()),
+    path("busy/", BusyBlocksView.as_view()),
+    path("busy/<int:block_id>/", BusyBlockDetailView.as_view()),
+]
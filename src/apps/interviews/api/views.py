@@ -0,0 +1,147 @@
+from datetime import timedelta
+
+from django.core.exceptions import ValidationError
+from django.shortcuts import get_object_or_404
+from rest_framework import status
+from rest_framework.generics import GenericAPIView, ListAPIView
+from rest_framework.response import Response
+from drf_spectacular.utils import extend_schema
+
+from apps.common.pagination import KeysetPagination
+from apps.interviews.models import BusyBlock, Interview
+from apps.interviews.selectors.interview_selector import list_user_busy_blocks, list_user_interviews
+from apps.interviews.services.interview_service import (
+    add_busy_block,
+    cancel_interview,
+    delete_busy_block,
+    find_panel_slots,
+    schedule_interview,
+)
+
+from .serializers import (
+    AvailabilityQuerySerializer,
+    BusyBlockSerializer,
+    InterviewSerializer,
+    ScheduleInterviewSerializer,
+    SlotSerializer,
+)
+
+
+def _error(e):
+    return Response({"detail": e.messages}, status=status.HTTP_400_BAD_REQUEST)
+
+
+class UpcomingPagination(KeysetPagination):
+    # Soonest first
+    ordering = ("starts_at", "id")
+
+
+class ScheduleInterviewView(GenericAPIView):
+    serializer_class = ScheduleInterviewSerializer
+
+    def post(self, request):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            interview = schedule_interview(
+                application=serializer.validated_data["application"],
+                interviewer_ids=serializer.validated_data["interviewers"],
+                starts_at=serializer.validated_data["starts_at"],
+                ends_at=serializer.validated_data["ends_at"],
+                location=serializer.validated_data["location"],
+                scheduled_by=request.user,
+            )
+        except ValidationError as e:
+            return _error(e)
+
+        return Response(InterviewSerializer(interview).data, status=status.HTTP_201_CREATED)
+
+
+class MyInterviewsView(ListAPIView):
+    """
+    Upcoming interviews the user is on the panel of.
+    """
+    serializer_class = InterviewSerializer
+    pagination_class = UpcomingPagination
+
+    def get_queryset(self):
+        return list_user_interviews(user=self.request.user)
+
+
+class AvailabilityView(GenericAPIView):
+    """
+    Common free slots of a panel: working-hour gaps of at least
+    `duration` minutes between `start` and `end` in which every
+    interviewer is free.
+    """
+    serializer_class = SlotSerializer
+
+    @extend_schema(parameters=[AvailabilityQuerySerializer])
+    def get(self, request):
+        query = AvailabilityQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+
+        try:
+            slots = find_panel_slots(
+                company_id=query.validated_data["company"],
+                interviewer_ids=query.validated_data["interviewers"],
+                start=query.validated_data["start"],
+                end=query.validated_data["end"],
+                duration=timedelta(minutes=query.validated_data["duration"]),
+                requested_by=request.user,
+            )
+        except ValidationError as e:
+            return _error(e)
+
+        slots = [{"starts_at": starts_at, "ends_at": ends_at} for starts_at, ends_at in slots]
+        return Response({"slots": self.get_serializer(slots, many=True).data})
+
+
+class CancelInterviewView(GenericAPIView):
+    serializer_class = InterviewSerializer
+
+    def post(self, request, interview_id):
+        interview = get_object_or_404(
+            Interview.objects.select_related("application__job", "application__candidate"), id=interview_id
+        )
+        try:
+            cancel_interview(interview=interview, cancelled_by=request.user)
+        except ValidationError as e:
+            return _error(e)
+        return Response(self.get_serializer(interview).data)
+
+
+class BusyBlocksView(ListAPIView):
+    """
+    GET: the user's own upcoming busy blocks.
+    POST: block time on the user's calendar.
+    """
+    serializer_class = BusyBlockSerializer
+    pagination_class = UpcomingPagination
+
+    def get_queryset(self):
+        return list_user_busy_blocks(user=self.request.user)
+
+    def post(self, request):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            block = add_busy_block(user=request.user, **serializer.validated_data)
+        except ValidationError as e:
+            return _error(e)
+
+        return Response(self.get_serializer(block).data, status=status.HTTP_201_CREATED)
+
+
+class BusyBlockDetailView(GenericAPIView):
+    serializer_class = BusyBlockSerializer
+
+    def delete(self, request, block_id):
+        block = get_object_or_404(BusyBlock, id=block_id)
+        try:
+            delete_busy_block(block=block, deleted_by=request.user)
+        except ValidationError as e:
+            return _error(e)
+        return Response(status=status.HTTP_204_NO_CONTENT)
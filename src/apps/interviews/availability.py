@@ -0,0 +1,74 @@
+"""
+Common free time of an interview panel.
+
+Busy intervals of every panelist are fetched in one query, sorted by
+start, and merged into disjoint intervals in a single pass; the working
+windows are then swept against them with two pointers. Solving is
+O(n log n) in the number of busy intervals (the sort, done by the
+database) and never depends on how many candidate slots the range holds.
+"""
+from datetime import datetime, time, timedelta
+
+
+def merge_intervals(intervals):
+    """
+    Merges (start, end) pairs sorted by start into disjoint, sorted
+    intervals. Touching intervals are merged too.
+    """
+    merged = []
+    for start, end in intervals:
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1][1] = end
+        else:
+            merged.append([start, end])
+    return merged
+
+
+def working_windows(*, start, end, tz, day_start, day_end, weekdays=range(5)):
+    """
+    The (start, end) working hours between start and end, one window per
+    working day, in the tz time zone. Monday to Friday by default.
+    """
+    day = start.astimezone(tz).date()
+    last_day = end.astimezone(tz).date()
+    while day <= last_day:
+        if day.weekday() in weekdays:
+            opens = max(datetime.combine(day, day_start, tzinfo=tz), start)
+            closes = min(datetime.combine(day, day_end, tzinfo=tz), end)
+            if opens < closes:
+                yield opens, closes
+        day += timedelta(days=1)
+
+
+def free_slots(busy, *, windows, duration):
+    """
+    Gaps of at least `duration` inside the windows that no busy interval
+    covers. `busy` must be sorted by start; `windows` sorted and disjoint.
+    """
+    busy = merge_intervals(busy)
+    slots = []
+    first = 0
+    for opens, closes in windows:
+        # Busy intervals are sorted, so ones over before this window are
+        # over before every later one too
+        while first < len(busy) and busy[first][1] <= opens:
+            first += 1
+
+        cursor = opens
+        i = first
+        while i < len(busy) and busy[i][0] < closes:
+            if busy[i][0] - cursor >= duration:
+                slots.append((cursor, busy[i][0]))
+            cursor = max(cursor, busy[i][1])
+            i += 1
+        if closes - cursor >= duration:
+            slots.append((cursor, closes))
+    return slots
+
+
+def parse_time(value):
+    """
+    "09:00" -> time(9, 0), for the workday settings.
+    """
+    return value if isinstance(value, time) else time.fromisoformat(value)
@@ -0,0 +1,131 @@
+import random
+from datetime import datetime, time, timedelta
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.common.benchmarks import measure, rolled_back
+from apps.companies.models import Company, Membership
+from apps.companies.selectors.roles import prime_user_roles
+from apps.interviews.availability import free_slots, parse_time, working_windows
+from apps.interviews.models import BusyBlock
+from apps.interviews.services.interview_service import find_panel_slots
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        "Times the panel availability search: a seeded panel with a busy "
+        "calendar over a range of weeks, solved in memory and through "
+        "find_panel_slots (queries included). Fixtures are rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--panel", type=int, default=10, help="Interviewers on the panel")
+        parser.add_argument("--weeks", type=int, default=4, help="Length of the searched range")
+        parser.add_argument("--meetings", type=int, default=3, help="Meetings per interviewer per working day")
+        parser.add_argument("--duration", type=int, default=60, help="Interview length in minutes")
+        parser.add_argument("--rounds", type=int, default=20)
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        tz = timezone.get_current_timezone()
+        today = timezone.localdate()
+        # Next Monday, midnight
+        start = datetime.combine(today + timedelta(days=7 - today.weekday()), time(), tzinfo=tz)
+        end = start + timedelta(weeks=options["weeks"])
+        duration = timedelta(minutes=options["duration"])
+
+        calendars = self._calendars(
+            panel=options["panel"], start=start, end=end, meetings=options["meetings"], seed=options["seed"]
+        )
+        blocks = sum(len(calendar) for calendar in calendars)
+        self.stdout.write(
+            f"Panel of {options['panel']}, {options['weeks']} week(s) from {start:%Y-%m-%d}, "
+            f"{blocks} busy blocks, {options['duration']} min interviews"
+        )
+        self.stdout.write(f"{'path':28} {'p50 ms':>8} {'p95 ms':>8} {'queries':>8} {'slots':>6}")
+
+        day_start = parse_time(settings.INTERVIEW_WORKDAY_START)
+        day_end = parse_time(settings.INTERVIEW_WORKDAY_END)
+        busy = sorted(interval for calendar in calendars for interval in calendar)
+
+        def solve():
+            windows = working_windows(start=start, end=end, tz=tz, day_start=day_start, day_end=day_end)
+            return free_slots(busy, windows=windows, duration=duration)
+
+        self._report("in memory (sorted merge)", measure(solve, repeat=options["rounds"]), 0, len(solve()))
+
+        with rolled_back():
+            owner, company, panel = self._seed(calendars)
+
+            def search():
+                return find_panel_slots(
+                    company_id=company.id,
+                    interviewer_ids=[user.id for user in panel],
+                    start=start,
+                    end=end,
+                    duration=duration,
+                    requested_by=owner,
+                )
+
+            stats = measure(search, repeat=options["rounds"])
+            with CaptureQueriesContext(connection) as queries:
+                slots = search()
+            self._report("find_panel_slots (db)", stats, len(queries), len(slots))
+
+        # What a per-slot search would have asked the database
+        days = sum(1 for _ in working_windows(start=start, end=end, tz=tz, day_start=day_start, day_end=day_end))
+        per_day = (datetime.combine(today, day_end) - datetime.combine(today, day_start)) // timedelta(minutes=15)
+        self.stdout.write(
+            f"A per-slot search (15 min steps) would check {days * per_day} slots x "
+            f"{options['panel']} interviewers."
+        )
+
+    def _calendars(self, *, panel, start, end, meetings, seed):
+        """
+        Each interviewer's (start, end) meetings on working days, placed
+        at random half hours between 08:00 and 18:00; some overlap.
+        """
+        rng = random.Random(seed)
+        calendars = []
+        for _ in range(panel):
+            calendar = []
+            day = start
+            while day < end:
+                if day.weekday() < 5:
+                    for _ in range(meetings):
+                        begins = day + timedelta(hours=8, minutes=30 * rng.randrange(20))
+                        calendar.append((begins, begins + timedelta(minutes=rng.choice([30, 30, 60, 90]))))
+                day += timedelta(days=1)
+            calendars.append(calendar)
+        return calendars
+
+    def _seed(self, calendars):
+        suffix = random.randrange(10**9)
+        owner = User.objects.create(email=f"bench-owner-{suffix}@bench.example.com", first_name="Bench", last_name="Owner")
+        company = Company.objects.create(name=f"Bench Interviews {suffix}", created_by=owner)
+        panel = User.objects.bulk_create([
+            User(email=f"bench-panel-{suffix}-{i}@bench.example.com", first_name="Bench", last_name=str(i))
+            for i in range(len(calendars))
+        ])
+        Membership.objects.bulk_create(
+            [Membership(user=owner, company=company, role=Membership.Role.ADMIN)]
+            + [Membership(user=user, company=company, role=Membership.Role.HIRING_MANAGER) for user in panel]
+        )
+        BusyBlock.objects.bulk_create([
+            BusyBlock(user=user, starts_at=starts_at, ends_at=ends_at)
+            for user, calendar in zip(panel, calendars)
+            for starts_at, ends_at in calendar
+        ])
+        # As the token would: roles known without a query
+        prime_user_roles(user=owner, roles={company.id: Membership.Role.ADMIN})
+        return owner, company, panel
+
+    def _report(self, label, stats, queries, slots):
+        self.stdout.write(f"{label:28} {stats['p50']:8.2f} {stats['p95']:8.2f} {queries:8} {slots:6}")
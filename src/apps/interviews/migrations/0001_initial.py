@@ -0,0 +1,60 @@
+# Generated by Django 6.0.1 on 2026-10-18 10:00
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('applications', '0002_application_stage'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Interview',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('starts_at', models.DateTimeField()),
+                ('ends_at', models.DateTimeField()),
+                ('location', models.CharField(blank=True, max_length=255)),
+                ('status', models.CharField(choices=[('scheduled', 'Scheduled'), ('cancelled', 'Cancelled')], default='scheduled', max_length=20)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('application', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='interviews', to='applications.application')),
+                ('scheduled_by', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='interviews_scheduled', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['starts_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='BusyBlock',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('starts_at', models.DateTimeField()),
+                ('ends_at', models.DateTimeField()),
+                ('note', models.CharField(blank=True, max_length=255)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='busy_blocks', to=settings.AUTH_USER_MODEL)),
+                ('interview', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='busy_blocks', to='interviews.interview')),
+            ],
+            options={
+                'ordering': ['starts_at'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='interview',
+            index=models.Index(fields=['application', 'starts_at'], name='interview_app_starts_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='busyblock',
+            index=models.Index(fields=['user', 'ends_at'], name='busyblock_user_ends_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='busyblock',
+            constraint=models.CheckConstraint(condition=models.Q(('ends_at__gt', models.F('starts_at'))), name='busyblock_ends_after_start'),
+        ),
+    ]
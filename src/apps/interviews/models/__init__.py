@@ -0,0 +1,2 @@
+from .interview import Interview
+from .busy_block import BusyBlock
\ No newline at end of file
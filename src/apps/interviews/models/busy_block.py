@@ -0,0 +1,51 @@
+from django.conf import settings
+from django.db import models
+
+from .interview import Interview
+
+
+class BusyBlock(models.Model):
+    """
+    A stretch of time a user is not available: a seat on an interview
+    panel, or time they blocked themselves (leave, other meetings).
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="busy_blocks"
+    )
+
+    # Null for blocks the user added themselves
+    interview = models.ForeignKey(
+        Interview,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="busy_blocks"
+    )
+
+    starts_at = models.DateTimeField()
+    ends_at = models.DateTimeField()
+
+    note = models.CharField(max_length=255, blank=True)
+
+    class Meta:
+        ordering = ["starts_at"]
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(ends_at__gt=models.F("starts_at")),
+                name="busyblock_ends_after_start",
+            ),
+        ]
+        indexes = [
+            # Overlap searches (ends_at > window start) only touch blocks
+            # from the window onwards, never the user's whole history
+            models.Index(
+                fields=["user", "ends_at"],
+                name="busyblock_user_ends_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} busy {self.starts_at:%Y-%m-%d %H:%M}-{self.ends_at:%H:%M}"
@@ -0,0 +1,50 @@
+from django.conf import settings
+from django.db import models
+
+from apps.applications.models import Application
+
+
+class Interview(models.Model):
+
+    class Status(models.TextChoices):
+        SCHEDULED = "scheduled", "Scheduled"
+        CANCELLED = "cancelled", "Cancelled"
+
+    application = models.ForeignKey(
+        Application,
+        on_delete=models.CASCADE,
+        related_name="interviews"
+    )
+
+    # The panel is the set of users holding one of its busy blocks
+    scheduled_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="interviews_scheduled"
+    )
+
+    starts_at = models.DateTimeField()
+    ends_at = models.DateTimeField()
+
+    location = models.CharField(max_length=255, blank=True)
+
+    status = models.CharField(
+        max_length=20,
+        choices=Status.choices,
+        default=Status.SCHEDULED
+    )
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["starts_at"]
+        indexes = [
+            # Interviews of an application, in time order
+            models.Index(
+                fields=["application", "starts_at"],
+                name="interview_app_starts_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.application_id} at {self.starts_at:%Y-%m-%d %H:%M} ({self.status})"
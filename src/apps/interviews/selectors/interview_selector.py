@@ -0,0 +1,25 @@
+from django.db.models import Prefetch
+from django.utils import timezone
+
+from apps.interviews.models import BusyBlock, Interview
+
+
+def list_user_interviews(*, user):
+    """
+    Upcoming interviews the user sits on, with the application, job,
+    candidate and the panel's user ids for display.
+    """
+    return Interview.objects.select_related("application__job", "application__candidate").filter(
+        busy_blocks__user=user,
+        status=Interview.Status.SCHEDULED,
+        ends_at__gt=timezone.now(),
+    ).prefetch_related(
+        Prefetch("busy_blocks", queryset=BusyBlock.objects.only("id", "interview_id", "user_id"))
+    )
+
+
+def list_user_busy_blocks(*, user):
+    """
+    The user's blocks that have not ended yet.
+    """
+    return BusyBlock.objects.filter(user=user, ends_at__gt=timezone.now())
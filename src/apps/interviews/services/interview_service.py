@@ -0,0 +1,169 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils import timezone
+
+from apps.applications.models import Application
+from apps.companies.models import Membership
+from apps.companies.selectors.roles import has_company_role
+from apps.interviews.availability import free_slots, parse_time, working_windows
+from apps.interviews.models import BusyBlock, Interview
+
+# Roles that can sit on an interview panel
+INTERVIEWER_ROLES = [Membership.Role.HIRING_MANAGER, Membership.Role.RECRUITER]
+
+# Roles that can search the panel's availability and book interviews
+INTERVIEW_SCHEDULER_ROLES = INTERVIEWER_ROLES + [Membership.Role.ADMIN]
+
+
+def _check_range(*, start, end):
+    if end <= start:
+        raise ValidationError("The end must be after the start.")
+
+
+def _check_panel(*, company_id, interviewer_ids, lock=False):
+    """
+    Every interviewer must be a Hiring Manager or Recruiter of the company,
+    checked with one query. With lock, their membership rows stay locked
+    until the transaction ends, so two bookings of the same interviewer
+    are checked for conflicts one after the other.
+    """
+    if not 0 < len(interviewer_ids) <= settings.INTERVIEW_PANEL_MAX_SIZE:
+        raise ValidationError(f"A panel has 1 to {settings.INTERVIEW_PANEL_MAX_SIZE} interviewers.")
+
+    members = Membership.objects.filter(
+        company_id=company_id, user_id__in=interviewer_ids, role__in=INTERVIEWER_ROLES
+    )
+    if lock:
+        # Same lock order everywhere, so overlapping panels cannot deadlock
+        members = members.select_for_update().order_by("user_id")
+
+    missing = set(interviewer_ids) - set(members.values_list("user_id", flat=True))
+    if missing:
+        raise ValidationError(
+            f"Not a Hiring Manager or Recruiter of this company: {', '.join(map(str, sorted(missing)))}."
+        )
+
+
+def _busy_intervals(*, user_ids, start, end):
+    """
+    (starts_at, ends_at) of every block of the users overlapping the
+    range, sorted by start: one query for the whole panel.
+    """
+    return BusyBlock.objects.filter(
+        user_id__in=user_ids, ends_at__gt=start, starts_at__lt=end
+    ).order_by("starts_at").values_list("starts_at", "ends_at")
+
+
+def find_panel_slots(*, company_id, interviewer_ids, start, end, duration, requested_by):
+    """
+    Working-hour gaps of at least `duration` between start and end in
+    which every interviewer is free. Two queries whatever the panel size
+    or range: the panel check and the panel's busy blocks.
+    """
+    if not has_company_role(user=requested_by, company_id=company_id, roles=INTERVIEW_SCHEDULER_ROLES):
+        raise ValidationError("You cannot schedule interviews for this company.")
+
+    _check_range(start=start, end=end)
+    if end - start > timedelta(days=settings.INTERVIEW_SEARCH_MAX_DAYS):
+        raise ValidationError(f"Search at most {settings.INTERVIEW_SEARCH_MAX_DAYS} days at a time.")
+
+    interviewer_ids = set(interviewer_ids)
+    _check_panel(company_id=company_id, interviewer_ids=interviewer_ids)
+
+    windows = working_windows(
+        start=start,
+        end=end,
+        tz=timezone.get_current_timezone(),
+        day_start=parse_time(settings.INTERVIEW_WORKDAY_START),
+        day_end=parse_time(settings.INTERVIEW_WORKDAY_END),
+    )
+    busy = _busy_intervals(user_ids=interviewer_ids, start=start, end=end)
+    return free_slots(busy, windows=windows, duration=duration)
+
+
+def schedule_interview(*, application, interviewer_ids, starts_at, ends_at, scheduled_by, location=""):
+    """
+    Books an interview for an active application. Each interviewer gets a
+    busy block for it; the booking fails if any of them is already busy
+    at that time.
+    """
+    company_id = application.job.company_id
+    if not has_company_role(user=scheduled_by, company_id=company_id, roles=INTERVIEW_SCHEDULER_ROLES):
+        raise ValidationError("You cannot schedule interviews for this company.")
+
+    if application.status != Application.Status.ACTIVE:
+        raise ValidationError("Only active applications can be interviewed.")
+
+    _check_range(start=starts_at, end=ends_at)
+    interviewer_ids = set(interviewer_ids)
+
+    with transaction.atomic():
+        _check_panel(company_id=company_id, interviewer_ids=interviewer_ids, lock=True)
+
+        busy = set(
+            BusyBlock.objects.filter(
+                user_id__in=interviewer_ids, ends_at__gt=starts_at, starts_at__lt=ends_at
+            ).values_list("user_id", flat=True)
+        )
+        if busy:
+            raise ValidationError(
+                f"Already busy at that time: {', '.join(map(str, sorted(busy)))}."
+            )
+
+        interview = Interview.objects.create(
+            application=application,
+            scheduled_by=scheduled_by,
+            starts_at=starts_at,
+            ends_at=ends_at,
+            location=location,
+        )
+        BusyBlock.objects.bulk_create([
+            BusyBlock(user_id=user_id, interview=interview, starts_at=starts_at, ends_at=ends_at)
+            for user_id in sorted(interviewer_ids)
+        ])
+
+    return interview
+
+
+def cancel_interview(*, interview, cancelled_by):
+    """
+    Schedulers of the company can cancel; the panel's time is freed.
+    """
+    company_id = interview.application.job.company_id
+    if not has_company_role(user=cancelled_by, company_id=company_id, roles=INTERVIEW_SCHEDULER_ROLES):
+        raise ValidationError("You cannot cancel this interview.")
+
+    if interview.status != Interview.Status.SCHEDULED:
+        raise ValidationError("This interview is already cancelled.")
+
+    with transaction.atomic():
+        interview.status = Interview.Status.CANCELLED
+        interview.save(update_fields=["status"])
+        interview.busy_blocks.all().delete()
+
+    return interview
+
+
+def add_busy_block(*, user, starts_at, ends_at, note=""):
+    """
+    Blocks time on the user's own calendar.
+    """
+    _check_range(start=starts_at, end=ends_at)
+    return BusyBlock.objects.create(user=user, starts_at=starts_at, ends_at=ends_at, note=note)
+
+
+def delete_busy_block(*, block, deleted_by):
+    """
+    Users free their own blocks; interview seats are freed by cancelling
+    the interview.
+    """
+    if block.user_id != deleted_by.pk:
+        raise ValidationError("You cannot change this calendar.")
+
+    if block.interview_id is not None:
+        raise ValidationError("Cancel the interview to free this time.")
+
+    block.delete()
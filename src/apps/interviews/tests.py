@@ -1,3 +1,145 @@
-from django.test import TestCase
+from datetime import datetime, time, timedelta, timezone as dt_timezone
 
-# Create your tests here.
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from rest_framework.test import APITestCase
+
+from apps.applications.models import Application
+from apps.companies.models import Company, Membership
+from apps.interviews.availability import free_slots, working_windows
+from apps.interviews.models import BusyBlock, Interview
+from apps.jobs.models import Job
+from apps.users.models import User
+from apps.users.tokens import UserRefreshToken
+
+UTC = dt_timezone.utc
+
+# A Monday
+MONDAY = datetime(2030, 1, 7, tzinfo=UTC)
+
+
+def at(day, hour, minute=0):
+    return MONDAY + timedelta(days=day, hours=hour, minutes=minute)
+
+
+class AvailabilitySolverTests(SimpleTestCase):
+
+    def windows(self, days=1):
+        return working_windows(
+            start=MONDAY, end=MONDAY + timedelta(days=days), tz=UTC, day_start=time(9), day_end=time(17)
+        )
+
+    def test_overlapping_blocks_of_the_panel_are_merged(self):
+        busy = sorted([
+            (at(0, 9), at(0, 10)),
+            (at(0, 9, 30), at(0, 11)),    # overlaps the first
+            (at(0, 11), at(0, 12)),       # touches the second
+            (at(0, 13), at(0, 13, 30)),
+            (at(0, 16, 30), at(0, 18)),   # runs past closing
+        ])
+
+        slots = free_slots(busy, windows=self.windows(), duration=timedelta(minutes=60))
+
+        self.assertEqual(slots, [(at(0, 12), at(0, 13)), (at(0, 13, 30), at(0, 16, 30))])
+
+    def test_weekends_are_skipped_and_long_blocks_span_days(self):
+        busy = [(at(0, 12), at(1, 15))]
+
+        slots = free_slots(busy, windows=self.windows(days=7), duration=timedelta(minutes=30))
+
+        self.assertEqual(slots[:2], [(at(0, 9), at(0, 12)), (at(1, 15), at(1, 17))])
+        self.assertEqual(len(slots), 5)
+        self.assertEqual(slots[-1], (at(4, 9), at(4, 17)))
+
+
+@override_settings(JWT_TRUST_TOKEN_CLAIMS=True)
+class InterviewTests(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.recruiter = User.objects.create_user(
+            email="recruiter@example.com", password="pass", first_name="Rec", last_name="Ruiter", dob="1990-01-01"
+        )
+        cls.company = Company.objects.create(name="Acme", created_by=cls.recruiter)
+        Membership.objects.create(user=cls.recruiter, company=cls.company, role=Membership.Role.RECRUITER)
+
+        cls.panel = User.objects.bulk_create([
+            User(email=f"manager-{i}@example.com", first_name="Man", last_name=str(i)) for i in range(3)
+        ])
+        Membership.objects.bulk_create([
+            Membership(user=user, company=cls.company, role=Membership.Role.HIRING_MANAGER) for user in cls.panel
+        ])
+        cls.outsider = User.objects.create(email="outsider@example.com", first_name="Out", last_name="Sider")
+
+        job = Job.objects.create(
+            company=cls.company, created_by=cls.recruiter, title="Engineer", description="...", status=Job.Status.OPEN
+        )
+        candidate = User.objects.create(email="candidate@example.com", first_name="Can", last_name="Didate")
+        cls.application = Application.objects.create(job=job, candidate=candidate)
+
+        # Monday: one manager busy 9-12, another 11-15
+        BusyBlock.objects.create(user=cls.panel[0], starts_at=at(0, 9), ends_at=at(0, 12))
+        BusyBlock.objects.create(user=cls.panel[1], starts_at=at(0, 11), ends_at=at(0, 15))
+
+    def setUp(self):
+        cache.clear()
+        token = UserRefreshToken.for_user(self.recruiter).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def availability(self, interviewers=None, **params):
+        params = {
+            "company": self.company.id,
+            "interviewers": interviewers or [user.id for user in self.panel],
+            "start": at(0, 0).isoformat(),
+            "end": at(1, 0).isoformat(),
+            "duration": 60,
+            **params,
+        }
+        return self.client.get("/api/interviews/availability/", params)
+
+    def schedule(self, starts_at, ends_at, interviewers=None):
+        return self.client.post("/api/interviews/", {
+            "application": self.application.id,
+            "interviewers": interviewers or [user.id for user in self.panel],
+            "starts_at": starts_at.isoformat(),
+            "ends_at": ends_at.isoformat(),
+        }, format="json")
+
+    def slots(self, response):
+        return [(slot["starts_at"], slot["ends_at"]) for slot in response.data["slots"]]
+
+    def test_availability_is_two_queries_for_any_panel(self):
+        # panel check + the panel's busy blocks
+        with self.assertNumQueries(2):
+            response = self.availability()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.slots(response), [("2030-01-07T15:00:00Z", "2030-01-07T17:00:00Z")])
+
+    def test_panel_must_be_interviewers_of_the_company(self):
+        response = self.availability(interviewers=[self.panel[0].id, self.outsider.id])
+        self.assertEqual(response.status_code, 400)
+
+        response = self.availability(end=at(90, 0).isoformat())
+        self.assertEqual(response.status_code, 400)
+
+    def test_scheduling_books_the_panel(self):
+        response = self.schedule(at(0, 15), at(0, 16))
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(sorted(response.data["interviewers"]), sorted(user.id for user in self.panel))
+        self.assertEqual(self.slots(self.availability()), [("2030-01-07T16:00:00Z", "2030-01-07T17:00:00Z")])
+
+        # Overlaps the interview for every panelist
+        response = self.schedule(at(0, 15, 30), at(0, 16, 30), interviewers=[self.panel[2].id])
+        self.assertEqual(response.status_code, 400)
+
+    def test_cancelling_frees_the_panel(self):
+        self.schedule(at(0, 15), at(0, 17))
+        interview = Interview.objects.get()
+
+        response = self.client.post(f"/api/interviews/{interview.id}/cancel/")
+
+        self.assertEqual(response.data["status"], Interview.Status.CANCELLED)
+        self.assertFalse(interview.busy_blocks.exists())
+        self.assertEqual(len(self.slots(self.availability())), 1)
@@ -17,9 +17,21 @@ class JobSerializer(serializers.ModelSerializer):
             "department",
             "location",
             "status",
+            "applications_count",
             "created_by_email",
             "created_by_full_name", 
             "created_at",
             "updated_at",
         ]
-        read_only_fields = ["id", "status", "created_at", "updated_at"]
\ No newline at end of file
+        read_only_fields = ["id", "status", "applications_count", "created_at", "updated_at"]
+
+
+class PublicJobSerializer(JobSerializer):
+    """
+    The public board is cached per generation, which application
+    submissions do not bump; the applicant count stays off it rather
+    than being served stale.
+    """
+
+    class Meta(JobSerializer.Meta):
+        fields = [field for field in JobSerializer.Meta.fields if field != "applications_count"]
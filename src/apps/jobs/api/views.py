@@ -2,11 +2,16 @@ from rest_framework import viewsets, status
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly
 from rest_framework.decorators import action
-from django.db.models import Q
+from rest_framework.exceptions import ValidationError as DRFValidationError
+from django.core.exceptions import ValidationError
 from django.shortcuts import get_object_or_404
 
+from apps.common.conditional import conditional_get
+from apps.common.pagination import KeysetPagination
+from apps.jobs.cache import get_cached, public_detail_cache_key, public_list_cache_key, set_cached
 from apps.jobs.models import Job
-from apps.jobs.api.serializers import JobSerializer
+from apps.jobs.api.serializers import JobSerializer, PublicJobSerializer
+from apps.jobs.selectors.job_selecotr import list_manageable_jobs
 from apps.jobs.services.job_service import (
     create_job,
     update_job,
@@ -19,6 +24,7 @@ from drf_spectacular.types import OpenApiTypes
 class JobViewset(viewsets.ModelViewSet):
     serializer_class = JobSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = KeysetPagination
 
     @extend_schema(
         parameters=[
@@ -32,14 +38,8 @@ class JobViewset(viewsets.ModelViewSet):
 
     def get_queryset(self):
         user = self.request.user
-        queryset = Job.objects.select_related("company", "created_by")
-        # Logic: 
-        # 1. Show all jobs I created (including Drafts)
-        # 2. Show Open/Closed jobs from my companies (exclude Drafts)
-        queryset =  queryset.filter(
-            Q(created_by=user) | 
-            (Q(company__memberships__user=user) & ~Q(status__iexact="draft"))
-        ).distinct()
+        # My jobs (including Drafts) + Open/Closed jobs from my companies
+        queryset = list_manageable_jobs(user=user)
     
         # Optional Toggle: /api/manage/jobs/?mine=true
         show_only_mine = self.request.query_params.get('mine') == 'true'
@@ -49,8 +49,12 @@ class JobViewset(viewsets.ModelViewSet):
         # Optional Filter: Show specific status (?status=OPEN)
         status_param = self.request.query_params.get('status')
         if status_param:
-            # 'open' or 'OPEN' both work
-            queryset = queryset.filter(status__iexact=status_param)        
+            # 'open' or 'OPEN' both work; normalized here so the filter
+            # is an exact match the status indexes can serve
+            status_value = status_param.strip().lower()
+            if status_value not in Job.Status.values:
+                raise DRFValidationError({"status": f"Must be one of: {', '.join(Job.Status.values)}."})
+            queryset = queryset.filter(status=status_value)
 
         return queryset
     
@@ -92,15 +96,61 @@ class JobViewset(viewsets.ModelViewSet):
         job = self.get_object()
         status_value = request.data.get("status")
 
-        job = change_job_status(job=job, status=status_value, changed_by=request.user)
+        try:
+            job = change_job_status(job=job, status=status_value, changed_by=request.user)
+        except ValidationError as e:
+            return Response({"detail": e.messages}, status=status.HTTP_400_BAD_REQUEST)
         return Response(self.get_serializer(job).data)
     
 
+def public_jobs_state(view, request, *args, **kwargs):
+    # The cache key already names the generation and the query, so the
+    # ETag costs one cache read and no query; list() reuses the key
+    view.list_cache_key = public_list_cache_key(request)
+    return view.list_cache_key, None
+
+
 class PublicJobViewset(viewsets.ReadOnlyModelViewSet):
     """
     Public Viewset for Candidates (and anyone else) to see all OPEN jobs.
+    Responses are cached; job writes bump the cache generation.
     """
-    serializer_class = JobSerializer
+    serializer_class = PublicJobSerializer
     # IsAuthenticatedOrReadOnly so unauthenticated users can browse
     permission_classes = [IsAuthenticatedOrReadOnly]
-    queryset = Job.objects.filter(status__iexact="open").select_related("company", "created_by")
\ No newline at end of file
+    pagination_class = KeysetPagination
+    queryset = Job.objects.filter(status=Job.Status.OPEN).select_related("company", "created_by")
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+
+        # Optional Filter: Jobs of one company (?company=3)
+        company_id = self.request.query_params.get("company")
+        if company_id:
+            if not company_id.isdigit():
+                raise DRFValidationError({"company": "Must be a company id."})
+            queryset = queryset.filter(company_id=company_id)
+
+        return queryset
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(name='company', description='Filter: Company id', type=int),
+        ]
+    )
+    @conditional_get(public_jobs_state)
+    def list(self, request, *args, **kwargs):
+        key = self.list_cache_key
+        data = get_cached(key)
+        if data is None:
+            data = super().list(request, *args, **kwargs).data
+            set_cached(key, data)
+        return Response(data)
+
+    def retrieve(self, request, *args, **kwargs):
+        key = public_detail_cache_key(kwargs["pk"])
+        data = get_cached(key)
+        if data is None:
+            data = super().retrieve(request, *args, **kwargs).data
+            set_cached(key, data)
+        return Response(data)
@@ -0,0 +1,73 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+# Generation counters. Cached pages embed the generation they were built
+# from, so bumping a counter makes every older page unreachable at once.
+GLOBAL_GENERATION_KEY = "jobs:public:gen"
+COMPANY_GENERATION_KEY = "jobs:public:gen:company:{company_id}"
+
+
+def _get_generation(key):
+    generation = cache.get(key)
+    if generation is None:
+        # A fresh timestamp can't collide with a generation that was
+        # evicted, so stale pages stay unreachable.
+        cache.add(key, time.time_ns(), timeout=None)
+        generation = cache.get(key)
+    return generation
+
+
+def _bump_generation(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), timeout=None)
+
+
+def bump_public_jobs(*, company_ids):
+    """
+    Invalidates cached public pages for the given companies (and the
+    unscoped board). Runs after commit so readers never re-cache the
+    pre-write state.
+    """
+    def bump():
+        _bump_generation(GLOBAL_GENERATION_KEY)
+        for company_id in set(company_ids):
+            _bump_generation(COMPANY_GENERATION_KEY.format(company_id=company_id))
+
+    transaction.on_commit(bump)
+
+
+def public_list_cache_key(request):
+    """
+    Company-scoped listings only depend on that company's generation;
+    the unscoped board depends on the global one.
+    The generation is read before the queryset runs, so a write that
+    commits mid-render bumps it and the stale page is never served.
+    """
+    company_id = request.query_params.get("company")
+    if company_id and company_id.isdigit():
+        generation = _get_generation(COMPANY_GENERATION_KEY.format(company_id=company_id))
+    else:
+        generation = _get_generation(GLOBAL_GENERATION_KEY)
+
+    # Host is part of the key because pagination links are absolute URLs
+    params = "&".join(sorted(request.query_params.urlencode().split("&")))
+    digest = hashlib.sha1(f"{request.get_host()}?{params}".encode()).hexdigest()
+    return f"jobs:public:list:{generation}:{digest}"
+
+
+def public_detail_cache_key(pk):
+    return f"jobs:public:detail:{_get_generation(GLOBAL_GENERATION_KEY)}:{pk}"
+
+
+def get_cached(key):
+    return cache.get(key)
+
+
+def set_cached(key, data):
+    cache.set(key, data, settings.PUBLIC_JOBS_CACHE_TIMEOUT)
@@ -0,0 +1,86 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+
+from apps.common.benchmarks import measure, rolled_back
+from apps.companies.models import Company, Membership
+from apps.jobs.models import Job
+from apps.jobs.selectors.job_selecotr import list_manageable_jobs
+
+User = get_user_model()
+
+
+def legacy_manageable_jobs(*, user):
+    """
+    The original JobViewset.get_queryset: membership join + DISTINCT.
+    """
+    return Job.objects.select_related("company", "created_by").filter(
+        Q(created_by=user)
+        | (Q(company__memberships__user=user) & ~Q(status__iexact="draft"))
+    ).distinct()
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares query plans and latency of the recruiter job listing: "
+        "legacy membership join + DISTINCT vs. the membership-scoped selector. "
+        "Fixtures are created inside a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--companies", type=int, default=20)
+        parser.add_argument("--members", type=int, default=25, help="Members per company")
+        parser.add_argument("--jobs", type=int, default=500, help="Jobs per company")
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def handle(self, *args, **options):
+        with rolled_back():
+            user = self._seed(options)
+            self._compare(user, options["repeat"])
+
+    def _seed(self, options):
+        users = User.objects.bulk_create([
+            User(email=f"bench-{i}@example.com", first_name="Bench", last_name=str(i))
+            for i in range(options["members"])
+        ])
+        user = users[0]
+
+        for c in range(options["companies"]):
+            company = Company.objects.create(name=f"Bench Company {c}", created_by=user)
+            Membership.objects.bulk_create([
+                Membership(user=member, company=company, role=Membership.Role.RECRUITER)
+                for member in users
+            ])
+            Job.objects.bulk_create([
+                Job(
+                    company=company,
+                    created_by=users[j % len(users)],
+                    title=f"Job {j}",
+                    description="Lorem ipsum dolor sit amet. " * 40,
+                    status=(Job.Status.DRAFT, Job.Status.OPEN, Job.Status.CLOSED)[j % 3],
+                )
+                for j in range(options["jobs"])
+            ])
+
+        return user
+
+    def _compare(self, user, repeat):
+        candidates = {
+            "legacy (join + DISTINCT)": lambda: legacy_manageable_jobs(user=user),
+            "selector (company_id IN)": lambda: list_manageable_jobs(user=user),
+        }
+
+        for label, build in candidates.items():
+            queryset = build().order_by("-created_at", "-id")
+
+            self.stdout.write(self.style.MIGRATE_HEADING(label))
+            self.stdout.write(queryset.explain())
+
+            first_page = measure(lambda: list(build().order_by("-created_at", "-id")[:20]), repeat=repeat)
+            total = measure(lambda: build().count(), repeat=repeat)
+
+            self.stdout.write(
+                f"rows={queryset.count()}  "
+                f"first page p50={first_page['p50']:.2f}ms p95={first_page['p95']:.2f}ms  "
+                f"count p50={total['p50']:.2f}ms p95={total['p95']:.2f}ms\n"
+            )
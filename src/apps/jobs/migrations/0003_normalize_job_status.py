@@ -0,0 +1,22 @@
+from django.db import migrations
+from django.db.models.functions import Lower
+
+
+def lowercase_status(apps, schema_editor):
+    """
+    Legacy rows may hold 'OPEN' / 'Draft' etc. from before status was
+    normalized; lowercase them so exact-match filters find them.
+    """
+    Job = apps.get_model("jobs", "Job")
+    Job.objects.exclude(status__in=["draft", "open", "closed"]).update(status=Lower("status"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0002_job_job_company_status_created_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(lowercase_status, migrations.RunPython.noop),
+    ]
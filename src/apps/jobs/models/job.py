@@ -35,11 +35,28 @@ class Job(models.Model):
         default=Status.DRAFT
     )
 
+    # Denormalized: bumped with F() when an application is submitted, so
+    # listings never COUNT(*) the applications table
+    applications_count = models.PositiveIntegerField(default=0, editable=False)
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            # Company dashboards: jobs of a company filtered by status, newest first
+            models.Index(
+                fields=["company", "status", "-created_at"],
+                name="job_company_status_created_idx",
+            ),
+            # Public job board: only OPEN jobs, in keyset pagination order
+            models.Index(
+                fields=["-created_at", "-id"],
+                name="job_open_created_idx",
+                condition=models.Q(status="open"),
+            ),
+        ]
 
     def __str__(self):
         return f"{self.title} - {self.company.name}"
@@ -0,0 +1,22 @@
+from django.db.models import Q
+
+from apps.companies.selectors.roles import get_user_company_ids
+from apps.jobs.models import Job
+
+
+def list_manageable_jobs(*, user):
+    """
+    Jobs shown on the recruiter dashboard:
+    1. All jobs the user created (including Drafts)
+    2. Open/Closed jobs from the user's companies (excluding Drafts)
+
+    Company IDs are resolved up front, so the job query reads only the jobs
+    table with `company_id IN (...)`. Without the membership join there are
+    no duplicate rows and no DISTINCT over the wide description column.
+    """
+    company_ids = get_user_company_ids(user=user)
+
+    return Job.objects.select_related("company", "created_by").filter(
+        Q(created_by=user)
+        | (Q(company_id__in=company_ids) & ~Q(status=Job.Status.DRAFT))
+    )
@@ -1,6 +1,14 @@
 from django.core.exceptions import ValidationError
+from django.db import transaction
+from apps.applications.models import Application
+from apps.jobs.cache import bump_public_jobs
 from apps.jobs.models import Job
 from apps.companies.models import Membership
+from apps.companies.selectors.roles import has_company_role, is_company_admin
+from apps.pipelines.services.pipeline_service import create_default_stages
+
+# Roles allowed to create and edit jobs
+JOB_EDITOR_ROLES = [Membership.Role.ADMIN, Membership.Role.RECRUITER]
 
 
 def create_job(*, company, title, description, department, location, created_by):
@@ -8,22 +16,21 @@ def create_job(*, company, title, description, department, location, created_by)
     Only Admin or Recruiter of company can create jobs.
     """
 
-    if not Membership.objects.filter(
-        company=company,
-        user=created_by,
-        role__in=[Membership.Role.ADMIN, Membership.Role.RECRUITER]
-    ).exists():
+    if not has_company_role(user=created_by, company_id=company.id, roles=JOB_EDITOR_ROLES):
         raise ValidationError("You do not have permission to create jobs for this company.")
 
-    job = Job.objects.create(
-        company=company,
-        title=title,
-        description=description,
-        department=department,
-        location=location,
-        created_by=created_by
-    )
-
+    with transaction.atomic():
+        job = Job.objects.create(
+            company=company,
+            title=title,
+            description=description,
+            department=department,
+            location=location,
+            created_by=created_by
+        )
+        create_default_stages(job=job)
+
+    bump_public_jobs(company_ids=[company.id])
     return job
 
 
@@ -32,17 +39,16 @@ def update_job(*, job, data, updated_by):
     Only Admin or Recruiter can update job.
     """
 
-    if not Membership.objects.filter(
-        company=job.company,
-        user=updated_by,
-        role__in=[Membership.Role.ADMIN, Membership.Role.RECRUITER]
-    ).exists():
+    if not has_company_role(user=updated_by, company_id=job.company_id, roles=JOB_EDITOR_ROLES):
         raise ValidationError("You cannot update this job.")
 
+    previous_company_id = job.company_id
+
     for field, value in data.items():
         setattr(job, field, value)
 
     job.save()
+    bump_public_jobs(company_ids=[previous_company_id, job.company_id])
     return job
 
 
@@ -51,15 +57,17 @@ def change_job_status(*, job, status, changed_by):
     Only Admin or Recruiter can change status.
     """
 
-    if not Membership.objects.filter(
-        company=job.company,
-        user=changed_by,
-        role__in=[Membership.Role.ADMIN, Membership.Role.RECRUITER]
-    ).exists():
+    if not has_company_role(user=changed_by, company_id=job.company_id, roles=JOB_EDITOR_ROLES):
         raise ValidationError("You cannot change job status.")
 
+    # Stored lowercase so status filters stay exact (index-friendly) matches
+    status = (status or "").strip().lower()
+    if status not in Job.Status.values:
+        raise ValidationError("Invalid job status.")
+
     job.status = status
-    job.save(update_fields=["status"])
+    job.save(update_fields=["status", "updated_at"])
+    bump_public_jobs(company_ids=[job.company_id])
     return job
 
 
@@ -68,13 +76,9 @@ def delete_job(*, job, deleted_by):
     Only Admin or Creator can delete jobs.
     """
 
-    is_admin = Membership.objects.filter(
-        company=job.company, 
-        user=deleted_by, 
-        role=Membership.Role.ADMIN
-    ).exists()
+    is_admin = is_company_admin(user=deleted_by, company_id=job.company_id)
 
-    is_creator = (job.created_by == deleted_by) 
+    is_creator = (job.created_by_id == deleted_by.pk)
     
     if not (is_admin or is_creator):
         raise ValidationError("You do not have permission to delete this job.")
@@ -82,7 +86,15 @@ def delete_job(*, job, deleted_by):
     # TODO: Consider implementing "Soft Delete" in the future.
     # Instead of job.delete(), we could set job.status = 'ARCHIVED'.
     # This prevents losing candidate application data associated with this job.
-    job.delete() 
+    company_id = job.company_id
+    with transaction.atomic():
+        # Applications go first, in one DELETE; left to the cascade they
+        # would be loaded row by row to check their stage references. Their
+        # interviews and offers cascade, so only their ids are loaded, and
+        # their resumes, whose files are removed on commit.
+        Application.objects.filter(job=job).only("id", "resume").delete()
+        job.delete()
+    bump_public_jobs(company_ids=[company_id])
 
 
 
@@ -1,3 +1,221 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.test import TestCase
+from rest_framework.test import APITestCase
 
-# Create your tests here.
+from apps.common.testing import QueryPlanMixin
+from apps.companies.models import Company, Membership
+from apps.jobs.api.views import PublicJobViewset
+from apps.jobs.models import Job
+from apps.jobs.services.job_service import change_job_status, create_job, delete_job, update_job
+from apps.users.tokens import UserRefreshToken
+
+User = get_user_model()
+
+
+class JobIndexTests(QueryPlanMixin, TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            email="owner@example.com",
+            password="pass",
+            first_name="Owner",
+            last_name="User",
+            dob="1990-01-01",
+        )
+        cls.company = Company.objects.create(name="Acme", created_by=cls.user)
+        Job.objects.bulk_create([
+            Job(
+                company=cls.company,
+                created_by=cls.user,
+                title=f"Job {i}",
+                description="...",
+                status=(Job.Status.DRAFT, Job.Status.OPEN, Job.Status.CLOSED)[i % 3],
+            )
+            for i in range(30)
+        ])
+
+    def test_public_listing_uses_partial_open_index(self):
+        queryset = Job.objects.filter(status=Job.Status.OPEN).order_by("-created_at", "-id")
+        self.assertUsesIndex(queryset, "job_open_created_idx")
+
+    def test_public_viewset_queryset_uses_partial_open_index(self):
+        queryset = PublicJobViewset.queryset.order_by("-created_at", "-id")
+        self.assertUsesIndex(queryset, "job_open_created_idx")
+
+    def test_company_status_filter_uses_composite_index(self):
+        queryset = Job.objects.filter(
+            company=self.company, status=Job.Status.CLOSED
+        ).order_by("-created_at")
+        self.assertUsesIndex(queryset, "job_company_status_created_idx")
+
+
+class PublicJobConditionalGetTests(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            email="owner@example.com",
+            password="pass",
+            first_name="Owner",
+            last_name="User",
+            dob="1990-01-01",
+        )
+        cls.company = Company.objects.create(name="Acme", created_by=cls.user)
+        Membership.objects.create(user=cls.user, company=cls.company, role=Membership.Role.ADMIN)
+        cls.job = Job.objects.create(
+            company=cls.company,
+            created_by=cls.user,
+            title="Backend Engineer",
+            description="...",
+            status=Job.Status.OPEN,
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.url = "/api/jobs/"
+
+    def test_unchanged_list_returns_304_without_queries(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        etag = response["ETag"]
+
+        # The ETag comes from the cache generation, not the table
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+
+    def test_status_change_invalidates_etag(self):
+        etag = self.client.get(self.url)["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            change_job_status(job=self.job, status=Job.Status.CLOSED, changed_by=self.user)
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_applicant_count_stays_off_the_cached_board(self):
+        [job] = self.client.get(self.url).data["results"]
+        self.assertNotIn("applications_count", job)
+        self.assertNotIn("applications_count", self.client.get(f"{self.url}{self.job.id}/").data)
+
+
+class PublicJobCacheTests(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            email="owner@example.com",
+            password="pass",
+            first_name="Owner",
+            last_name="User",
+            dob="1990-01-01",
+        )
+        cls.acme = Company.objects.create(name="Acme", created_by=cls.user)
+        cls.globex = Company.objects.create(name="Globex", created_by=cls.user)
+        Membership.objects.bulk_create([
+            Membership(user=cls.user, company=company, role=Membership.Role.ADMIN)
+            for company in (cls.acme, cls.globex)
+        ])
+        cls.job = Job.objects.create(
+            company=cls.acme, created_by=cls.user, title="Backend Engineer", description="...", status=Job.Status.OPEN
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def titles(self, url="/api/jobs/"):
+        return [job["title"] for job in self.client.get(url).data["results"]]
+
+    def write(self, service, **kwargs):
+        # Generations are bumped once the write commits
+        with self.captureOnCommitCallbacks(execute=True):
+            return service(**kwargs)
+
+    def test_repeated_requests_are_served_from_the_cache(self):
+        self.client.get("/api/jobs/")
+        self.client.get(f"/api/jobs/{self.job.id}/")
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.titles(), ["Backend Engineer"])
+            self.assertEqual(self.client.get(f"/api/jobs/{self.job.id}/").data["title"], "Backend Engineer")
+
+    def test_job_writes_invalidate_cached_pages(self):
+        self.assertEqual(self.titles(), ["Backend Engineer"])
+
+        job = self.write(
+            create_job, company=self.acme, title="Designer", description="...",
+            department="", location="", created_by=self.user,
+        )
+        self.write(change_job_status, job=job, status=Job.Status.OPEN, changed_by=self.user)
+        self.assertEqual(self.titles(), ["Designer", "Backend Engineer"])
+
+        self.write(update_job, job=job, data={"title": "Product Designer"}, updated_by=self.user)
+        self.assertEqual(self.titles(), ["Product Designer", "Backend Engineer"])
+        self.assertEqual(self.client.get(f"/api/jobs/{job.id}/").data["title"], "Product Designer")
+
+        self.write(change_job_status, job=self.job, status=Job.Status.CLOSED, changed_by=self.user)
+        self.assertEqual(self.titles(), ["Product Designer"])
+
+        self.write(delete_job, job=job, deleted_by=self.user)
+        self.assertEqual(self.titles(), [])
+
+    def test_company_pages_are_keyed_on_their_own_generation(self):
+        acme_url = f"/api/jobs/?company={self.acme.id}"
+        self.titles(acme_url)
+        self.titles()
+
+        other = self.write(
+            create_job, company=self.globex, title="Analyst", description="...",
+            department="", location="", created_by=self.user,
+        )
+        self.write(change_job_status, job=other, status=Job.Status.OPEN, changed_by=self.user)
+
+        # Another company's write leaves Acme's page cached...
+        with self.assertNumQueries(0):
+            self.assertEqual(self.titles(acme_url), ["Backend Engineer"])
+        # ...and the unscoped board rebuilt
+        self.assertEqual(self.titles(), ["Analyst", "Backend Engineer"])
+        self.assertEqual(self.titles(f"/api/jobs/?company={self.globex.id}"), ["Analyst"])
+
+
+class JobStatusTests(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            email="owner@example.com",
+            password="pass",
+            first_name="Owner",
+            last_name="User",
+            dob="1990-01-01",
+        )
+        cls.company = Company.objects.create(name="Acme", created_by=cls.user)
+        Membership.objects.create(user=cls.user, company=cls.company, role=Membership.Role.ADMIN)
+        cls.job = Job.objects.create(company=cls.company, created_by=cls.user, title="Engineer", description="...")
+
+    def setUp(self):
+        cache.clear()
+        token = UserRefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def change_status(self, value):
+        return self.client.post(f"/api/manage/jobs/{self.job.id}/change_status/", {"status": value}, format="json")
+
+    def test_invalid_status_is_a_bad_request(self):
+        response = self.change_status("archived")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data, {"detail": ["Invalid job status."]})
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.status, Job.Status.DRAFT)
+
+    def test_status_is_changed(self):
+        response = self.change_status(" Open ")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["status"], Job.Status.OPEN)
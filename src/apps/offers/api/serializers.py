@@ -0,0 +1,99 @@
+from rest_framework import serializers
+
+from apps.applications.models import Application
+from apps.offers.models import Offer, OfferBatch
+
+
+class OfferSerializer(serializers.ModelSerializer):
+    candidate_email = serializers.ReadOnlyField(source="application.candidate.email")
+    letter_ready = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Offer
+        fields = [
+            "id",
+            "application",
+            "candidate_email",
+            "batch",
+            "salary",
+            "currency",
+            "start_date",
+            "terms",
+            "status",
+            "letter_ready",
+            "decided_at",
+            "created_at",
+        ]
+
+    def get_letter_ready(self, offer) -> bool:
+        return offer.letter_rendered_at is not None
+
+
+class CandidateOfferSerializer(serializers.ModelSerializer):
+    job_title = serializers.ReadOnlyField(source="application.job.title")
+    company_name = serializers.ReadOnlyField(source="application.job.company.name")
+
+    class Meta:
+        model = Offer
+        fields = [
+            "id",
+            "application",
+            "job_title",
+            "company_name",
+            "salary",
+            "currency",
+            "start_date",
+            "terms",
+            "status",
+            "letter",
+            "created_at",
+        ]
+
+
+class OfferTermsSerializer(serializers.Serializer):
+    salary = serializers.DecimalField(max_digits=12, decimal_places=2, min_value=0)
+    currency = serializers.CharField(min_length=3, max_length=3, default="USD")
+    start_date = serializers.DateField()
+    terms = serializers.CharField(required=False, allow_blank=True, default="")
+
+
+class CreateOfferSerializer(OfferTermsSerializer):
+    # Everything the letter shows is loaded with the application
+    application = serializers.PrimaryKeyRelatedField(
+        queryset=Application.objects.select_related("candidate", "job__company")
+    )
+
+
+class CreateOfferBatchSerializer(OfferTermsSerializer):
+    application_ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        allow_empty=False,
+        max_length=5000,
+    )
+
+
+class OfferBatchSerializer(serializers.ModelSerializer):
+    progress = serializers.SerializerMethodField()
+
+    class Meta:
+        model = OfferBatch
+        fields = [
+            "id",
+            "job",
+            "status",
+            "total",
+            "rendered",
+            "progress",
+            "error",
+            "created_at",
+            "started_at",
+            "finished_at",
+        ]
+
+    def get_progress(self, batch) -> float:
+        # Fraction of letters rendered, 0.0 to 1.0
+        return round(batch.rendered / batch.total, 3) if batch.total else 1.0
+
+
+class RespondToOfferSerializer(serializers.Serializer):
+    accept = serializers.BooleanField()
@@ -0,0 +1,26 @@
+from django.urls import path
+from .views import (
+    ApproveOfferBatchView,
+    ApproveOfferView,
+    CreateOfferBatchView,
+    CreateOfferView,
+    JobOffersView,
+    MyOffersView,
+    OfferBatchView,
+    RejectOfferView,
+    RespondToOfferView,
+    RetryOfferBatchView,
+)
+
+urlpatterns = [
+    path("", CreateOfferView.as_view()),
+    path("mine/", MyOffersView.as_view()),
+    path("<int:offer_id>/approve/", ApproveOfferView.as_view()),
+    path("<int:offer_id>/reject/", RejectOfferView.as_view()),
+    path("<int:offer_id>/respond/", RespondToOfferView.as_view()),
+    path("jobs/<int:job_id>/", JobOffersView.as_view()),
+    path("jobs/<int:job_id>/batches/", CreateOfferBatchView.as_view()),
+    path("batches/<int:batch_id>/", OfferBatchView.as_view()),
+    path("batches/<int:batch_id>/approve/", ApproveOfferBatchView.as_view()),
+    path("batches/<int:batch_id>/retry/", RetryOfferBatchView.as_view()),
+]
@@ -0,0 +1,194 @@
+from django.core.exceptions import ValidationError
+from django.shortcuts import get_object_or_404
+from rest_framework import status
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.exceptions import ValidationError as DRFValidationError
+from rest_framework.generics import GenericAPIView, ListAPIView
+from rest_framework.response import Response
+from drf_spectacular.utils import extend_schema, OpenApiParameter
+
+from apps.common.pagination import KeysetPagination
+from apps.companies.selectors.roles import get_company_role
+from apps.jobs.models import Job
+from apps.offers.models import Offer, OfferBatch
+from apps.offers.selectors.offer_selector import list_candidate_offers, list_job_offers
+from apps.offers.services.offer_service import (
+    approve_offer,
+    approve_offer_batch,
+    create_offer,
+    create_offer_batch,
+    reject_offer,
+    respond_to_offer,
+    retry_offer_batch,
+)
+
+from .serializers import (
+    CandidateOfferSerializer,
+    CreateOfferBatchSerializer,
+    CreateOfferSerializer,
+    OfferBatchSerializer,
+    OfferSerializer,
+    RespondToOfferSerializer,
+)
+
+
+def _error(e):
+    return Response({"detail": e.messages}, status=status.HTTP_400_BAD_REQUEST)
+
+
+def _get_offer(offer_id):
+    return get_object_or_404(
+        Offer.objects.select_related("application__job", "application__candidate"), id=offer_id
+    )
+
+
+class CreateOfferView(GenericAPIView):
+    serializer_class = CreateOfferSerializer
+
+    def post(self, request):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            offer = create_offer(created_by=request.user, **serializer.validated_data)
+        except ValidationError as e:
+            return _error(e)
+
+        return Response(OfferSerializer(offer).data, status=status.HTTP_201_CREATED)
+
+
+class MyOffersView(ListAPIView):
+    """
+    Offers extended to the candidate, with their letters.
+    """
+    serializer_class = CandidateOfferSerializer
+    pagination_class = KeysetPagination
+
+    def get_queryset(self):
+        return list_candidate_offers(user=self.request.user)
+
+
+class ApproveOfferView(GenericAPIView):
+    serializer_class = OfferSerializer
+
+    def post(self, request, offer_id):
+        offer = _get_offer(offer_id)
+        try:
+            approve_offer(offer=offer, approved_by=request.user)
+        except ValidationError as e:
+            return _error(e)
+        return Response(self.get_serializer(offer).data)
+
+
+class RejectOfferView(GenericAPIView):
+    serializer_class = OfferSerializer
+
+    def post(self, request, offer_id):
+        offer = _get_offer(offer_id)
+        try:
+            reject_offer(offer=offer, rejected_by=request.user)
+        except ValidationError as e:
+            return _error(e)
+        return Response(self.get_serializer(offer).data)
+
+
+class RespondToOfferView(GenericAPIView):
+    serializer_class = RespondToOfferSerializer
+
+    def post(self, request, offer_id):
+        offer = get_object_or_404(Offer.objects.select_related("application__job__company"), id=offer_id)
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            respond_to_offer(offer=offer, candidate=request.user, accept=serializer.validated_data["accept"])
+        except ValidationError as e:
+            return _error(e)
+
+        return Response(CandidateOfferSerializer(offer).data)
+
+
+class JobOffersView(ListAPIView):
+    """
+    Offers on a job's applications, for members of the job's company.
+    Optional filter: ?status=<status>
+    """
+    serializer_class = OfferSerializer
+    pagination_class = KeysetPagination
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(name="status", description="Filter: Offer status", type=str),
+        ]
+    )
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
+    def get_queryset(self):
+        job = get_object_or_404(Job.objects.only("id", "company_id"), id=self.kwargs["job_id"])
+        if get_company_role(user=self.request.user, company_id=job.company_id) is None:
+            raise PermissionDenied("You are not a member of this job's company.")
+
+        status_value = self.request.query_params.get("status")
+        if status_value and status_value not in Offer.Status.values:
+            raise DRFValidationError({"status": f"Must be one of: {', '.join(Offer.Status.values)}."})
+
+        return list_job_offers(job=job, status=status_value)
+
+
+class CreateOfferBatchView(GenericAPIView):
+    """
+    Offers the same terms to many of a job's applicants. Responds at once
+    with the batch; its letters are rendered in the background, follow
+    the progress at /api/offers/batches/<id>/.
+    """
+    serializer_class = CreateOfferBatchSerializer
+
+    def post(self, request, job_id):
+        job = get_object_or_404(Job.objects.only("id", "company_id"), id=job_id)
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            batch = create_offer_batch(job=job, created_by=request.user, **serializer.validated_data)
+        except ValidationError as e:
+            return _error(e)
+
+        return Response(OfferBatchSerializer(batch).data, status=status.HTTP_202_ACCEPTED)
+
+
+class OfferBatchView(GenericAPIView):
+    serializer_class = OfferBatchSerializer
+
+    def get(self, request, batch_id):
+        batch = get_object_or_404(OfferBatch.objects.select_related("job"), id=batch_id)
+        if get_company_role(user=request.user, company_id=batch.job.company_id) is None:
+            raise PermissionDenied("You are not a member of this job's company.")
+        return Response(self.get_serializer(batch).data)
+
+
+class ApproveOfferBatchView(GenericAPIView):
+    serializer_class = OfferBatchSerializer
+
+    def post(self, request, batch_id):
+        batch = get_object_or_404(OfferBatch.objects.select_related("job"), id=batch_id)
+        try:
+            approved = approve_offer_batch(batch=batch, approved_by=request.user)
+        except ValidationError as e:
+            return _error(e)
+        return Response({"approved": approved})
+
+
+class RetryOfferBatchView(GenericAPIView):
+    """
+    Queues a failed batch again; follow its progress as after creation.
+    """
+    serializer_class = OfferBatchSerializer
+
+    def post(self, request, batch_id):
+        batch = get_object_or_404(OfferBatch.objects.select_related("job"), id=batch_id)
+        try:
+            batch = retry_offer_batch(batch=batch, retried_by=request.user)
+        except ValidationError as e:
+            return _error(e)
+        return Response(self.get_serializer(batch).data, status=status.HTTP_202_ACCEPTED)
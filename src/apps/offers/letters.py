@@ -0,0 +1,30 @@
+from django.template.loader import get_template
+from django.utils import timezone
+
+LETTER_TEMPLATE = "offers/letter.html"
+
+# Relations every rendered offer needs, to load a chunk in one query
+LETTER_RELATED = ("application__candidate", "application__job__company")
+
+
+def letter_context(offer) -> dict:
+    application = offer.application
+    return {
+        "candidate_name": application.candidate.get_full_name,
+        "job_title": application.job.title,
+        "company_name": application.job.company.name,
+        "salary": offer.salary,
+        "currency": offer.currency,
+        "start_date": offer.start_date,
+        "terms": offer.terms,
+        "today": timezone.localdate(),
+    }
+
+
+def render_letters(offers) -> list:
+    """
+    Renders one letter per offer, looking the template up once for the
+    whole batch; the cached template loader compiled it already.
+    """
+    template = get_template(LETTER_TEMPLATE)
+    return [template.render(letter_context(offer)) for offer in offers]
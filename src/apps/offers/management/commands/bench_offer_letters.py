@@ -0,0 +1,140 @@
+import multiprocessing
+import time
+from datetime import date
+from decimal import Decimal
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.template.loader import get_template
+from django.test.utils import CaptureQueriesContext
+
+from apps.applications.models import Application
+from apps.common.benchmarks import rolled_back
+from apps.companies.models import Company
+from apps.jobs.models import Job
+from apps.offers.letters import LETTER_TEMPLATE, letter_context, render_letters
+from apps.offers.models import Offer, OfferBatch
+from apps.offers.services.letter_service import render_offer_chunk, start_offer_batch
+
+User = get_user_model()
+
+
+# Set before the pool forks: children inherit the offers instead of
+# having them pickled over, as workers load theirs from the database
+_pool_offers = []
+
+
+def _render_range(bounds):
+    # Runs in a pool process, as a render task would on a worker
+    start, end = bounds
+    return len(render_letters(_pool_offers[start:end]))
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures offer letter rendering throughput: one process rendering "
+        "a batch versus looking the template up per letter, a pool of "
+        "processes rendering OFFER_LETTER_CHUNK_SIZE chunks (what several "
+        "workers on the reports queue do), and the full batch path through "
+        "the database. Database fixtures are rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--count", type=int, default=5000, help="Letters to render")
+        parser.add_argument("--workers", type=int, default=4, help="Processes in the pool")
+        parser.add_argument("--db-count", type=int, default=1000, help="Offers in the database batch; 0 skips it")
+
+    def handle(self, *args, **options):
+        count = options["count"]
+        offers = self._offers(count)
+        chunk_size = settings.OFFER_LETTER_CHUNK_SIZE
+        chunks = [(start, start + chunk_size) for start in range(0, count, chunk_size)]
+
+        # Warm the template loader cache, as a running worker would be
+        render_letters(offers[:1])
+
+        start = time.perf_counter()
+        render_letters(offers)
+        self._report("1 process, batch", count, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for offer in offers:
+            get_template(LETTER_TEMPLATE).render(letter_context(offer))
+        self._report("1 process, lookup each", count, time.perf_counter() - start)
+
+        # Forked children inherit the configured Django and the warm cache.
+        # Only helps with as many free cores as workers.
+        _pool_offers[:] = offers
+        with multiprocessing.get_context("fork").Pool(options["workers"]) as pool:
+            pool.map(_render_range, [(0, 1)] * options["workers"])
+            start = time.perf_counter()
+            rendered = sum(pool.map(_render_range, chunks))
+            self._report(f"{options['workers']} processes, {chunk_size}/chunk", rendered, time.perf_counter() - start)
+
+        if options["db_count"]:
+            self._bench_batch(options["db_count"])
+
+    def _offers(self, count):
+        """
+        Unsaved offers with their application, candidate, job and company
+        attached, so rendering touches no database.
+        """
+        company = Company(name="Acme & Sons")
+        job = Job(company=company, title="Backend Engineer")
+        return [
+            Offer(
+                application=Application(
+                    job=job, candidate=User(first_name="Candidate", last_name=str(i), email=f"c{i}@example.com")
+                ),
+                salary=Decimal("85000.00") + i,
+                currency="USD",
+                start_date=date(2030, 1, 1),
+                terms="Hybrid, three days a week in the office.\nRelocation package included.",
+            )
+            for i in range(count)
+        ]
+
+    def _bench_batch(self, count):
+        with rolled_back():
+            owner = User.objects.create(email="bench-offers@bench.example.com", first_name="Bench", last_name="Owner")
+            company = Company.objects.create(name="Bench Offers Co", created_by=owner)
+            job = Job.objects.create(company=company, created_by=owner, title="Engineer", description="...")
+            candidates = User.objects.bulk_create([
+                User(email=f"bench-offer-{i}@bench.example.com", first_name="Candidate", last_name=str(i))
+                for i in range(count)
+            ])
+            applications = Application.objects.bulk_create([
+                Application(job=job, candidate=candidate) for candidate in candidates
+            ])
+            batch = OfferBatch.objects.create(job=job, created_by=owner, total=count)
+            Offer.objects.bulk_create([
+                Offer(
+                    application=application,
+                    batch=batch,
+                    created_by=owner,
+                    salary=Decimal("85000.00"),
+                    start_date=date(2030, 1, 1),
+                )
+                for application in applications
+            ])
+
+            with CaptureQueriesContext(connection) as queries:
+                start = time.perf_counter()
+                chunks = start_offer_batch(batch_id=batch.id)
+                rendered = sum(render_offer_chunk(batch_id=batch.id, offer_ids=chunk) for chunk in chunks)
+                elapsed = time.perf_counter() - start
+
+            batch.refresh_from_db()
+            self._report("batch through the database", rendered, elapsed)
+            self.stdout.write(
+                f"  {len(chunks)} chunks, {len(queries)} queries ({len(queries) / len(chunks):.1f} per chunk), "
+                f"batch {batch.status} at {batch.rendered}/{batch.total}"
+            )
+
+    def _report(self, label, count, seconds):
+        self.stdout.write(
+            f"{label:34} {count} letters in {seconds:.2f}s "
+            f"({count / seconds:,.0f}/s, {seconds / count * 1e6:.0f} µs each)"
+        )
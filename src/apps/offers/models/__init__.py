@@ -0,0 +1,2 @@
+from .offer_batch import OfferBatch
+from .offer import Offer
\ No newline at end of file
@@ -0,0 +1,93 @@
+from django.conf import settings
+from django.db import models
+
+from apps.applications.models import Application
+
+from .offer_batch import OfferBatch
+
+
+class Offer(models.Model):
+
+    class Status(models.TextChoices):
+        PENDING_APPROVAL = "pending_approval", "Pending approval"
+        APPROVED = "approved", "Approved"
+        REJECTED = "rejected", "Rejected"
+        ACCEPTED = "accepted", "Accepted"
+        DECLINED = "declined", "Declined"
+
+    # An application has at most one offer in these
+    OPEN_STATUSES = [Status.PENDING_APPROVAL, Status.APPROVED, Status.ACCEPTED]
+
+    # Shown to the candidate
+    EXTENDED_STATUSES = [Status.APPROVED, Status.ACCEPTED, Status.DECLINED]
+
+    application = models.ForeignKey(
+        Application,
+        on_delete=models.CASCADE,
+        related_name="offers"
+    )
+
+    # Null for offers made one at a time
+    batch = models.ForeignKey(
+        OfferBatch,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        db_index=False,
+        related_name="offers"
+    )
+
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="offers_created"
+    )
+
+    salary = models.DecimalField(max_digits=12, decimal_places=2)
+    currency = models.CharField(max_length=3, default="USD")
+    start_date = models.DateField()
+    terms = models.TextField(blank=True)
+
+    status = models.CharField(
+        max_length=20,
+        choices=Status.choices,
+        default=Status.PENDING_APPROVAL
+    )
+
+    # The Admin or Hiring Manager who approved or rejected it
+    decided_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="offers_decided"
+    )
+    decided_at = models.DateTimeField(null=True, blank=True)
+
+    # Rendered offer letter (HTML); empty until its batch chunk is rendered
+    letter = models.TextField(blank=True, editable=False)
+    letter_rendered_at = models.DateTimeField(null=True, blank=True, editable=False)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+        constraints = [
+            # Concurrent offers to the same application cannot both be open
+            models.UniqueConstraint(
+                fields=["application"],
+                condition=models.Q(status__in=["pending_approval", "approved", "accepted"]),
+                name="offer_open_application_uniq",
+            ),
+        ]
+        indexes = [
+            # Offers of a batch by status (approve the whole batch)
+            models.Index(
+                fields=["batch", "status"],
+                name="offer_batch_status_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"Offer {self.pk} for {self.application_id} ({self.status})"
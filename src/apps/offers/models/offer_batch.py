@@ -0,0 +1,52 @@
+from django.conf import settings
+from django.db import models
+
+from apps.jobs.models import Job
+
+
+class OfferBatch(models.Model):
+    """
+    Offers issued to a cohort of a job's applicants in one request. Their
+    letters are rendered by background workers; `rendered` tracks progress.
+    """
+
+    class Status(models.TextChoices):
+        QUEUED = "queued", "Queued"
+        RUNNING = "running", "Running"
+        DONE = "done", "Done"
+        FAILED = "failed", "Failed"
+
+    job = models.ForeignKey(
+        Job,
+        on_delete=models.CASCADE,
+        related_name="offer_batches"
+    )
+
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="offer_batches_created"
+    )
+
+    status = models.CharField(
+        max_length=20,
+        choices=Status.choices,
+        default=Status.QUEUED
+    )
+
+    # Offers in the batch, and how many letters are rendered so far;
+    # bumped with F() by every worker that finishes a chunk
+    total = models.PositiveIntegerField()
+    rendered = models.PositiveIntegerField(default=0)
+
+    error = models.TextField(blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"Batch {self.pk} of {self.job_id}: {self.rendered}/{self.total} ({self.status})"
@@ -0,0 +1,23 @@
+from apps.offers.models import Offer
+
+
+def list_job_offers(*, job, status=None):
+    """
+    Offers on one job's applications, optionally filtered by status.
+    The letters are left out; they are read one offer at a time.
+    """
+    queryset = Offer.objects.select_related("application__candidate").filter(
+        application__job=job
+    ).defer("letter")
+    if status:
+        queryset = queryset.filter(status=status)
+    return queryset
+
+
+def list_candidate_offers(*, user):
+    """
+    Offers extended to the user, with their letters.
+    """
+    return Offer.objects.select_related("application__job__company").filter(
+        application__candidate=user, status__in=Offer.EXTENDED_STATUSES
+    )
@@ -0,0 +1,83 @@
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from apps.offers.letters import LETTER_RELATED, render_letters
+from apps.offers.models import Offer, OfferBatch
+
+
+def start_offer_batch(*, batch_id):
+    """
+    Marks the batch running and splits the pending offers still without
+    a letter into chunks of OFFER_LETTER_CHUNK_SIZE ids, one per render
+    task. A retried batch therefore renders only what is missing.
+    """
+    OfferBatch.objects.filter(pk=batch_id, status=OfferBatch.Status.QUEUED).update(
+        status=OfferBatch.Status.RUNNING, started_at=timezone.now()
+    )
+    ids = list(
+        Offer.objects.filter(
+            batch_id=batch_id, status=Offer.Status.PENDING_APPROVAL, letter_rendered_at__isnull=True
+        )
+        .order_by("id")
+        .values_list("id", flat=True)
+    )
+    if not ids:
+        _finish_if_complete(batch_id=batch_id)
+
+    size = settings.OFFER_LETTER_CHUNK_SIZE
+    return [ids[start:start + size] for start in range(0, len(ids), size)]
+
+
+def render_offer_chunk(*, batch_id, offer_ids):
+    """
+    Renders the letters of one chunk: one query to load the offers with
+    everything the template needs, one bulk UPDATE to store them and one
+    to add them to the batch's progress. Offers already rendered, or
+    locked by another worker running the same chunk after a redelivery,
+    are skipped, so a chunk is never counted twice. So are offers rejected
+    before their letter was rendered.
+    Returns the number of letters rendered.
+    """
+    with transaction.atomic():
+        offers = list(
+            Offer.objects.select_for_update(skip_locked=True, of=("self",))
+            .select_related(*LETTER_RELATED)
+            .filter(id__in=offer_ids, status=Offer.Status.PENDING_APPROVAL, letter_rendered_at__isnull=True)
+        )
+        if not offers:
+            return 0
+
+        rendered_at = timezone.now()
+        for offer, letter in zip(offers, render_letters(offers)):
+            offer.letter = letter
+            offer.letter_rendered_at = rendered_at
+        Offer.objects.bulk_update(offers, ["letter", "letter_rendered_at"])
+
+        OfferBatch.objects.filter(pk=batch_id).update(rendered=F("rendered") + len(offers))
+
+    _finish_if_complete(batch_id=batch_id)
+    return len(offers)
+
+
+def fail_offer_batch(*, batch_id, error):
+    OfferBatch.objects.filter(pk=batch_id).exclude(status=OfferBatch.Status.DONE).update(
+        status=OfferBatch.Status.FAILED, error=error, finished_at=timezone.now()
+    )
+
+
+def drop_from_offer_batch(*, batch_id):
+    """
+    An offer rejected before its letter was rendered leaves the batch's
+    total, so the rest can still complete it.
+    """
+    OfferBatch.objects.filter(pk=batch_id).update(total=F("total") - 1)
+    _finish_if_complete(batch_id=batch_id)
+
+
+def _finish_if_complete(*, batch_id):
+    # Whichever worker renders the last chunk closes the batch
+    OfferBatch.objects.filter(
+        pk=batch_id, status=OfferBatch.Status.RUNNING, rendered__gte=F("total")
+    ).update(status=OfferBatch.Status.DONE, finished_at=timezone.now())
@@ -0,0 +1,200 @@
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from apps.applications.models import Application
+from apps.common.outbox import enqueue_task
+from apps.companies.models import Membership
+from apps.companies.selectors.roles import has_company_role
+from apps.offers.letters import render_letters
+from apps.offers.models import Offer, OfferBatch
+from apps.offers.services.letter_service import drop_from_offer_batch
+from apps.offers.tasks import render_offer_batch_task
+
+# Roles that can draft offers
+OFFER_CREATOR_ROLES = [Membership.Role.ADMIN, Membership.Role.RECRUITER]
+
+# Roles that can approve or reject them, never their own
+OFFER_APPROVER_ROLES = [Membership.Role.ADMIN, Membership.Role.HIRING_MANAGER]
+
+
+def _check_creator(*, user, company_id):
+    if not has_company_role(user=user, company_id=company_id, roles=OFFER_CREATOR_ROLES):
+        raise ValidationError("You cannot make offers for this company.")
+
+
+def _check_approver(*, user, company_id, created_by_id):
+    if not has_company_role(user=user, company_id=company_id, roles=OFFER_APPROVER_ROLES):
+        raise ValidationError("Only Admins and Hiring Managers can approve offers.")
+
+    if created_by_id == user.pk:
+        raise ValidationError("Offers must be approved by someone other than their author.")
+
+
+def create_offer(*, application, salary, start_date, created_by, currency="USD", terms=""):
+    """
+    Admin or Recruiter drafts an offer for an active application; it waits
+    for approval with its letter already rendered. An application has at
+    most one open offer, enforced by a partial unique constraint.
+    """
+    _check_creator(user=created_by, company_id=application.job.company_id)
+
+    if application.status != Application.Status.ACTIVE:
+        raise ValidationError("Offers can only be made on active applications.")
+
+    offer = Offer(
+        application=application,
+        created_by=created_by,
+        salary=salary,
+        currency=currency,
+        start_date=start_date,
+        terms=terms,
+    )
+    offer.letter = render_letters([offer])[0]
+    offer.letter_rendered_at = timezone.now()
+
+    try:
+        with transaction.atomic():
+            offer.save()
+    except IntegrityError:
+        raise ValidationError("This application already has an open offer.")
+
+    return offer
+
+
+def create_offer_batch(*, job, application_ids, salary, start_date, created_by, currency="USD", terms=""):
+    """
+    Offers the same terms to a cohort of a job's applicants in one request.
+
+    Applications that are not active or already have an open offer are
+    skipped, found with a single query. The rest get their offers with one
+    bulk_create, and one background job queued through the outbox renders
+    their letters; the returned batch reports its progress.
+    """
+    _check_creator(user=created_by, company_id=job.company_id)
+
+    eligible = list(
+        Application.objects.filter(job=job, id__in=application_ids, status=Application.Status.ACTIVE)
+        .exclude(offers__status__in=Offer.OPEN_STATUSES)
+        .order_by("id")
+        .values_list("id", flat=True)
+    )
+    if not eligible:
+        raise ValidationError("None of these applications can receive an offer.")
+
+    try:
+        with transaction.atomic():
+            batch = OfferBatch.objects.create(job=job, created_by=created_by, total=len(eligible))
+            Offer.objects.bulk_create([
+                Offer(
+                    application_id=application_id,
+                    batch=batch,
+                    created_by=created_by,
+                    salary=salary,
+                    currency=currency,
+                    start_date=start_date,
+                    terms=terms,
+                )
+                for application_id in eligible
+            ])
+            enqueue_task(render_offer_batch_task, batch.id)
+    except IntegrityError:
+        raise ValidationError("Some of these applications received an offer concurrently. Please retry.")
+
+    return batch
+
+
+def approve_offer(*, offer, approved_by):
+    """
+    Admin or Hiring Manager approves a pending offer, which extends it to
+    the candidate.
+    """
+    return _decide(offer=offer, decided_by=approved_by, status=Offer.Status.APPROVED)
+
+
+def reject_offer(*, offer, rejected_by):
+    """
+    Rejects a pending offer, with or without its letter: an offer stranded
+    by a failed batch can be withdrawn so its application is free for
+    another offer.
+    """
+    if offer.letter_rendered_at is not None or offer.batch_id is None:
+        return _decide(offer=offer, decided_by=rejected_by, status=Offer.Status.REJECTED)
+
+    with transaction.atomic():
+        # Locked so a worker rendering it now either finishes first or skips it
+        offer.letter_rendered_at = (
+            Offer.objects.select_for_update().filter(pk=offer.pk).values_list("letter_rendered_at", flat=True).get()
+        )
+        _decide(offer=offer, decided_by=rejected_by, status=Offer.Status.REJECTED)
+        if offer.letter_rendered_at is None:
+            drop_from_offer_batch(batch_id=offer.batch_id)
+    return offer
+
+
+def _decide(*, offer, decided_by, status):
+    _check_approver(
+        user=decided_by, company_id=offer.application.job.company_id, created_by_id=offer.created_by_id
+    )
+
+    if offer.status != Offer.Status.PENDING_APPROVAL:
+        raise ValidationError("This offer is not awaiting approval.")
+
+    if status == Offer.Status.APPROVED and offer.letter_rendered_at is None:
+        raise ValidationError("The offer letter is still being generated.")
+
+    offer.status = status
+    offer.decided_by = decided_by
+    offer.decided_at = timezone.now()
+    offer.save(update_fields=["status", "decided_by", "decided_at", "updated_at"])
+    return offer
+
+
+def approve_offer_batch(*, batch, approved_by):
+    """
+    Approves every offer of a finished batch still awaiting approval,
+    with one UPDATE. Returns the number of offers approved.
+    """
+    _check_approver(user=approved_by, company_id=batch.job.company_id, created_by_id=batch.created_by_id)
+
+    if batch.status != OfferBatch.Status.DONE:
+        raise ValidationError("The batch's letters are still being generated.")
+
+    now = timezone.now()
+    return Offer.objects.filter(batch=batch, status=Offer.Status.PENDING_APPROVAL).update(
+        status=Offer.Status.APPROVED, decided_by=approved_by, decided_at=now, updated_at=now
+    )
+
+
+def retry_offer_batch(*, batch, retried_by):
+    """
+    Queues a failed batch again. Letters already rendered are kept; only
+    the missing ones are rendered.
+    """
+    _check_creator(user=retried_by, company_id=batch.job.company_id)
+
+    with transaction.atomic():
+        requeued = OfferBatch.objects.filter(pk=batch.pk, status=OfferBatch.Status.FAILED).update(
+            status=OfferBatch.Status.QUEUED, error="", finished_at=None
+        )
+        if not requeued:
+            raise ValidationError("Only failed batches can be retried.")
+        enqueue_task(render_offer_batch_task, batch.id)
+
+    batch.status, batch.error, batch.finished_at = OfferBatch.Status.QUEUED, "", None
+    return batch
+
+
+def respond_to_offer(*, offer, candidate, accept):
+    """
+    The candidate accepts or declines an approved offer.
+    """
+    if offer.application.candidate_id != candidate.pk:
+        raise ValidationError("This offer is not yours.")
+
+    if offer.status != Offer.Status.APPROVED:
+        raise ValidationError("This offer is not open for a response.")
+
+    offer.status = Offer.Status.ACCEPTED if accept else Offer.Status.DECLINED
+    offer.save(update_fields=["status", "updated_at"])
+    return offer
@@ -0,0 +1,33 @@
+from celery import shared_task
+
+from apps.offers.services.letter_service import fail_offer_batch, render_offer_chunk, start_offer_batch
+
+
+@shared_task(bind=True, ignore_result=True, max_retries=3)
+def render_offer_batch_task(self, batch_id: int):
+    """
+    Fans a batch out into one render task per chunk, so every worker on
+    the queue renders part of it in parallel. A retry after a partial
+    fan-out queues some chunks twice, which render_offer_chunk tolerates.
+    """
+    try:
+        chunks = start_offer_batch(batch_id=batch_id)
+        for chunk in chunks:
+            render_offer_letters_task.delay(batch_id, chunk)
+    except Exception as exc:
+        if self.request.retries >= self.max_retries:
+            fail_offer_batch(batch_id=batch_id, error=str(exc))
+            raise
+        raise self.retry(exc=exc, countdown=10)
+    return len(chunks)
+
+
+@shared_task(bind=True, ignore_result=True, max_retries=3)
+def render_offer_letters_task(self, batch_id: int, offer_ids: list):
+    try:
+        return render_offer_chunk(batch_id=batch_id, offer_ids=offer_ids)
+    except Exception as exc:
+        if self.request.retries >= self.max_retries:
+            fail_offer_batch(batch_id=batch_id, error=str(exc))
+            raise
+        raise self.retry(exc=exc, countdown=10)
@@ -1,3 +1,169 @@
-from django.test import TestCase
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.test import override_settings
+from rest_framework.test import APITestCase
+
+from apps.applications.models import Application
+from apps.common.models import OutboxMessage
+from apps.companies.models import Company, Membership
+from apps.jobs.models import Job
+from apps.offers.models import Offer, OfferBatch
+from apps.offers.services.letter_service import render_offer_chunk
+from apps.offers.tasks import render_offer_batch_task, render_offer_letters_task
+from apps.users.models import User
+from apps.users.tokens import UserRefreshToken
+
+TERMS = {"salary": "85000.00", "currency": "EUR", "start_date": "2030-01-01", "terms": "Hybrid."}
+
+
+def _user(email, **extra):
+    return User.objects.create_user(
+        email=email, password="pass", first_name="Test", last_name="User", dob="1990-01-01", **extra
+    )
+
+
+class OfferTests(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.recruiter = _user("recruiter@example.com")
+        cls.manager = _user("manager@example.com")
+        cls.company = Company.objects.create(name="Acme", created_by=cls.recruiter)
+        Membership.objects.bulk_create([
+            Membership(user=cls.recruiter, company=cls.company, role=Membership.Role.RECRUITER),
+            Membership(user=cls.manager, company=cls.company, role=Membership.Role.HIRING_MANAGER),
+        ])
+        cls.job = Job.objects.create(
+            company=cls.company, created_by=cls.recruiter, title="Engineer", description="...", status=Job.Status.OPEN
+        )
+        cls.candidates = User.objects.bulk_create([
+            User(email=f"candidate-{i}@example.com", first_name="Can", last_name=str(i)) for i in range(7)
+        ])
+        cls.applications = Application.objects.bulk_create([
+            Application(job=cls.job, candidate=candidate) for candidate in cls.candidates
+        ])
+
+    def setUp(self):
+        cache.clear()
+        self.login(self.recruiter)
+
+    def login(self, user):
+        token = UserRefreshToken.for_user(user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def offer(self, application):
+        return self.client.post("/api/offers/", {"application": application.id, **TERMS}, format="json")
+
+    def test_offer_needs_approval_by_someone_else(self):
+        response = self.offer(self.applications[0])
+        self.assertEqual(response.status_code, 201)
+        self.assertTrue(response.data["letter_ready"])
+        offer = Offer.objects.get()
+        self.assertIn("Engineer", offer.letter)
+        self.assertIn("EUR 85,000.00", offer.letter)
+
+        # Recruiters draft, they do not approve
+        self.assertEqual(self.client.post(f"/api/offers/{offer.id}/approve/").status_code, 400)
+
+        self.login(self.manager)
+        response = self.client.post(f"/api/offers/{offer.id}/approve/")
+        self.assertEqual(response.data["status"], Offer.Status.APPROVED)
+
+        # One open offer per application
+        self.login(self.recruiter)
+        self.assertEqual(self.offer(self.applications[0]).status_code, 400)
+
+    def test_candidate_sees_and_answers_approved_offers_only(self):
+        self.offer(self.applications[0])
+        offer = Offer.objects.get()
+        self.login(self.candidates[0])
+
+        self.assertEqual(self.client.get("/api/offers/mine/").data["results"], [])
+        self.assertEqual(self.client.post(f"/api/offers/{offer.id}/respond/", {"accept": True}).status_code, 400)
+
+        Offer.objects.filter(pk=offer.pk).update(status=Offer.Status.APPROVED)
+        [mine] = self.client.get("/api/offers/mine/").data["results"]
+        self.assertIn("Dear Can 0", mine["letter"])
+
+        response = self.client.post(f"/api/offers/{offer.id}/respond/", {"accept": True})
+        self.assertEqual(response.data["status"], Offer.Status.ACCEPTED)
+
+    @override_settings(OFFER_LETTER_CHUNK_SIZE=3)
+    def test_cohort_offers_are_one_background_job(self):
+        self.offer(self.applications[0])
+        ids = [application.id for application in self.applications]
+
+        response = self.client.post(f"/api/offers/jobs/{self.job.id}/batches/", {"application_ids": ids, **TERMS}, format="json")
+
+        # The application with an open offer is skipped
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual((response.data["total"], response.data["progress"]), (6, 0.0))
+        message = OutboxMessage.objects.get()
+        self.assertEqual(message.task_name, render_offer_batch_task.name)
+
+        # What the workers do: fan out, then one task per chunk of 3
+        with mock.patch.object(
+            render_offer_letters_task, "delay", side_effect=lambda *args: render_offer_letters_task(*args)
+        ) as delay:
+            render_offer_batch_task(*message.args)
+        self.assertEqual(delay.call_count, 2)
+
+        response = self.client.get(f"/api/offers/batches/{response.data['id']}/")
+        self.assertEqual(response.data["status"], OfferBatch.Status.DONE)
+        self.assertEqual((response.data["rendered"], response.data["progress"]), (6, 1.0))
+
+        self.login(self.manager)
+        response = self.client.post(f"/api/offers/batches/{response.data['id']}/approve/")
+        self.assertEqual(response.data, {"approved": 6})
+        self.assertEqual(Offer.objects.filter(status=Offer.Status.APPROVED).count(), 6)
+
+    def test_redelivered_chunk_is_not_counted_twice(self):
+        batch = OfferBatch.objects.create(
+            job=self.job, created_by=self.recruiter, total=2, status=OfferBatch.Status.RUNNING
+        )
+        offers = Offer.objects.bulk_create([
+            Offer(application=application, batch=batch, created_by=self.recruiter, salary=1, start_date="2030-01-01")
+            for application in self.applications[:2]
+        ])
+        ids = [offer.id for offer in offers]
+
+        self.assertEqual(render_offer_chunk(batch_id=batch.id, offer_ids=ids), 2)
+        self.assertEqual(render_offer_chunk(batch_id=batch.id, offer_ids=ids), 0)
+
+        batch.refresh_from_db()
+        self.assertEqual((batch.rendered, batch.status), (2, OfferBatch.Status.DONE))
+
+    def test_failed_batch_can_be_retried_and_its_offers_rejected(self):
+        ids = [application.id for application in self.applications[:3]]
+        response = self.client.post(f"/api/offers/jobs/{self.job.id}/batches/", {"application_ids": ids, **TERMS}, format="json")
+        batch_id = response.data["id"]
+
+        # The fan-out runs out of retries
+        with mock.patch("apps.offers.tasks.start_offer_batch", side_effect=RuntimeError("database down")):
+            render_offer_batch_task.apply(args=(batch_id,), retries=render_offer_batch_task.max_retries)
+        batch = OfferBatch.objects.get(pk=batch_id)
+        self.assertEqual((batch.status, batch.error), (OfferBatch.Status.FAILED, "database down"))
+
+        # An offer without a letter can still be rejected, freeing its application
+        self.login(self.manager)
+        self.assertEqual(self.client.post(f"/api/offers/batches/{batch_id}/approve/").status_code, 400)
+        offer = Offer.objects.get(application=self.applications[0])
+        self.assertEqual(self.client.post(f"/api/offers/{offer.id}/reject/").data["status"], Offer.Status.REJECTED)
+        self.login(self.recruiter)
+        self.assertEqual(self.offer(self.applications[0]).status_code, 201)
+
+        response = self.client.post(f"/api/offers/batches/{batch_id}/retry/")
+        self.assertEqual((response.status_code, response.data["status"]), (202, OfferBatch.Status.QUEUED))
+        self.assertEqual(self.client.post(f"/api/offers/batches/{batch_id}/retry/").status_code, 400)
+
+        message = OutboxMessage.objects.latest("id")
+        with mock.patch.object(
+            render_offer_letters_task, "delay", side_effect=lambda *args: render_offer_letters_task(*args)
+        ):
+            render_offer_batch_task(*message.args)
+
+        batch.refresh_from_db()
+        self.assertEqual((batch.status, batch.rendered, batch.total), (OfferBatch.Status.DONE, 2, 2))
+        self.login(self.manager)
+        self.assertEqual(self.client.post(f"/api/offers/batches/{batch_id}/approve/").data, {"approved": 2})
@@ -1,5 +1,12 @@
+import time
+
+from django.core.cache import cache
+
+from apps.common import metrics
 from apps.users.models import User
-from .utils import generate_secret, generate_otp, verify_otp
+from .utils import OTP_INTERVAL, generate_secret, generate_otp, verify_otp
+
+OTP_PURPOSES = ("verify", "login", "reset")
 
 
 def ensure_user_secret(user: User) -> None:
@@ -33,3 +40,33 @@ def clear_user_otp(user: User) -> None:
     """
     user.otp_secret = None
     user.save(update_fields=["otp_secret"])
+
+    # The next request gets a new secret, so it must not be coalesced
+    # with a code that was already used
+    release_otp_delivery(user_id=user.pk)
+
+
+def _delivery_key(user_id, purpose, window):
+    return f"otp:delivery:{user_id}:{purpose}:{window}"
+
+
+def claim_otp_delivery(*, user_id, purpose) -> bool:
+    """
+    Coalesces OTP sends. Returns True for the first request for
+    (user, purpose) in the current TOTP window; later requests in the
+    same window return False, since the code they would send is the
+    one already on its way.
+    """
+    window = int(time.time()) // OTP_INTERVAL
+    claimed = cache.add(_delivery_key(user_id, purpose, window), 1, timeout=OTP_INTERVAL)
+    if not claimed:
+        metrics.increment("otp.deduplicated")
+    return claimed
+
+
+def release_otp_delivery(*, user_id, purposes=OTP_PURPOSES) -> None:
+    """
+    Forgets delivery claims so the next request sends a fresh email.
+    """
+    window = int(time.time()) // OTP_INTERVAL
+    cache.delete_many([_delivery_key(user_id, purpose, window) for purpose in purposes])
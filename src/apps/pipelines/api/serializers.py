@@ -0,0 +1,46 @@
+from rest_framework import serializers
+
+from apps.pipelines.models import Stage
+
+
+class StageSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Stage
+        fields = ["id", "name", "outcome", "applications_count"]
+
+
+class BoardColumnSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Stage
+        fields = ["id", "name", "outcome", "applications_count", "cards"]
+
+
+class CreateStageSerializer(serializers.Serializer):
+    name = serializers.CharField(max_length=100)
+    outcome = serializers.ChoiceField(choices=Stage.Outcome.choices, allow_blank=True, default="")
+    # Appended last when omitted
+    after = serializers.PrimaryKeyRelatedField(queryset=Stage.objects.all(), required=False, allow_null=True)
+
+
+class ReorderStageSerializer(serializers.Serializer):
+    # null places the stage first
+    after = serializers.PrimaryKeyRelatedField(queryset=Stage.objects.all(), allow_null=True)
+
+
+class MoveApplicationsSerializer(serializers.Serializer):
+    to_stage = serializers.PrimaryKeyRelatedField(queryset=Stage.objects.all())
+    application_ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        allow_empty=False,
+        max_length=5000,
+        required=False,
+    )
+    from_stage = serializers.PrimaryKeyRelatedField(queryset=Stage.objects.all(), required=False)
+    # Every active application of the job, e.g. "reject all remaining"
+    all = serializers.BooleanField(default=False)
+
+    def validate(self, attrs):
+        selectors = [attrs.get("application_ids") is not None, "from_stage" in attrs, attrs["all"]]
+        if sum(selectors) != 1:
+            raise serializers.ValidationError("Give exactly one of application_ids, from_stage or all.")
+        return attrs
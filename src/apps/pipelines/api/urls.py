@@ -0,0 +1,16 @@
+from django.urls import path
+from .views import (
+    BoardView,
+    JobStagesView,
+    MoveApplicationsView,
+    ReorderStageView,
+    StageDetailView,
+)
+
+urlpatterns = [
+    path("jobs/<int:job_id>/stages/", JobStagesView.as_view()),
+    path("jobs/<int:job_id>/move/", MoveApplicationsView.as_view()),
+    path("jobs/<int:job_id>/board/", BoardView.as_view()),
+    path("stages/<int:stage_id>/", StageDetailView.as_view()),
+    path("stages/<int:stage_id>/reorder/", ReorderStageView.as_view()),
+]
@@ -0,0 +1,151 @@
+from django.core.exceptions import ValidationError
+from django.shortcuts import get_object_or_404
+from rest_framework import status
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.generics import GenericAPIView
+from rest_framework.response import Response
+from drf_spectacular.utils import extend_schema, OpenApiParameter
+
+from apps.companies.selectors.roles import get_company_role, get_user_company_ids
+from apps.jobs.models import Job
+from apps.pipelines.models import Stage
+from apps.pipelines.services.pipeline_service import (
+    add_stage,
+    delete_stage,
+    move_applications,
+    reorder_stage,
+)
+
+from .serializers import (
+    BoardColumnSerializer,
+    CreateStageSerializer,
+    MoveApplicationsSerializer,
+    ReorderStageSerializer,
+    StageSerializer,
+)
+
+
+def _error(e):
+    return Response({"detail": e.messages}, status=status.HTTP_400_BAD_REQUEST)
+
+
+class JobStagesView(GenericAPIView):
+    """
+    GET: the job's stages in order, with their application counts.
+    POST: add a stage.
+    """
+    serializer_class = CreateStageSerializer
+
+    def get_job(self):
+        return get_object_or_404(Job.objects.only("id", "company_id"), id=self.kwargs["job_id"])
+
+    def get(self, request, job_id):
+        job = self.get_job()
+        if get_company_role(user=request.user, company_id=job.company_id) is None:
+            raise PermissionDenied("You are not a member of this job's company.")
+
+        stages = Stage.objects.filter(job=job).order_by("rank")
+        return Response(StageSerializer(stages, many=True).data)
+
+    def post(self, request, job_id):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            stage = add_stage(
+                job=self.get_job(),
+                name=serializer.validated_data["name"],
+                outcome=serializer.validated_data["outcome"],
+                after=serializer.validated_data.get("after"),
+                created_by=request.user,
+            )
+        except ValidationError as e:
+            return _error(e)
+
+        return Response(StageSerializer(stage).data, status=status.HTTP_201_CREATED)
+
+
+class BoardView(GenericAPIView):
+    """
+    The job's kanban board: every stage with its count and newest cards,
+    read from the stage rows in a single query.
+    Optional: ?cards=<n> to return fewer cards per column.
+    """
+    serializer_class = BoardColumnSerializer
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(name="cards", description="Cards per column (max BOARD_CARDS_PER_STAGE)", type=int),
+        ]
+    )
+    def get(self, request, job_id):
+        # Membership is part of the query, so allowed requests need no
+        # separate job lookup
+        columns = list(Stage.objects.filter(
+            job_id=job_id, job__company_id__in=get_user_company_ids(user=request.user)
+        ).order_by("rank"))
+
+        if not columns:
+            job = get_object_or_404(Job.objects.only("id", "company_id"), id=job_id)
+            if get_company_role(user=request.user, company_id=job.company_id) is None:
+                raise PermissionDenied("You are not a member of this job's company.")
+
+        limit = request.query_params.get("cards")
+        if limit is not None and limit.isdigit():
+            for column in columns:
+                column.cards = column.cards[:int(limit)]
+
+        return Response({"job": job_id, "columns": self.get_serializer(columns, many=True).data})
+
+
+class StageDetailView(GenericAPIView):
+    serializer_class = StageSerializer
+
+    def delete(self, request, stage_id):
+        stage = get_object_or_404(Stage.objects.select_related("job"), id=stage_id)
+        try:
+            delete_stage(stage=stage, deleted_by=request.user)
+        except ValidationError as e:
+            return _error(e)
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class ReorderStageView(GenericAPIView):
+    serializer_class = ReorderStageSerializer
+
+    def post(self, request, stage_id):
+        stage = get_object_or_404(Stage.objects.select_related("job"), id=stage_id)
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            reorder_stage(stage=stage, after=serializer.validated_data["after"], moved_by=request.user)
+        except ValidationError as e:
+            return _error(e)
+
+        return Response(StageSerializer(stage).data)
+
+
+class MoveApplicationsView(GenericAPIView):
+    """
+    Moves one, many or all applications of a job into a stage.
+    """
+    serializer_class = MoveApplicationsSerializer
+
+    def post(self, request, job_id):
+        job = get_object_or_404(Job.objects.only("id", "company_id"), id=job_id)
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            moved = move_applications(
+                job=job,
+                to_stage=serializer.validated_data["to_stage"],
+                moved_by=request.user,
+                application_ids=serializer.validated_data.get("application_ids"),
+                from_stage=serializer.validated_data.get("from_stage"),
+            )
+        except ValidationError as e:
+            return _error(e)
+
+        return Response({"moved": moved})
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from apps.jobs.models import Job
+from apps.pipelines.services.board_service import rebuild_board
+
+
+class Command(BaseCommand):
+    help = (
+        "Recomputes the denormalized application counters and board cards "
+        "of every job (or one job) from the applications table."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--job", type=int, help="Only this job id")
+
+    def handle(self, *args, **options):
+        jobs = Job.objects.only("id")
+        if options["job"]:
+            jobs = jobs.filter(id=options["job"])
+
+        rebuilt = 0
+        for job in jobs.iterator():
+            rebuild_board(job=job)
+            rebuilt += 1
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {rebuilt} board(s)."))
@@ -0,0 +1,32 @@
+# Generated by Django 6.0.1 on 2026-10-18 10:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('jobs', '0004_job_applications_count'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Stage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('rank', models.PositiveIntegerField()),
+                ('outcome', models.CharField(blank=True, choices=[('hired', 'Hired'), ('rejected', 'Rejected')], max_length=20)),
+                ('applications_count', models.PositiveIntegerField(default=0, editable=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='stages', to='jobs.job')),
+            ],
+            options={
+                'ordering': ['rank'],
+                'indexes': [models.Index(fields=['job', 'rank'], name='stage_job_rank_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,54 @@
+from django.db import migrations
+
+RANK_GAP = 1024
+
+# Frozen copy of pipeline_service.DEFAULT_STAGES
+DEFAULT_STAGES = [
+    ("Applied", ""),
+    ("Screening", ""),
+    ("Interview", ""),
+    ("Offer", ""),
+    ("Hired", "hired"),
+    ("Rejected", "rejected"),
+]
+
+
+def backfill_default_stages(apps, schema_editor):
+    """
+    Gives jobs created before pipelines the default stages, places their
+    applications by status (hired / rejected, everything else in Applied)
+    and fills the stage counters.
+    """
+    Job = apps.get_model("jobs", "Job")
+    Stage = apps.get_model("pipelines", "Stage")
+    Application = apps.get_model("applications", "Application")
+
+    for job in Job.objects.filter(stages__isnull=True).iterator():
+        stages = Stage.objects.bulk_create([
+            Stage(job=job, name=name, outcome=outcome, rank=(i + 1) * RANK_GAP)
+            for i, (name, outcome) in enumerate(DEFAULT_STAGES)
+        ])
+        by_outcome = {stage.outcome: stage for stage in stages}
+
+        applications = Application.objects.filter(job=job, stage__isnull=True)
+        applications.filter(status="hired").update(stage=by_outcome["hired"])
+        applications.filter(status="rejected").update(stage=by_outcome["rejected"])
+        applications.update(stage=by_outcome[""])
+
+        for stage in stages:
+            stage.applications_count = Application.objects.filter(stage=stage).exclude(
+                status="withdrawn"
+            ).count()
+        Stage.objects.bulk_update(stages, ["applications_count"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pipelines', '0001_initial'),
+        ('applications', '0002_application_stage'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_default_stages, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 6.0.1 on 2026-10-18 10:00
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def fill_cards(apps, schema_editor):
+    """
+    Builds the board cards of existing stages (same shape as
+    board_service.card_for).
+    """
+    Stage = apps.get_model("pipelines", "Stage")
+    Application = apps.get_model("applications", "Application")
+
+    for stage in Stage.objects.filter(applications_count__gt=0).iterator():
+        newest = (
+            Application.objects.filter(stage=stage)
+            .exclude(status="withdrawn")
+            .select_related("candidate")
+            .order_by("-created_at", "-id")[:settings.BOARD_CARDS_PER_STAGE]
+        )
+        stage.cards = [
+            {
+                "id": application.id,
+                "candidate_id": application.candidate.pk,
+                "candidate_name": " ".join(filter(None, [
+                    application.candidate.first_name,
+                    application.candidate.middle_name,
+                    application.candidate.last_name,
+                ])),
+                "candidate_email": application.candidate.email,
+                "status": application.status,
+                "applied_at": application.created_at.isoformat(),
+            }
+            for application in newest
+        ]
+        stage.save(update_fields=["cards"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pipelines', '0002_backfill_default_stages'),
+        ('applications', '0002_application_stage'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='stage',
+            name='cards',
+            field=models.JSONField(default=list, editable=False),
+        ),
+        migrations.RunPython(fill_cards, migrations.RunPython.noop),
+    ]
@@ -0,0 +1 @@
+from .stage import Stage
\ No newline at end of file
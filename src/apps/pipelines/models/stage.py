@@ -0,0 +1,56 @@
+from django.db import models
+
+from apps.jobs.models import Job
+
+# Ranks are spaced this far apart, so a stage can be placed between two
+# others ~10 times before the job's stages have to be renumbered
+RANK_GAP = 1024
+
+
+class Stage(models.Model):
+
+    class Outcome(models.TextChoices):
+        # Application status set when an application enters the stage;
+        # blank stages keep (or restore) the application as active
+        HIRED = "hired", "Hired"
+        REJECTED = "rejected", "Rejected"
+
+    job = models.ForeignKey(
+        Job,
+        on_delete=models.CASCADE,
+        related_name="stages"
+    )
+
+    name = models.CharField(max_length=100)
+
+    # Sparse sort key; moving a stage rewrites only its own rank
+    rank = models.PositiveIntegerField()
+
+    outcome = models.CharField(
+        max_length=20,
+        choices=Outcome.choices,
+        blank=True
+    )
+
+    # Denormalized: non-withdrawn applications in the stage, adjusted
+    # with F() expressions on every transition instead of COUNT(*)
+    applications_count = models.PositiveIntegerField(default=0, editable=False)
+
+    # Board read model: summaries of the newest BOARD_CARDS_PER_STAGE
+    # applications, so the board is read from the stage rows alone
+    cards = models.JSONField(default=list, editable=False)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["rank"]
+        indexes = [
+            # Stages of a job in board order
+            models.Index(
+                fields=["job", "rank"],
+                name="stage_job_rank_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.job_id})"
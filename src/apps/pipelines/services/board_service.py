@@ -0,0 +1,93 @@
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, F, Window
+from django.db.models.functions import RowNumber
+
+from apps.applications.models import Application
+from apps.jobs.models import Job
+from apps.pipelines.models import Stage
+
+
+def card_for(application, candidate):
+    """
+    Summary of an application shown on the board, stored as JSON.
+    """
+    return {
+        "id": application.id,
+        "candidate_id": candidate.pk,
+        "candidate_name": candidate.get_full_name,
+        "candidate_email": candidate.email,
+        "status": application.status,
+        "applied_at": application.created_at.isoformat(),
+    }
+
+
+def push_card(*, stage, application, candidate):
+    """
+    Cards of `stage` with a just-submitted application on top. The newest
+    application always leads the column, so no query is needed; the
+    caller writes the result together with the counter.
+    """
+    limit = settings.BOARD_CARDS_PER_STAGE
+    return [card_for(application, candidate)] + stage.cards[:limit - 1]
+
+
+def refresh_board_columns(*, stage_ids):
+    """
+    Recomputes the cards of the given stages after applications moved
+    between them: one windowed SELECT for the newest applications of
+    every stage, one UPDATE for all the columns.
+    """
+    stage_ids = list(stage_ids)
+    if not stage_ids:
+        return
+
+    newest = (
+        Application.objects.filter(stage_id__in=stage_ids)
+        .exclude(status=Application.Status.WITHDRAWN)
+        .select_related("candidate")
+        .only(
+            "id", "stage_id", "status", "created_at",
+            "candidate__id", "candidate__email",
+            "candidate__first_name", "candidate__middle_name", "candidate__last_name",
+        )
+        .annotate(position=Window(
+            RowNumber(),
+            partition_by=[F("stage_id")],
+            order_by=[F("created_at").desc(), F("id").desc()],
+        ))
+        .filter(position__lte=settings.BOARD_CARDS_PER_STAGE)
+        .order_by("stage_id", "position")
+    )
+
+    cards = {stage_id: [] for stage_id in stage_ids}
+    for application in newest:
+        cards[application.stage_id].append(card_for(application, application.candidate))
+
+    Stage.objects.bulk_update(
+        [Stage(id=stage_id, cards=stage_cards) for stage_id, stage_cards in cards.items()],
+        ["cards"],
+    )
+
+
+def rebuild_board(*, job):
+    """
+    Recomputes a job's counters and cards from the applications table,
+    repairing drift from writes that bypassed the services (e.g. a user
+    deleted together with their applications).
+    """
+    with transaction.atomic():
+        stages = list(Stage.objects.select_for_update().filter(job=job))
+        counts = dict(
+            Application.objects.filter(job=job)
+            .exclude(status=Application.Status.WITHDRAWN)
+            .order_by()
+            .values_list("stage_id")
+            .annotate(count=Count("id"))
+        )
+        for stage in stages:
+            stage.applications_count = counts.get(stage.id, 0)
+        Stage.objects.bulk_update(stages, ["applications_count"])
+
+        Job.objects.filter(pk=job.pk).update(applications_count=Application.objects.filter(job=job).count())
+        refresh_board_columns(stage_ids=[stage.id for stage in stages])
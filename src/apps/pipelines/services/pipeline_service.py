@@ -0,0 +1,201 @@
+from collections import Counter
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import Case, F, IntegerField, When
+from django.utils import timezone
+
+from apps.applications.models import Application
+from apps.companies.models import Membership
+from apps.companies.selectors.roles import has_company_role
+from apps.pipelines.models import Stage
+from apps.pipelines.models.stage import RANK_GAP
+from apps.pipelines.services.board_service import refresh_board_columns
+
+# Stages every new job starts with
+DEFAULT_STAGES = [
+    ("Applied", ""),
+    ("Screening", ""),
+    ("Interview", ""),
+    ("Offer", ""),
+    ("Hired", Stage.Outcome.HIRED),
+    ("Rejected", Stage.Outcome.REJECTED),
+]
+
+# Roles allowed to change a job's stages (the job editors)
+PIPELINE_EDITOR_ROLES = [Membership.Role.ADMIN, Membership.Role.RECRUITER]
+
+# Roles allowed to move candidates between stages
+PIPELINE_MOVER_ROLES = PIPELINE_EDITOR_ROLES + [Membership.Role.HIRING_MANAGER]
+
+
+def create_default_stages(*, job):
+    """
+    Gives a new job the default pipeline, in one INSERT.
+    """
+    return Stage.objects.bulk_create([
+        Stage(job=job, name=name, outcome=outcome, rank=(i + 1) * RANK_GAP)
+        for i, (name, outcome) in enumerate(DEFAULT_STAGES)
+    ])
+
+
+def lock_stages(*, job_id):
+    """
+    Locks a job's stages. Every write to the pipeline (moves, withdrawals,
+    stage changes) takes it first, so counters, cards and ranks change
+    one writer at a time, always in the same lock order; call inside a
+    transaction.
+    """
+    list(Stage.objects.select_for_update().filter(job_id=job_id).values_list("id", flat=True))
+
+
+def get_entry_stage(*, job):
+    """
+    The stage new applications start in: the job's first one. Locked, so
+    concurrent submits update its cards one after the other; call inside
+    a transaction.
+    """
+    return Stage.objects.select_for_update().filter(job=job).order_by("rank").first()
+
+
+def _rank_after(*, job, after, moving=None):
+    """
+    Rank for a stage placed right after `after` (first when None): the
+    midpoint of its new neighbours' ranks. Only when the neighbours are
+    adjacent are the job's stages renumbered, in one bulk UPDATE.
+    """
+    stages = list(Stage.objects.filter(job=job).exclude(pk=getattr(moving, "pk", None)).order_by("rank"))
+
+    if after is None:
+        index = 0
+    else:
+        positions = [stage.pk for stage in stages]
+        if after.pk not in positions:
+            raise ValidationError("Stages can only be placed after another stage of the same job.")
+        index = positions.index(after.pk) + 1
+
+    lower = stages[index - 1].rank if index else 0
+    upper = stages[index].rank if index < len(stages) else lower + 2 * RANK_GAP
+
+    if upper - lower < 2:
+        for i, stage in enumerate(stages):
+            stage.rank = (i + 1) * RANK_GAP
+        Stage.objects.bulk_update(stages, ["rank"])
+        return _rank_after(job=job, after=after, moving=moving)
+
+    return (lower + upper) // 2
+
+
+def add_stage(*, job, name, outcome="", after=None, created_by):
+    """
+    Only Admin or Recruiter can add stages. Appended last unless `after`
+    is given.
+    """
+    if not has_company_role(user=created_by, company_id=job.company_id, roles=PIPELINE_EDITOR_ROLES):
+        raise ValidationError("You cannot change this job's pipeline.")
+
+    with transaction.atomic():
+        lock_stages(job_id=job.id)
+        if after is None:
+            last = Stage.objects.filter(job=job).order_by("-rank").first()
+            rank = (last.rank if last else 0) + RANK_GAP
+        else:
+            rank = _rank_after(job=job, after=after)
+
+        return Stage.objects.create(job=job, name=name, outcome=outcome, rank=rank)
+
+
+def reorder_stage(*, stage, after, moved_by):
+    """
+    Only Admin or Recruiter can reorder. Places the stage right after
+    `after` (first when None) by rewriting its rank alone.
+    """
+    if not has_company_role(user=moved_by, company_id=stage.job.company_id, roles=PIPELINE_EDITOR_ROLES):
+        raise ValidationError("You cannot change this job's pipeline.")
+
+    if after is not None and after.pk == stage.pk:
+        raise ValidationError("A stage cannot be placed after itself.")
+
+    with transaction.atomic():
+        lock_stages(job_id=stage.job_id)
+        stage.rank = _rank_after(job=stage.job, after=after, moving=stage)
+        stage.save(update_fields=["rank"])
+    return stage
+
+
+def delete_stage(*, stage, deleted_by):
+    """
+    Only Admin or Recruiter can delete, and only an empty stage. Withdrawn
+    applications are not in applications_count but still hold the stage.
+    """
+    if not has_company_role(user=deleted_by, company_id=stage.job.company_id, roles=PIPELINE_EDITOR_ROLES):
+        raise ValidationError("You cannot change this job's pipeline.")
+
+    with transaction.atomic():
+        lock_stages(job_id=stage.job_id)
+        if Application.objects.filter(stage=stage).exists():
+            raise ValidationError("Move the stage's applications elsewhere first.")
+        stage.delete()
+
+
+def move_applications(*, job, to_stage, moved_by, application_ids=None, from_stage=None):
+    """
+    Moves applications of a job into `to_stage` with one set-based UPDATE,
+    whether it is one candidate or "reject all 800 remaining":
+    - application_ids: exactly these applications
+    - from_stage: everything in that stage
+    - neither: every active application of the job
+    Withdrawn applications are never moved. Entering a stage sets the
+    application status to its outcome (or back to active).
+
+    The rows are locked and collected first, then exactly those are
+    updated, so a withdrawal racing the move is either moved or left out
+    of both. Stage counters are adjusted by the number of rows moved out
+    of each stage, in one more UPDATE, and the board cards of the stages
+    involved are recomputed. Returns the number of applications moved.
+    """
+    if not has_company_role(user=moved_by, company_id=job.company_id, roles=PIPELINE_MOVER_ROLES):
+        raise ValidationError("You cannot move candidates of this job.")
+
+    if to_stage.job_id != job.id or (from_stage is not None and from_stage.job_id != job.id):
+        raise ValidationError("Stages must belong to the job.")
+
+    applications = Application.objects.filter(job=job).exclude(stage=to_stage).exclude(
+        status=Application.Status.WITHDRAWN
+    )
+    if application_ids is not None:
+        applications = applications.filter(id__in=application_ids)
+    elif from_stage is not None:
+        applications = applications.filter(stage=from_stage)
+    else:
+        applications = applications.filter(status=Application.Status.ACTIVE)
+
+    with transaction.atomic():
+        # Locking the job's stages serializes moves within the job, so two
+        # moves of the same rows cannot both adjust the counters
+        lock_stages(job_id=job.id)
+
+        rows = list(applications.order_by().select_for_update().values_list("id", "stage_id"))
+        if not rows:
+            return 0
+        moved = len(rows)
+        moved_from = Counter(stage_id for _, stage_id in rows)
+
+        Application.objects.filter(id__in=[application_id for application_id, _ in rows]).update(
+            stage=to_stage,
+            status=to_stage.outcome or Application.Status.ACTIVE,
+            updated_at=timezone.now(),
+        )
+
+        deltas = {stage_id: -count for stage_id, count in moved_from.items() if stage_id is not None}
+        deltas[to_stage.id] = moved
+        Stage.objects.filter(id__in=deltas).update(
+            applications_count=Case(
+                *[When(id=stage_id, then=F("applications_count") + delta) for stage_id, delta in deltas.items()],
+                default=F("applications_count"),
+                output_field=IntegerField(),
+            )
+        )
+        refresh_board_columns(stage_ids=deltas)
+
+    return moved
@@ -1,3 +1,177 @@
-from django.test import TestCase
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.test import override_settings
+from rest_framework.test import APITestCase
+
+from apps.applications.models import Application
+from apps.applications.services.application_service import withdraw_application
+from apps.companies.models import Company, Membership
+from apps.jobs.models import Job
+from apps.pipelines.models import Stage
+from apps.pipelines.services.board_service import rebuild_board
+from apps.pipelines.services.pipeline_service import create_default_stages, lock_stages
+from apps.users.models import User
+from apps.users.tokens import UserRefreshToken
+
+
+@override_settings(JWT_TRUST_TOKEN_CLAIMS=True)
+class PipelineTests(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.recruiter = User.objects.create_user(
+            email="recruiter@example.com", password="pass", first_name="Rec", last_name="Ruiter", dob="1990-01-01"
+        )
+        cls.company = Company.objects.create(name="Acme", created_by=cls.recruiter)
+        Membership.objects.create(user=cls.recruiter, company=cls.company, role=Membership.Role.RECRUITER)
+        cls.job = Job.objects.create(
+            company=cls.company, created_by=cls.recruiter, title="Engineer", description="...", status=Job.Status.OPEN
+        )
+        cls.applied, cls.screening, cls.interview, cls.offer, cls.hired, cls.rejected = create_default_stages(job=cls.job)
+
+        candidates = User.objects.bulk_create([
+            User(email=f"candidate-{i}@example.com", first_name="Can", last_name=str(i)) for i in range(30)
+        ])
+        # 20 applied, 9 in screening, 1 hired
+        stages = [cls.applied] * 20 + [cls.screening] * 9 + [cls.hired]
+        Application.objects.bulk_create([
+            Application(job=cls.job, candidate=candidate, stage=stage,
+                        status=Application.Status.HIRED if stage.outcome else Application.Status.ACTIVE)
+            for candidate, stage in zip(candidates, stages)
+        ])
+        rebuild_board(job=cls.job)
+
+    def setUp(self):
+        cache.clear()
+        token = UserRefreshToken.for_user(self.recruiter).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def counts(self):
+        return dict(Stage.objects.filter(job=self.job).values_list("name", "applications_count"))
+
+    def move(self, **data):
+        return self.client.post(f"/api/pipelines/jobs/{self.job.id}/move/", data, format="json")
+
+    def test_reject_all_remaining_is_set_based(self):
+        # job + to_stage + stage locks + locked application rows + 1 UPDATE
+        # of the applications + 1 UPDATE of the counters + board cards (1 SELECT,
+        # 1 UPDATE), inside a savepoint
+        with self.assertNumQueries(10):
+            response = self.move(to_stage=self.rejected.id, all=True)
+
+        self.assertEqual(response.data, {"moved": 29})
+        self.assertEqual(
+            Application.objects.filter(status=Application.Status.REJECTED, stage=self.rejected).count(), 29
+        )
+        self.assertEqual(self.counts(), {
+            "Applied": 0, "Screening": 0, "Interview": 0, "Offer": 0, "Hired": 1, "Rejected": 29,
+        })
+
+    def test_moving_back_reactivates(self):
+        self.move(to_stage=self.rejected.id, from_stage=self.screening.id)
+        ids = list(Application.objects.filter(stage=self.rejected).values_list("id", flat=True)[:3])
+
+        response = self.move(to_stage=self.interview.id, application_ids=ids)
+
+        self.assertEqual(response.data, {"moved": 3})
+        self.assertEqual(
+            Application.objects.filter(id__in=ids, status=Application.Status.ACTIVE).count(), 3
+        )
+        self.assertEqual(self.counts()["Rejected"], 6)
+        self.assertEqual(self.counts()["Interview"], 3)
+
+    def test_move_needs_exactly_one_selection(self):
+        response = self.move(to_stage=self.rejected.id, all=True, from_stage=self.applied.id)
+        self.assertEqual(response.status_code, 400)
+
+    def test_reorder_rewrites_only_the_moved_stage(self):
+        ranks = dict(Stage.objects.filter(job=self.job).values_list("id", "rank"))
+
+        response = self.client.post(
+            f"/api/pipelines/stages/{self.rejected.id}/reorder/", {"after": self.applied.id}, format="json"
+        )
+
+        self.assertEqual(response.status_code, 200)
+        new_ranks = dict(Stage.objects.filter(job=self.job).values_list("id", "rank"))
+        changed = {stage_id for stage_id in ranks if ranks[stage_id] != new_ranks[stage_id]}
+        self.assertEqual(changed, {self.rejected.id})
+        self.assertEqual(
+            list(Stage.objects.filter(job=self.job).values_list("name", flat=True))[:3],
+            ["Applied", "Rejected", "Screening"],
+        )
+
+    def test_exhausted_gap_renumbers_the_job(self):
+        Stage.objects.filter(pk=self.applied.pk).update(rank=1)
+        Stage.objects.filter(pk=self.screening.pk).update(rank=2)
+
+        self.client.post(
+            f"/api/pipelines/stages/{self.offer.id}/reorder/", {"after": self.applied.id}, format="json"
+        )
+
+        self.assertEqual(
+            list(Stage.objects.filter(job=self.job).values_list("name", flat=True)),
+            ["Applied", "Offer", "Screening", "Interview", "Hired", "Rejected"],
+        )
+
+    def test_stage_with_applications_cannot_be_deleted(self):
+        response = self.client.delete(f"/api/pipelines/stages/{self.applied.id}/")
+        self.assertEqual(response.status_code, 400)
+
+        response = self.client.delete(f"/api/pipelines/stages/{self.offer.id}/")
+        self.assertEqual(response.status_code, 204)
+
+        # Withdrawn applications are not counted but still hold the stage
+        Application.objects.filter(stage=self.screening).update(status=Application.Status.WITHDRAWN)
+        Stage.objects.filter(pk=self.screening.pk).update(applications_count=0)
+        response = self.client.delete(f"/api/pipelines/stages/{self.screening.id}/")
+        self.assertEqual(response.status_code, 400)
+
+    def test_pipeline_writes_lock_the_job_stages(self):
+        application = Application.objects.filter(stage=self.applied).first()
+        with mock.patch(
+            "apps.applications.services.application_service.lock_stages", wraps=lock_stages
+        ) as locked:
+            withdraw_application(application=application, withdrawn_by=application.candidate)
+        locked.assert_called_once_with(job_id=self.job.id)
+
+        with mock.patch("apps.pipelines.services.pipeline_service.lock_stages", wraps=lock_stages) as locked:
+            response = self.client.post(f"/api/pipelines/jobs/{self.job.id}/stages/", {"name": "Extra"}, format="json")
+        self.assertEqual(response.status_code, 201)
+        locked.assert_called_once_with(job_id=self.job.id)
+
+    def board(self, **params):
+        return self.client.get(f"/api/pipelines/jobs/{self.job.id}/board/", params)
+
+    @override_settings(BOARD_CARDS_PER_STAGE=5)
+    def test_board_is_one_query_with_bounded_cards(self):
+        rebuild_board(job=self.job)
+
+        with self.assertNumQueries(1):
+            response = self.board()
+
+        self.assertEqual(response.status_code, 200)
+        columns = {column["name"]: column for column in response.data["columns"]}
+        self.assertEqual(list(columns), ["Applied", "Screening", "Interview", "Offer", "Hired", "Rejected"])
+        self.assertEqual(columns["Applied"]["applications_count"], 20)
+        self.assertEqual(len(columns["Applied"]["cards"]), 5)
+        self.assertEqual(len(self.board(cards=2).data["columns"][0]["cards"]), 2)
+
+    def test_board_follows_transitions(self):
+        newest = Application.objects.filter(stage=self.applied).latest("created_at", "id")
+
+        self.move(to_stage=self.interview.id, application_ids=[newest.id])
+
+        columns = {column["name"]: column for column in self.board().data["columns"]}
+        self.assertEqual([card["id"] for card in columns["Interview"]["cards"]], [newest.id])
+        self.assertNotIn(newest.id, [card["id"] for card in columns["Applied"]["cards"]])
+        self.assertEqual(len(columns["Applied"]["cards"]), 19)
+
+    def test_board_is_for_company_members(self):
+        outsider = User.objects.create_user(
+            email="outsider@example.com", password="pass", first_name="Out", last_name="Sider", dob="1990-01-01"
+        )
+        token = UserRefreshToken.for_user(outsider).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+        self.assertEqual(self.board().status_code, 403)
@@ -0,0 +1,117 @@
+from types import MethodType
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models.base import ModelState
+from django.utils.functional import SimpleLazyObject, empty
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from apps.companies.cache import get_membership_version
+from apps.companies.selectors.roles import prime_user_roles
+from .tokens import MEMBERSHIP_VERSION_CLAIM, ROLES_CLAIM, VERIFIED_CLAIM
+
+
+class TokenUser(SimpleLazyObject):
+    """
+    request.user built from access token claims.
+
+    id / pk / is_verified and the auth flags come from the token and
+    the object passes isinstance(user, User), so permissions, filters
+    (`created_by=user`) and FK assignments never touch the users table.
+    Any other attribute loads the row, once.
+    """
+
+    def __init__(self, *, user_id, is_verified):
+        User = get_user_model()
+        super().__init__(lambda: User.objects.get(pk=user_id))
+
+        state = ModelState()
+        state.db = DEFAULT_DB_ALIAS
+        state.adding = False
+
+        # Stored in the instance dict so they are found before
+        # LazyObject.__getattr__ forces the load
+        self.__dict__.update({
+            "id": user_id,
+            "pk": user_id,
+            "is_verified": is_verified,
+            "is_authenticated": True,
+            "is_anonymous": False,
+            "_meta": User._meta,
+            "_state": state,
+        })
+        # Primary key helpers the ORM calls when saving related objects
+        for name in ("_get_pk_val", "_is_pk_set"):
+            if hasattr(User, name):
+                self.__dict__[name] = MethodType(getattr(User, name), self)
+
+    def __getattr__(self, name):
+        # Probes like hasattr(user, "resolve_expression") in the ORM must
+        # not load the row: before loading, only attributes a User could
+        # have are worth loading for
+        if self._wrapped is empty and not hasattr(self.__class__, name):
+            raise AttributeError(name)
+        return super().__getattr__(name)
+
+    @property
+    def __class__(self):
+        return get_user_model()
+
+    def __setattr__(self, name, value):
+        # Writes go to the real user; drop the token copy so reads follow
+        self.__dict__.pop(name, None)
+        super().__setattr__(name, value)
+
+    def __bool__(self):
+        # IsAuthenticated checks `request.user and ...`
+        return True
+
+    def __eq__(self, other):
+        return isinstance(other, get_user_model()) and other.pk == self.pk
+
+    def __hash__(self):
+        return hash(self.pk)
+
+
+class StatelessJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that trusts the token instead of loading the user.
+
+    Tokens from UserRefreshToken carry the membership version they were
+    issued at. While it still matches the current version (one cache
+    read) the user is a lazy TokenUser with its roles taken from the
+    token. Any membership or account change (deactivation, password,
+    verification) bumps the version, and older tokens fall back to the
+    regular database lookup, including its is_active check.
+
+    Only with JWT_TRUST_TOKEN_CLAIMS, i.e. a cache shared by every
+    process; otherwise every token takes the database lookup.
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken("Token contained no recognizable user identification")
+
+        if not settings.JWT_TRUST_TOKEN_CLAIMS:
+            return super().get_user(validated_token)
+
+        version = validated_token.get(MEMBERSHIP_VERSION_CLAIM)
+        if version is None or version != get_membership_version(user_id=user_id):
+            return super().get_user(validated_token)
+
+        # The claim is a string; compare like the primary key does
+        user_id = get_user_model()._meta.pk.to_python(user_id)
+        user = TokenUser(user_id=user_id, is_verified=validated_token.get(VERIFIED_CLAIM, False))
+
+        roles = validated_token.get(ROLES_CLAIM)
+        if roles is not None:
+            prime_user_roles(
+                user=user,
+                roles={int(company_id): role for company_id, role in roles.items()},
+            )
+        return user
@@ -0,0 +1,87 @@
+import base64
+import hashlib
+
+from django.conf import settings
+from django.contrib.auth.hashers import (
+    Argon2PasswordHasher,
+    PBKDF2PasswordHasher,
+    ScryptPasswordHasher,
+)
+
+# The hashers keep their parent's algorithm name, so hashes they produce are
+# interchangeable with Django's. Work factors come from settings; when they
+# change, must_update() sees the stored parameters differ and the password
+# is rehashed on the user's next successful login.
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    Argon2id with the PASSWORD_ARGON2_* work factors.
+    Needs argon2-cffi.
+    """
+
+    @property
+    def time_cost(self):
+        return settings.PASSWORD_ARGON2_TIME_COST
+
+    @property
+    def memory_cost(self):
+        return settings.PASSWORD_ARGON2_MEMORY_COST
+
+    @property
+    def parallelism(self):
+        return settings.PASSWORD_ARGON2_PARALLELISM
+
+
+class TunedScryptPasswordHasher(ScryptPasswordHasher):
+    """
+    scrypt (stdlib hashlib) with the PASSWORD_SCRYPT_* work factors.
+    """
+
+    @property
+    def work_factor(self):
+        return settings.PASSWORD_SCRYPT_WORK_FACTOR
+
+    @property
+    def block_size(self):
+        return settings.PASSWORD_SCRYPT_BLOCK_SIZE
+
+    @property
+    def parallelism(self):
+        return settings.PASSWORD_SCRYPT_PARALLELISM
+
+    def encode(self, password, salt, n=None, r=None, p=None):
+        # verify() passes the N and r stored in the hash, which may be
+        # larger than the current settings, so maxmem follows them
+        self._check_encode_args(password, salt)
+        n = n or self.work_factor
+        r = r or self.block_size
+        p = p or self.parallelism
+        hash_ = hashlib.scrypt(
+            password.encode(),
+            salt=salt.encode(),
+            n=n,
+            r=r,
+            p=p,
+            maxmem=self.maxmem_for(n, r),
+            dklen=64,
+        )
+        hash_ = base64.b64encode(hash_).decode("ascii").strip()
+        return "%s$%d$%s$%d$%d$%s" % (self.algorithm, n, salt, r, p, hash_)
+
+    @staticmethod
+    def maxmem_for(n, r):
+        # scrypt needs ~128 * N * r bytes; 0 keeps OpenSSL's 32 MiB default,
+        # which larger work factors would exceed
+        needed = 128 * n * r
+        return 2 * needed if needed >= 16 * 1024 * 1024 else 0
+
+
+class TunedPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """
+    PBKDF2-SHA256 with PASSWORD_PBKDF2_ITERATIONS.
+    """
+
+    @property
+    def iterations(self):
+        return settings.PASSWORD_PBKDF2_ITERATIONS
@@ -0,0 +1,99 @@
+from importlib.util import find_spec
+
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+
+from apps.common.benchmarks import measure
+from apps.users.hashers import (
+    TunedArgon2PasswordHasher,
+    TunedPBKDF2PasswordHasher,
+    TunedScryptPasswordHasher,
+)
+
+PASSWORD = "Bench-Passw0rd!"
+
+# name -> (hasher class, setting holding its tunable work factor, short label)
+HASHERS = {
+    "argon2": (TunedArgon2PasswordHasher, "PASSWORD_ARGON2_TIME_COST", "t"),
+    "scrypt": (TunedScryptPasswordHasher, "PASSWORD_SCRYPT_WORK_FACTOR", "N"),
+    "pbkdf2": (TunedPBKDF2PasswordHasher, "PASSWORD_PBKDF2_ITERATIONS", "iterations"),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Times one password check (what a login costs) under each hasher "
+        "with the configured work factors, next to Django's stock PBKDF2, "
+        "and reports logins/sec per core. With --target-ms, also searches "
+        "the work factor that keeps a check under that budget."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--hasher", action="append", choices=list(HASHERS), help="Repeatable; default all")
+        parser.add_argument("--rounds", type=int, default=20)
+        parser.add_argument("--target-ms", type=float, help="Calibrate work factors to this check time")
+
+    def handle(self, *args, **options):
+        names = options["hasher"] or list(HASHERS)
+        if "argon2" in names and find_spec("argon2") is None:
+            self.stdout.write(self.style.WARNING("argon2-cffi is not installed, skipping argon2"))
+            names.remove("argon2")
+
+        self.stdout.write(f"Preferred hasher: {settings.PASSWORD_HASHER}")
+        self.stdout.write(f"{'hasher':32} {'p50 ms':>8} {'p95 ms':>8} {'logins/s/core':>14}")
+
+        self._report("pbkdf2 (django default)", self._time(PBKDF2PasswordHasher(), options["rounds"]))
+        for name in names:
+            hasher_class, setting, short = HASHERS[name]
+            label = f"{name} ({short}={getattr(settings, setting)})"
+            self._report(label, self._time(hasher_class(), options["rounds"]))
+
+        if options["target_ms"]:
+            for name in names:
+                self._calibrate(name, options["target_ms"], options["rounds"])
+
+    def _time(self, hasher, rounds):
+        # Hashing runs on one core, so one check's time is what a login
+        # costs that core; run this on an idle machine.
+        encoded = hasher.encode(PASSWORD, hasher.salt())
+        return measure(lambda: hasher.verify(PASSWORD, encoded), repeat=rounds)
+
+    def _report(self, label, stats):
+        self.stdout.write(
+            f"{label:32} {stats['p50']:8.1f} {stats['p95']:8.1f} {1000 / stats['mean']:14.1f}"
+        )
+
+    def _calibrate(self, name, target_ms, rounds):
+        """
+        Largest work factor whose p50 check time stays within target_ms.
+        """
+        hasher_class, setting, _ = HASHERS[name]
+        value = getattr(settings, setting)
+
+        def p50(value):
+            with override_settings(**{setting: value}):
+                return self._time(hasher_class(), rounds)["p50"]
+
+        if name == "pbkdf2":
+            # Cost is linear in the iterations
+            best = max(int(value * target_ms / p50(value)) // 10_000 * 10_000, 10_000)
+        elif name == "scrypt":
+            # N must be a power of two
+            best = value
+            while best > 2 and p50(best) > target_ms:
+                best //= 2
+            while p50(best * 2) <= target_ms:
+                best *= 2
+        else:
+            # Passes over the configured memory
+            best = value
+            while best > 1 and p50(best) > target_ms:
+                best -= 1
+            while p50(best + 1) <= target_ms:
+                best += 1
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{name}: {setting}={best} (p50 {p50(best):.1f} ms, target {target_ms:g} ms)"
+        ))
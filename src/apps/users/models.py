@@ -7,9 +7,33 @@ from django.contrib.auth.models import (
 from django.utils import timezone
 import pyotp
 
+from apps.companies.cache import bump_membership_versions
+
+# Fields access tokens vouch for, directly (is_verified) or by having
+# been issued at all (is_active, password)
+TOKEN_FIELDS = {"is_active", "is_verified", "password"}
+
+
+class UserQuerySet(models.QuerySet):
+
+    def update(self, **kwargs):
+        """
+        Bulk updates send no post_save: changing a field tokens vouch for
+        bumps the users' membership versions here instead.
+        """
+        if not TOKEN_FIELDS & set(kwargs):
+            return super().update(**kwargs)
+        user_ids = list(self.order_by().values_list("pk", flat=True))
+        rows = super().update(**kwargs)
+        bump_membership_versions(user_ids=user_ids)
+        return rows
+
 
 class UserManager(BaseUserManager):
 
+    def get_queryset(self):
+        return UserQuerySet(self.model, using=self._db)
+
     def _clean_text(self, text):
         """
         Collapses multiple internal spaces into one and strips leading/trailing whitespace.
@@ -108,6 +132,12 @@ class User(AbstractBaseUser, PermissionsMixin):
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = ["first_name", "last_name"]
 
+    class Meta:
+        indexes = [
+            # User listing filtered by verification, in email order
+            models.Index(fields=["is_verified", "email"], name="user_verified_email_idx"),
+        ]
+
     def __str__(self):
         return self.email
     
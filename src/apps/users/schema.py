@@ -0,0 +1,10 @@
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+
+
+class StatelessJWTScheme(SimpleJWTScheme):
+    """
+    Documents StatelessJWTAuthentication as the same bearer scheme as
+    simplejwt's; extensions only match their exact target class.
+    """
+
+    target_class = "apps.users.authentication.StatelessJWTAuthentication"
@@ -101,13 +101,30 @@ class ProfileSerializer(serializers.ModelSerializer):
     #         return request.build_absolute_uri(obj.avatar.url) if request else obj.avatar.url
     #     return None
 
+    def get_memberships(self, obj):
+        """
+        Memberships with their company names, fetched in one query and
+        shared by `companies` and `admin_companies`.
+        """
+        if getattr(self, "_memberships_user_id", None) != obj.pk:
+            self._memberships = list(
+                Membership.objects.filter(user=obj).values("company_id", "company__name", "role")
+            )
+            self._memberships_user_id = obj.pk
+        return self._memberships
+
     def get_companies(self, obj):
-        memberships = Membership.objects.filter(user=obj)
-        return [{"id": m.company.id, "name": m.company.name, "role": m.role} for m in memberships]
+        return [
+            {"id": m["company_id"], "name": m["company__name"], "role": m["role"]}
+            for m in self.get_memberships(obj)
+        ]
 
     def get_admin_companies(self, obj):
-        memberships = Membership.objects.filter(user=obj, role=Membership.Role.ADMIN)
-        return [{"id": m.company.id, "name": m.company.name} for m in memberships]
+        return [
+            {"id": m["company_id"], "name": m["company__name"]}
+            for m in self.get_memberships(obj)
+            if m["role"] == Membership.Role.ADMIN
+        ]
 
     def update(self, instance, validated_data):
         """
@@ -0,0 +1,28 @@
+from django.contrib.auth import authenticate
+
+from apps.common.middleware import server_timing
+from .models import User
+
+
+def authenticate_user(*, request, email: str, password: str):
+    """
+    Checks the credentials (user lookup + password hash, plus a rehash if
+    the stored hash uses outdated work factors) and reports the cost as
+    the "auth" Server-Timing entry.
+
+    Runs in the request thread: under WSGI a pool thread would only add a
+    handoff, and its own database connection for the lookup and rehash.
+    Concurrent hashing is bounded by the login throttles instead.
+    """
+    with server_timing(request, "auth", metric="users.authenticate_ms"):
+        return authenticate(request, email=email, password=password)
+
+
+def reset_user_password(*, request, user: User, password: str) -> None:
+    """
+    Hashes and saves a new password with the preferred hasher, reporting
+    the hash cost as the "hash" Server-Timing entry.
+    """
+    with server_timing(request, "hash", metric="users.set_password_ms"):
+        user.set_password(password)
+    user.save()
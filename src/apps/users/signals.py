@@ -0,0 +1,20 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.companies.cache import bump_membership_version
+from apps.users.models import TOKEN_FIELDS, User
+
+
+@receiver(post_save, sender=User)
+def user_saved(sender, instance, created, update_fields, **kwargs):
+    """
+    Sends tokens issued before an account change back to the database.
+    Saves limited to other fields (OTP secret, last_login) keep them fast.
+    """
+    if created or update_fields is None or TOKEN_FIELDS & set(update_fields):
+        bump_membership_version(user_id=instance.pk)
+
+
+@receiver(post_delete, sender=User)
+def user_deleted(sender, instance, **kwargs):
+    bump_membership_version(user_id=instance.pk)
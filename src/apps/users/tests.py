@@ -1,3 +1,382 @@
-from django.test import TestCase
+from types import SimpleNamespace
 
-# Create your tests here.
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.core.cache import cache
+from django.test import override_settings
+from rest_framework.parsers import JSONParser
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory, APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.common import metrics
+from apps.common.models import OutboxMessage
+from apps.common.throttling import EmailRateThrottle
+from apps.companies.models import Company, Membership
+from apps.otp.utils import generate_otp
+from apps.companies.services.company_service import create_company
+from apps.companies.services.membership_service import remove_member
+from apps.users.models import User
+from apps.users.tokens import UserRefreshToken
+
+PASSWORD = "Str0ng-Passw0rd!"
+
+
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+class UserEndpointQueryCountTests(APITestCase):
+    """
+    Pins the number of queries each endpoint in apps/users/views.py runs.
+    A change here means a view gained (or lost) a query; update the
+    number only if that is intended.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            email="jane@example.com",
+            password=PASSWORD,
+            first_name="Jane",
+            last_name="Doe",
+            dob="1990-01-01",
+            is_verified=True,
+        )
+
+    def assertOutboxed(self, *args, **kwargs):
+        message = OutboxMessage.objects.get()
+        self.assertEqual(message.task_name, "apps.otp.tasks.send_otp_email_task")
+        self.assertEqual(message.args, list(args))
+        self.assertEqual(message.kwargs, kwargs)
+
+    def authenticate(self, user):
+        token = RefreshToken.for_user(user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def test_register(self):
+        payload = {
+            "email": "new@example.com",
+            "password": PASSWORD,
+            "first_name": "New",
+            "last_name": "User",
+            "dob": "1995-05-05",
+        }
+        # unique email check + insert
+        with self.assertNumQueries(2):
+            response = self.client.post("/api/users/register/", payload)
+        self.assertEqual(response.status_code, 201)
+
+    def test_verify_email(self):
+        self.user.is_verified = False
+        self.user.save(update_fields=["is_verified"])
+        otp = generate_otp(self.user.otp_secret)
+
+        # load user + mark verified + clear secret
+        with self.assertNumQueries(3):
+            response = self.client.post("/api/users/verify-email/", {"email": self.user.email, "otp": otp})
+        self.assertEqual(response.status_code, 200)
+
+    def test_login(self):
+        # user + roles embedded in the token
+        with self.assertNumQueries(2):
+            response = self.client.post("/api/users/login/", {"email": self.user.email, "password": PASSWORD})
+        self.assertEqual(response.status_code, 200)
+
+    def test_login_wrong_password(self):
+        with self.assertNumQueries(1):
+            response = self.client.post("/api/users/login/", {"email": self.user.email, "password": "nope"})
+        self.assertEqual(response.status_code, 401)
+
+    def test_forgot_password(self):
+        # load user + outbox insert
+        with self.assertNumQueries(2):
+            response = self.client.post("/api/users/forgot-password/", {"email": self.user.email})
+        self.assertEqual(response.status_code, 200)
+        self.assertOutboxed(self.user.id, purpose="reset")
+
+    @override_settings(REST_FRAMEWORK={**settings.REST_FRAMEWORK, "DEFAULT_THROTTLE_RATES": {}})
+    def test_repeated_otp_requests_are_coalesced(self):
+        metrics.reset()
+        for _ in range(3):
+            self.client.post("/api/users/forgot-password/", {"email": self.user.email})
+
+        # Later requests in the same window only load the user
+        with self.assertNumQueries(1):
+            response = self.client.post("/api/users/forgot-password/", {"email": self.user.email})
+        self.assertEqual(response.status_code, 200)
+        self.assertOutboxed(self.user.id, purpose="reset")
+        self.assertEqual(metrics.snapshot()["counters"]["otp.deduplicated"], 3)
+
+    def test_reset_password(self):
+        otp = generate_otp(self.user.otp_secret)
+        payload = {"email": self.user.email, "otp": otp, "password": "An0ther-Passw0rd!"}
+
+        # load user + save password + clear secret
+        with self.assertNumQueries(3):
+            response = self.client.post("/api/users/reset-password/", payload)
+        self.assertEqual(response.status_code, 200)
+
+    def test_resend_otp(self):
+        self.user.is_verified = False
+        self.user.save(update_fields=["is_verified"])
+
+        # load user + outbox insert
+        with self.assertNumQueries(2):
+            response = self.client.post("/api/users/resend-otp/", {"email": self.user.email})
+        self.assertEqual(response.status_code, 200)
+        self.assertOutboxed(self.user.id, purpose="verify")
+
+    def test_profile_query_count_does_not_grow_with_companies(self):
+        for i in range(5):
+            company = Company.objects.create(name=f"Company {i}", created_by=self.user)
+            role = Membership.Role.ADMIN if i % 2 else Membership.Role.RECRUITER
+            Membership.objects.create(user=self.user, company=company, role=role)
+        self.authenticate(self.user)
+
+        # user + memberships with companies
+        with self.assertNumQueries(2):
+            response = self.client.get("/api/users/profile/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["companies"]), 5)
+        self.assertEqual(len(response.data["admin_companies"]), 2)
+
+    def test_user_list_is_scoped_to_shared_companies(self):
+        company = Company.objects.create(name="Acme", created_by=self.user)
+        Membership.objects.create(user=self.user, company=company, role=Membership.Role.ADMIN)
+        colleague = User.objects.create(email="colleague@example.com", first_name="Col", last_name="League")
+        Membership.objects.create(user=colleague, company=company, role=Membership.Role.RECRUITER)
+        User.objects.create(email="stranger@example.com", first_name="Str", last_name="Anger")
+        self.authenticate(self.user)
+
+        # user + memberships + page
+        with self.assertNumQueries(3):
+            response = self.client.get("/api/users/", {"email": "col"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([u["email"] for u in response.data["results"]], ["colleague@example.com"])
+
+        response = self.client.get("/api/users/")
+        self.assertEqual(
+            [u["email"] for u in response.data["results"]],
+            ["colleague@example.com", "jane@example.com"],
+        )
+
+    def test_profile_update(self):
+        self.authenticate(self.user)
+
+        # user + update + memberships with companies
+        with self.assertNumQueries(3):
+            response = self.client.patch("/api/users/profile/", {"first_name": "Janet"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["first_name"], "Janet")
+
+
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+class AuthThrottleTests(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            email="jane@example.com",
+            password=PASSWORD,
+            first_name="Jane",
+            last_name="Doe",
+            dob="1990-01-01",
+            is_verified=True,
+        )
+
+    def login(self, email, password="wrong", ip="10.0.0.1"):
+        return self.client.post(
+            "/api/users/login/", {"email": email, "password": password}, REMOTE_ADDR=ip
+        )
+
+    def test_login_is_limited_per_email_across_ips(self):
+        for i in range(5):
+            self.assertEqual(self.login(self.user.email, ip=f"10.0.0.{i}").status_code, 401)
+
+        # Rejected before the user lookup and the password hash
+        with self.assertNumQueries(0):
+            response = self.login(self.user.email, password=PASSWORD, ip="10.0.1.1")
+        self.assertEqual(response.status_code, 429)
+        self.assertIn("Retry-After", response)
+
+    def test_login_is_limited_per_ip_across_emails(self):
+        for i in range(20):
+            self.login(f"user{i}@example.com")
+
+        response = self.login("someone-else@example.com")
+        self.assertEqual(response.status_code, 429)
+
+        response = self.login("someone-else@example.com", ip="10.0.0.2")
+        self.assertEqual(response.status_code, 401)
+
+    @override_settings(REST_FRAMEWORK={
+        **settings.REST_FRAMEWORK,
+        "DEFAULT_THROTTLE_RATES": {"login_ip": "2/min", "login_endpoint": "4/min"},
+    })
+    def test_rejected_requests_do_not_use_up_the_endpoint_limit(self):
+        for _ in range(10):
+            self.login("someone@example.com")
+
+        # Only the two requests the IP limit let through were counted
+        self.assertEqual(self.login(self.user.email, ip="10.0.0.2").status_code, 401)
+        self.assertEqual(self.login(self.user.email, ip="10.0.0.3").status_code, 401)
+        self.assertEqual(self.login(self.user.email, ip="10.0.0.4").status_code, 429)
+
+    def test_concurrent_checks_cannot_overshoot_the_limit(self):
+        request = Request(
+            APIRequestFactory().post("/api/users/login/", {"email": self.user.email}, format="json"),
+            parsers=[JSONParser()],
+        )
+        view = SimpleNamespace(throttle_scope="login")
+
+        # Eight requests in flight at once, none finished yet
+        throttles = [EmailRateThrottle() for _ in range(8)]
+        allowed = [throttle.allow_request(request, view) for throttle in throttles]
+
+        self.assertEqual(allowed.count(True), 5)
+
+    def test_otp_guesses_are_limited_per_email(self):
+        for _ in range(5):
+            self.client.post("/api/users/verify-email/", {"email": self.user.email, "otp": "000000"})
+
+        response = self.client.post("/api/users/reset-password/", {
+            "email": self.user.email, "otp": "000000", "password": "An0ther-Passw0rd!"
+        })
+        self.assertEqual(response.status_code, 429)
+
+
+@override_settings(
+    PASSWORD_HASHERS=[
+        "apps.users.hashers.TunedPBKDF2PasswordHasher",
+        "django.contrib.auth.hashers.MD5PasswordHasher",
+    ],
+    PASSWORD_PBKDF2_ITERATIONS=1000,
+)
+class PasswordHashingTests(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            email="jane@example.com",
+            password=PASSWORD,
+            first_name="Jane",
+            last_name="Doe",
+            dob="1990-01-01",
+        )
+
+    def login(self):
+        return self.client.post("/api/users/login/", {"email": self.user.email, "password": PASSWORD})
+
+    def test_login_reports_hash_cost(self):
+        response = self.login()
+        self.assertEqual(response.status_code, 200)
+        self.assertRegex(response["Server-Timing"], r"^auth;dur=\d+\.\d$")
+
+    def test_outdated_hash_is_upgraded_on_login(self):
+        self.assertTrue(self.user.password.startswith("pbkdf2_sha256$1000$"))
+
+        with self.settings(PASSWORD_PBKDF2_ITERATIONS=2000):
+            self.assertEqual(self.login().status_code, 200)
+
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.password.startswith("pbkdf2_sha256$2000$"))
+        self.assertTrue(self.user.check_password(PASSWORD))
+
+    def test_hash_from_another_hasher_is_upgraded_on_login(self):
+        User.objects.filter(pk=self.user.pk).update(password=make_password(PASSWORD, hasher="md5"))
+
+        self.assertEqual(self.login().status_code, 200)
+
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.password.startswith("pbkdf2_sha256$1000$"))
+
+    def test_scrypt_hash_survives_a_lower_work_factor(self):
+        scrypt = {"PASSWORD_HASHERS": ["apps.users.hashers.TunedScryptPasswordHasher"]}
+        # N=2^15 needs more than OpenSSL's default 32 MiB
+        with self.settings(**scrypt, PASSWORD_SCRYPT_WORK_FACTOR=2**15):
+            User.objects.filter(pk=self.user.pk).update(password=make_password(PASSWORD))
+
+        with self.settings(**scrypt, PASSWORD_SCRYPT_WORK_FACTOR=2**14):
+            self.assertEqual(self.login().status_code, 200)
+
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.password.startswith("scrypt$16384$"))
+
+
+# One test process shares the LocMemCache that versions live in
+@override_settings(JWT_TRUST_TOKEN_CLAIMS=True)
+class StatelessAuthTests(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(
+            email="admin@example.com",
+            password=PASSWORD,
+            first_name="Admin",
+            last_name="User",
+            dob="1990-01-01",
+        )
+        cls.recruiter = User.objects.create_user(
+            email="recruiter@example.com",
+            password=PASSWORD,
+            first_name="Rec",
+            last_name="Ruiter",
+            dob="1990-01-01",
+        )
+        cls.company = create_company(name="Acme", description="", created_by=cls.admin)
+        cls.membership = Membership.objects.create(
+            user=cls.recruiter, company=cls.company, role=Membership.Role.RECRUITER
+        )
+
+    def setUp(self):
+        cache.clear()
+        token = UserRefreshToken.for_user(self.recruiter).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def test_list_skips_user_and_membership_queries(self):
+        # Only the jobs page itself
+        with self.assertNumQueries(1):
+            response = self.client.get("/api/manage/jobs/")
+        self.assertEqual(response.status_code, 200)
+
+    def test_user_row_is_loaded_only_when_a_field_is_needed(self):
+        # company lookup + insert (created_by from the token) + default
+        # stages, inside a savepoint + the creator's email for the response
+        with self.assertNumQueries(6):
+            response = self.client.post("/api/manage/jobs/", {
+                "company": self.company.id, "title": "Engineer", "description": "...",
+            })
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["created_by_email"], self.recruiter.email)
+
+    def test_membership_change_revokes_the_fast_path(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            remove_member(membership=self.membership, removed_by=self.admin)
+
+        # Token is no longer trusted: user, memberships, jobs page
+        with self.assertNumQueries(3):
+            response = self.client.get("/api/manage/jobs/")
+        self.assertEqual(response.status_code, 200)
+
+    def test_deactivation_revokes_the_token(self):
+        self.recruiter.is_active = False
+        with self.captureOnCommitCallbacks(execute=True):
+            self.recruiter.save(update_fields=["is_active"])
+
+        response = self.client.get("/api/manage/jobs/")
+        self.assertEqual(response.status_code, 401)
+
+    def test_bulk_update_revokes_the_token(self):
+        # No post_save here; the queryset bumps the version itself
+        with self.captureOnCommitCallbacks(execute=True):
+            User.objects.filter(pk=self.recruiter.pk).update(is_active=False)
+
+        response = self.client.get("/api/manage/jobs/")
+        self.assertEqual(response.status_code, 401)
+
+    def test_claims_are_not_trusted_without_a_shared_cache(self):
+        # user, memberships, jobs page
+        with self.settings(JWT_TRUST_TOKEN_CLAIMS=False), self.assertNumQueries(3):
+            response = self.client.get("/api/manage/jobs/")
+        self.assertEqual(response.status_code, 200)
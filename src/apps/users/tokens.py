@@ -0,0 +1,35 @@
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.companies.cache import get_membership_version
+from apps.companies.selectors.roles import get_user_roles
+
+# Claims read by apps.users.authentication.StatelessJWTAuthentication
+VERIFIED_CLAIM = "is_verified"
+MEMBERSHIP_VERSION_CLAIM = "mv"
+ROLES_CLAIM = "roles"
+
+# Above this many memberships roles are left out to keep the token small;
+# they are then loaded per request as usual
+MAX_ROLES_IN_TOKEN = 50
+
+
+class UserRefreshToken(RefreshToken):
+    """
+    Refresh token whose access tokens also carry the user's verification
+    state, company roles and membership version, so requests can be
+    authenticated and authorized without loading the user or memberships.
+    """
+
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        # Version first: a membership change racing with this bumps it,
+        # and the token never vouches for roles newer than its version
+        token[MEMBERSHIP_VERSION_CLAIM] = get_membership_version(user_id=user.pk)
+        token[VERIFIED_CLAIM] = user.is_verified
+
+        roles = get_user_roles(user=user)
+        if len(roles) <= MAX_ROLES_IN_TOKEN:
+            # JSON object keys are strings
+            token[ROLES_CLAIM] = {str(company_id): role for company_id, role in roles.items()}
+        return token
@@ -6,10 +6,12 @@ from .views import (
     ForgotPasswordView,
     ResetPasswordView,
     ResendOTPView,
-    ProfileView
+    ProfileView,
+    UserListView,
 )
 
 urlpatterns = [
+    path("", UserListView.as_view(), name="user-list"),
     path("register/", RegisterView.as_view(), name="user-register"),
     path("verify-email/", VerifyEmailView.as_view(), name="verify-email"),
     path("login/", LoginView.as_view(), name="user-login"),
@@ -1,9 +1,8 @@
 from rest_framework import generics, status
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny, IsAuthenticated
-from django.contrib.auth import authenticate
+from rest_framework.exceptions import ValidationError
 from django.shortcuts import get_object_or_404
-from rest_framework_simplejwt.tokens import RefreshToken
 
 from .serializers import (
     RegisterSerializer,
@@ -16,15 +15,23 @@ from .serializers import (
     ProfileSerializer
 )
 from .models import User
-
-from apps.otp.services import verify_user_otp, clear_user_otp
+from .services import authenticate_user, reset_user_password
+from .tokens import UserRefreshToken
+
+from apps.common.outbox import enqueue_task
+from apps.common.pagination import KeysetPagination
+from apps.common.throttling import ThrottledViewMixin
+from apps.companies.models import Membership
+from apps.companies.selectors.roles import get_user_company_ids
+from apps.otp.services import claim_otp_delivery, clear_user_otp, verify_user_otp
 from apps.otp.tasks import send_otp_email_task
 
 
 
-class RegisterView(generics.CreateAPIView):
+class RegisterView(ThrottledViewMixin, generics.CreateAPIView):
     serializer_class = RegisterSerializer
     permission_classes = [AllowAny]
+    throttle_scope = "register"
 
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
@@ -42,16 +49,53 @@ class RegisterView(generics.CreateAPIView):
         )
 
 
+class UserPagination(KeysetPagination):
+    ordering = ("email",)
+
+
 class UserListView(generics.ListAPIView):
+    """
+    Users who share at least one company with the requester.
+    Optional filters: ?email=<prefix>, ?company=<id>, ?is_verified=true|false
+    """
     serializer_class = UserSerializer
-    queryset = User.objects.all()
     permission_classes = [IsAuthenticated]
-    pagination_class = None  # Add pagination later
+    pagination_class = UserPagination
+
+    def get_queryset(self):
+        params = self.request.query_params
+        company_ids = get_user_company_ids(user=self.request.user)
+
+        company_param = params.get("company")
+        if company_param:
+            if not company_param.isdigit():
+                raise ValidationError({"company": "Must be a company id."})
+            company_ids = [c for c in company_ids if c == int(company_param)]
+
+        member_ids = Membership.objects.filter(company_id__in=company_ids).values("user_id")
+        queryset = User.objects.filter(id__in=member_ids)
+
+        email_prefix = params.get("email")
+        if email_prefix:
+            # The range lets the email index serve the prefix search on
+            # every backend; startswith keeps the match exact.
+            queryset = queryset.filter(
+                email__gte=email_prefix,
+                email__lt=email_prefix + "\uffff",
+                email__startswith=email_prefix,
+            )
+
+        is_verified = params.get("is_verified")
+        if is_verified in ("true", "false"):
+            queryset = queryset.filter(is_verified=is_verified == "true")
+
+        return queryset
 
 
-class VerifyEmailView(generics.GenericAPIView):
+class VerifyEmailView(ThrottledViewMixin, generics.GenericAPIView):
     serializer_class = OTPVerifySerializer
     permission_classes = [AllowAny]
+    throttle_scope = "otp_verify"
 
     def post(self, request):
         serializer = self.get_serializer(data=request.data)
@@ -75,9 +119,10 @@ class VerifyEmailView(generics.GenericAPIView):
         return Response({"msg": "Email verified successfully."})
 
 
-class LoginView(generics.GenericAPIView):
+class LoginView(ThrottledViewMixin, generics.GenericAPIView):
     serializer_class = LoginSerializer
     permission_classes = [AllowAny]
+    throttle_scope = "login"
 
     def post(self, request):
         serializer = self.get_serializer(data=request.data)
@@ -86,7 +131,7 @@ class LoginView(generics.GenericAPIView):
         email = serializer.validated_data["email"]
         password = serializer.validated_data["password"]
 
-        user = authenticate(request, email=email, password=password)
+        user = authenticate_user(request=request, email=email, password=password)
 
         if not user:
             return Response(
@@ -100,7 +145,7 @@ class LoginView(generics.GenericAPIView):
         #         status=status.HTTP_403_FORBIDDEN,
         #     )
 
-        refresh = RefreshToken.for_user(user)
+        refresh = UserRefreshToken.for_user(user)
 
         return Response(
             {
@@ -110,9 +155,10 @@ class LoginView(generics.GenericAPIView):
         )
     
 
-class ForgotPasswordView(generics.GenericAPIView):
+class ForgotPasswordView(ThrottledViewMixin, generics.GenericAPIView):
     serializer_class = ForgotPasswordSerializer
     permission_classes = [AllowAny]
+    throttle_scope = "otp_send"
 
     def post(self, request):
         serializer = self.get_serializer(data=request.data)
@@ -135,14 +181,17 @@ class ForgotPasswordView(generics.GenericAPIView):
                 status=status.HTTP_403_FORBIDDEN,
             )
 
-        send_otp_email_task.delay(user.id, purpose="reset")
+        # Repeated requests within one OTP window collapse into one email
+        if claim_otp_delivery(user_id=user.id, purpose="reset"):
+            enqueue_task(send_otp_email_task, user.id, purpose="reset")
 
         return Response({"msg": "OTP sent to your email for password reset."})
 
 
-class ResetPasswordView(generics.GenericAPIView):
+class ResetPasswordView(ThrottledViewMixin, generics.GenericAPIView):
     serializer_class = ResetPasswordSerializer
     permission_classes = [AllowAny]
+    throttle_scope = "otp_verify"
 
     def post(self, request):
         serializer = self.get_serializer(data=request.data)
@@ -168,16 +217,16 @@ class ResetPasswordView(generics.GenericAPIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
         
-        user.set_password(new_password)
-        user.save()
+        reset_user_password(request=request, user=user, password=new_password)
         clear_user_otp(user)
 
         return Response({"msg": "Password reset successfully."})
 
 
-class ResendOTPView(generics.GenericAPIView):
+class ResendOTPView(ThrottledViewMixin, generics.GenericAPIView):
     serializer_class = ResendOTPSerializer
     permission_classes = [AllowAny]
+    throttle_scope = "otp_send"
 
     def post(self, request):
         email = request.data.get("email")
@@ -193,8 +242,9 @@ class ResendOTPView(generics.GenericAPIView):
         if user.is_verified:
             return Response({"msg": "Email is already verified."}, status=status.HTTP_400_BAD_REQUEST)
 
-        # Send verification OTP again
-        send_otp_email_task.delay(user.id, purpose="verify")
+        # Send verification OTP again, once per OTP window
+        if claim_otp_delivery(user_id=user.id, purpose="verify"):
+            enqueue_task(send_otp_email_task, user.id, purpose="verify")
 
         return Response({"msg": "OTP resent to your email."}, status=status.HTTP_200_OK)
 
@@ -2,6 +2,9 @@ from pathlib import Path
 import os
 from dotenv import load_dotenv
 from datetime import timedelta
+from importlib.util import find_spec
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+from kombu import Queue
 
 # --------------------------------------------------
 # Paths & environment
@@ -49,6 +52,7 @@ INSTALLED_APPS = [
 
     # Workflow / domain apps
     "apps.pipelines.apps.PipelinesConfig",
+    "apps.interviews.apps.InterviewsConfig",
     "apps.offers.apps.OffersConfig",
 
     # Cross-cutting apps
@@ -69,6 +73,7 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "apps.common.middleware.ServerTimingMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -112,6 +117,38 @@ DATABASES = {
     }
 }
 
+# --------------------------------------------------
+# Cache
+# --------------------------------------------------
+
+# Redis when configured (shared by all workers), otherwise a per-process
+# LocMemCache, which is also what tests run against.
+REDIS_URL = os.getenv("REDIS_URL")
+
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+            "KEY_PREFIX": "ats",
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
+# Seconds a rendered public job board page stays cached
+PUBLIC_JOBS_CACHE_TIMEOUT = int(os.getenv("PUBLIC_JOBS_CACHE_TIMEOUT", 300))
+
+# Authenticate access tokens from their claims while the membership
+# version they carry is current (apps.users.authentication). Versions
+# live in the default cache, so this needs one every process shares: a
+# per-process LocMemCache never sees another worker's revocation.
+JWT_TRUST_TOKEN_CLAIMS = os.getenv("JWT_TRUST_TOKEN_CLAIMS", str(bool(REDIS_URL))) == "True"
+
 # --------------------------------------------------
 # Custom user model
 # --------------------------------------------------
@@ -129,6 +166,42 @@ AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.NumericPasswordValidator"},
 ]
 
+# --------------------------------------------------
+# Password hashing
+# --------------------------------------------------
+
+# New and rehashed passwords use PASSWORD_HASHER; hashes made by the others
+# (or with other work factors) still verify and are upgraded on the user's
+# next login. Argon2 needs argon2-cffi; without it scrypt is the default.
+# Calibrate the work factors with `manage.py bench_password_hashers`.
+PASSWORD_HASHER = os.getenv(
+    "PASSWORD_HASHER", "argon2" if find_spec("argon2") else "scrypt"
+)
+_PASSWORD_HASHERS = {
+    "argon2": "apps.users.hashers.TunedArgon2PasswordHasher",
+    "scrypt": "apps.users.hashers.TunedScryptPasswordHasher",
+    "pbkdf2": "apps.users.hashers.TunedPBKDF2PasswordHasher",
+}
+PASSWORD_HASHERS = [_PASSWORD_HASHERS[PASSWORD_HASHER]] + [
+    path for name, path in _PASSWORD_HASHERS.items() if name != PASSWORD_HASHER
+] + [
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+]
+
+# Argon2id: 2 passes over 19 MiB, 1 lane
+PASSWORD_ARGON2_TIME_COST = int(os.getenv("PASSWORD_ARGON2_TIME_COST", 2))
+PASSWORD_ARGON2_MEMORY_COST = int(os.getenv("PASSWORD_ARGON2_MEMORY_COST", 19456))  # KiB
+PASSWORD_ARGON2_PARALLELISM = int(os.getenv("PASSWORD_ARGON2_PARALLELISM", 1))
+
+# scrypt: N=2^14, r=8 (16 MiB), p=1
+PASSWORD_SCRYPT_WORK_FACTOR = int(os.getenv("PASSWORD_SCRYPT_WORK_FACTOR", 2**14))
+PASSWORD_SCRYPT_BLOCK_SIZE = int(os.getenv("PASSWORD_SCRYPT_BLOCK_SIZE", 8))
+PASSWORD_SCRYPT_PARALLELISM = int(os.getenv("PASSWORD_SCRYPT_PARALLELISM", 1))
+
+# Never below Django's own default: must_update() would rehash stored
+# passwords down to fewer iterations
+PASSWORD_PBKDF2_ITERATIONS = int(os.getenv("PASSWORD_PBKDF2_ITERATIONS", PBKDF2PasswordHasher.iterations))
+
 # --------------------------------------------------
 # Internationalization
 # --------------------------------------------------
@@ -148,6 +221,27 @@ STATIC_ROOT = BASE_DIR / "staticfiles"
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
 
+# Never served by the web server; resumes are downloaded through the API
+PRIVATE_MEDIA_ROOT = Path(os.getenv("PRIVATE_MEDIA_ROOT", BASE_DIR / "private_media"))
+
+# Resumes are streamed to disk while uploading (apps.applications.uploads);
+# larger files are dropped as soon as they cross this limit
+RESUME_MAX_UPLOAD_SIZE = int(os.getenv("RESUME_MAX_UPLOAD_SIZE", 10 * 1024 * 1024))
+
+# Application cards kept per pipeline stage for the board
+BOARD_CARDS_PER_STAGE = int(os.getenv("BOARD_CARDS_PER_STAGE", 20))
+
+# Interview availability search: working hours (TIME_ZONE, Monday to
+# Friday), the longest range one search may cover and the largest panel
+INTERVIEW_WORKDAY_START = os.getenv("INTERVIEW_WORKDAY_START", "09:00")
+INTERVIEW_WORKDAY_END = os.getenv("INTERVIEW_WORKDAY_END", "17:00")
+INTERVIEW_SEARCH_MAX_DAYS = int(os.getenv("INTERVIEW_SEARCH_MAX_DAYS", 62))
+INTERVIEW_PANEL_MAX_SIZE = int(os.getenv("INTERVIEW_PANEL_MAX_SIZE", 20))
+
+# Offer letters rendered per background task when a batch of offers is
+# issued (apps.offers.tasks); chunks are spread over the reports workers
+OFFER_LETTER_CHUNK_SIZE = int(os.getenv("OFFER_LETTER_CHUNK_SIZE", 100))
+
 # --------------------------------------------------
 # Default primary key
 # --------------------------------------------------
@@ -160,12 +254,35 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "apps.users.authentication.StatelessJWTAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": (
         "rest_framework.permissions.IsAuthenticated",
     ),
-    "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema"
+    "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+    # Sliding-window throttles (apps.common.throttling), applied to views
+    # that set `throttle_scope`. They run before the view body, so a
+    # rejected request costs two cache reads: no DB lookup, no hashing.
+    "DEFAULT_THROTTLE_CLASSES": (
+        "apps.common.throttling.EndpointRateThrottle",
+        "apps.common.throttling.IPRateThrottle",
+        "apps.common.throttling.EmailRateThrottle",
+    ),
+    "DEFAULT_THROTTLE_RATES": {
+        # Password checks: per account, per client and overall
+        "login_email": os.getenv("THROTTLE_LOGIN_EMAIL", "5/min"),
+        "login_ip": os.getenv("THROTTLE_LOGIN_IP", "20/min"),
+        "login_endpoint": os.getenv("THROTTLE_LOGIN_ENDPOINT", "600/min"),
+        # OTP guesses (a 6 digit code, valid for two windows)
+        "otp_verify_email": os.getenv("THROTTLE_OTP_VERIFY_EMAIL", "5/min"),
+        "otp_verify_ip": os.getenv("THROTTLE_OTP_VERIFY_IP", "20/min"),
+        # OTP emails
+        "otp_send_email": os.getenv("THROTTLE_OTP_SEND_EMAIL", "3/min"),
+        "otp_send_ip": os.getenv("THROTTLE_OTP_SEND_IP", "10/min"),
+        # Sign-ups hash a password too
+        "register_ip": os.getenv("THROTTLE_REGISTER_IP", "20/hour"),
+        "register_endpoint": os.getenv("THROTTLE_REGISTER_ENDPOINT", "300/min"),
+    },
 }
 
 
@@ -210,18 +327,112 @@ DEFAULT_FROM_EMAIL = os.getenv(
     EMAIL_HOST_USER,
 )
 
+# Pooled delivery (apps.emails.services): messages per send_messages burst
+# and seconds before the long-lived SMTP connection is recycled
+EMAIL_BATCH_SIZE = int(os.getenv("EMAIL_BATCH_SIZE", 50))
+EMAIL_CONNECTION_MAX_AGE = int(os.getenv("EMAIL_CONNECTION_MAX_AGE", 300))
+
 # --------------------------------------------------
 # Celery
 # --------------------------------------------------
 
 CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL")
-CELERY_RESULT_BACKEND = "django-db"
 CELERY_ACCEPT_CONTENT = ["json"]
 CELERY_TASK_SERIALIZER = "json"
 
 CELERY_TIMEZONE = TIME_ZONE
 CELERY_ENABLE_UTC = True
-CELERY_RESULT_EXTENDED = True
+
+# Results. Most tasks are fire-and-forget, so none are stored unless a
+# task opts in with ignore_result=False. Stored results go to Redis when
+# available (or e.g. "cache+memory://"), keeping them off the API database;
+# "django-db" is still supported.
+CELERY_TASK_IGNORE_RESULT = os.getenv("CELERY_TASK_IGNORE_RESULT", "True") == "True"
+CELERY_RESULT_BACKEND = os.getenv("CELERY_RESULT_BACKEND", REDIS_URL or "django-db")
+CELERY_RESULT_EXTENDED = os.getenv("CELERY_RESULT_EXTENDED", "False") == "True"
+# Redis expires stored results itself. django_celery_results rows are
+# pruned by prune_task_results_task whichever backend is active, since
+# celery.backend_cleanup only cleans the active one.
+CELERY_RESULT_EXPIRES = timedelta(hours=int(os.getenv("CELERY_RESULT_EXPIRES_HOURS", 24)))
+
+# Rows deleted per statement when pruning django_celery_results
+TASK_RESULT_PRUNE_BATCH_SIZE = int(os.getenv("TASK_RESULT_PRUNE_BATCH_SIZE", 5000))
+
+# Queue topology. Run a dedicated worker per queue so a flood on one can
+# never delay another, e.g.:
+#   celery -A ats worker -Q otp,outbox -c 4
+#   celery -A ats worker -Q email,default -c 4
+#   celery -A ats worker -Q reports -c 2
+# OTP codes expire after OTP_INTERVAL (5 min), so `otp` must never wait
+# behind bulk invite mail. Every task, OTP mail included, reaches its
+# queue through the outbox relay, so the relay gets a queue of its own,
+# served next to `otp` rather than behind `email`.
+CELERY_TASK_DEFAULT_QUEUE = "default"
+CELERY_TASK_QUEUES = (
+    Queue("otp"),       # time-critical, small
+    Queue("outbox"),    # the outbox relay, which feeds every other queue
+    Queue("email"),     # bulk transactional mail (invites)
+    Queue("reports"),   # slow, long-running jobs (reports, offer letters)
+    Queue("default"),   # everything else (housekeeping)
+)
+CELERY_TASK_ROUTES = {
+    "apps.common.tasks.relay_outbox_task": {"queue": "outbox"},
+    "apps.otp.tasks.*": {"queue": "otp"},
+    "apps.companies.tasks.*": {"queue": "email"},
+    "apps.*.reports.*": {"queue": "reports"},
+    "apps.offers.tasks.*": {"queue": "reports"},
+}
+CELERY_TASK_ANNOTATIONS = {
+    # Per worker rate limits, keep the SMTP relay under its send quota
+    "apps.companies.tasks.send_invite_email_task": {
+        "rate_limit": os.getenv("INVITE_EMAIL_RATE_LIMIT", "20/s"),
+    },
+    "apps.companies.tasks.send_bulk_invite_email_task": {
+        "rate_limit": os.getenv("BULK_INVITE_EMAIL_RATE_LIMIT", "1/s"),
+    },
+}
+
+# Workers take one message at a time so a long task never holds a
+# prefetched OTP hostage. Messages are acked after the task finishes and
+# redelivered if the worker dies mid-task.
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1
+CELERY_TASK_ACKS_LATE = True
+CELERY_TASK_REJECT_ON_WORKER_LOST = True
+
+CELERY_BEAT_SCHEDULE = {
+    "relay-outbox": {
+        "task": "apps.common.tasks.relay_outbox_task",
+        "schedule": float(os.getenv("OUTBOX_RELAY_INTERVAL", 1)),
+    },
+    "prune-outbox": {
+        "task": "apps.common.tasks.prune_outbox_task",
+        "schedule": 60 * 60,
+    },
+    "prune-task-results": {
+        "task": "apps.common.tasks.prune_task_results_task",
+        "schedule": 60 * 60,
+    },
+}
+
+# Transactional outbox (apps.common.outbox)
+OUTBOX_BATCH_SIZE = int(os.getenv("OUTBOX_BATCH_SIZE", 100))
+OUTBOX_MAX_ATTEMPTS = int(os.getenv("OUTBOX_MAX_ATTEMPTS", 10))
+OUTBOX_RETENTION_HOURS = int(os.getenv("OUTBOX_RETENTION_HOURS", 72))
+
+# Per-process metrics (apps.common.metrics): send latency, OTP dedupe,
+# hash cost... logged as one JSON line at most every N seconds; 0 disables
+METRICS_LOG_INTERVAL = int(os.getenv("METRICS_LOG_INTERVAL", 60))
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {"class": "logging.StreamHandler"},
+    },
+    "loggers": {
+        "apps.common.metrics": {"handlers": ["console"], "level": "INFO", "propagate": False},
+    },
+}
 
 
 # SPECTACULAR_SETTINGS = {
@@ -11,6 +11,10 @@ urlpatterns = [
     path("api/users/", include(("apps.users.urls", "users"), namespace="users")),
     path("api/companies/", include("apps.companies.api.urls")),
     path('api/', include('apps.jobs.api.urls')), 
+    path("api/applications/", include("apps.applications.api.urls")),
+    path("api/pipelines/", include("apps.pipelines.api.urls")),
+    path("api/interviews/", include("apps.interviews.api.urls")),
+    path("api/offers/", include("apps.offers.api.urls")),
 
 
 